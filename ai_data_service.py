@@ -1,16 +1,52 @@
-import json
+import copy
 import random
 import re
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
+import cache_keys
+from data_cache import (DEFAULT_METHOD_TTLS, DEFAULT_STALE_TTL, DEFAULT_TTL, DataCacheBackend, SingleFlight,
+                        get_shared_data_cache)
 from groq_service import GroqLLM
+from job_identity import dedupe_jobs, job_id
+from market_snapshot import MarketSnapshot, get_shared_market_snapshot
+from rate_limiter import PRIORITY_DEFAULT
+
+# Jobs per LLM call; large limits are split into chunks generated in parallel.
+JOB_CHUNK_SIZE = 5
+JOB_CHUNK_WORKERS = 4
+# Rough token cost of a chunk for the rate limiter: its prompt plus the output budget per job.
+JOB_PROMPT_TOKENS = 750
+JOB_TOKENS = 350
+# Each chunk is steered to a different slice of the market so chunks don't repeat each other.
+JOB_DIVERSITY_SEEDS = [
+    "well-known large enterprises",
+    "fast-growing startups",
+    "mid-size product companies",
+    "remote-first and distributed teams",
+    "finance, healthcare and other non-tech industries hiring for these skills",
+    "consultancies, agencies and contract-heavy employers",
+    "infrastructure, platform and developer-tools companies",
+    "public sector, education and non-profit employers",
+]
+
+
+def _job_chunk_max_tokens(size: int) -> int:
+    return min(8000, JOB_TOKENS * size + 200)
+
+
+def _job_chunk_tokens(size: int) -> int:
+    return JOB_PROMPT_TOKENS + _job_chunk_max_tokens(size)
+
 
 class AIDataService:
     """AI-powered dynamic data generation service to replace hardcoded fallbacks"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, cache: Optional[DataCacheBackend] = None,
+                 ttls: Optional[Dict[str, float]] = None, stale_ttl: Optional[float] = None,
+                 snapshot: Optional[MarketSnapshot] = None):
         load_dotenv()
         if api_key is None:
             api_key = os.getenv("GROQ_API_KEY")
@@ -19,26 +55,110 @@ class AIDataService:
             raise ValueError("GROQ_API_KEY is required for AIDataService")
         
         self.groq_service = GroqLLM(api_key)
-        self.cache = {}
-        self.cache_duration = 3600  # 1 hour cache
+        self.cache = cache if cache is not None else get_shared_data_cache()
+        self.ttls = dict(DEFAULT_METHOD_TTLS, **(ttls or {}))
+        self.stale_ttl = DEFAULT_STALE_TTL if stale_ttl is None else stale_ttl
+        self.snapshot = snapshot if snapshot is not None else get_shared_market_snapshot()
+        self._flights = SingleFlight()
+        self._key_stats = cache_keys.KeyHitStats()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ai-data-refresh")
         
     def generate_dynamic_jobs(self, keywords: str, location: str = "", 
                             experience_level: str = "", job_type: str = "Full-time", 
                             limit: int = 20) -> List[Dict]:
         """Generate dynamic, AI-powered job listings"""
-        cache_key = f"jobs_{keywords}_{location}_{experience_level}_{job_type}_{limit}"
-        
-        # Check cache first
-        if self._is_cache_valid(cache_key):
-            return self.cache[cache_key]['data']
+        raw_key = f"jobs_{keywords}_{location}_{experience_level}_{job_type}_{limit}"
+        cache_key = cache_keys.jobs_key(keywords, location, experience_level, job_type)
         
         try:
-            prompt = f"""
+            # Entries remember how many jobs were asked for, so a larger batch also serves smaller limits.
+            entry = self._cached_generate(
+                cache_key,
+                lambda: self._generate_job_batch(keywords, location, experience_level, job_type, limit),
+                valid=lambda value: bool(value["jobs"]),
+                usable=lambda value: value.get("requested", 0) >= limit,
+                raw_key=raw_key,
+                # A stale refresh regenerates as many jobs as the entry holds, not just this caller's limit.
+                regenerate=lambda stale: self._generate_job_batch(
+                    keywords, location, experience_level, job_type, max(limit, stale.get("requested", 0))
+                )
+            )
+            jobs = (entry.get("jobs") or [])[:limit]
+            
+            if jobs:
+                return jobs
+            else:
+                return self._generate_minimal_fallback_jobs(keywords, location, limit)
+                
+        except Exception as e:
+            print(f"Error generating AI jobs: {e}")
+            return self._generate_minimal_fallback_jobs(keywords, location, limit)
+    
+    def _generate_job_batch(self, keywords: str, location: str, experience_level: str, job_type: str,
+                            limit: int) -> Dict[str, Any]:
+        """Generate limit jobs as parallel chunks with different focuses, merged and deduplicated.
+        
+        A failed chunk only loses its own jobs. The batch then records how many jobs it
+        actually holds as "requested", so a later call for the full limit retries.
+        Each batch runs its chunks on its own small pool, so concurrent batches never queue
+        behind each other; the rate limiter is what they share.
+        """
+        sizes, workers, max_wait = self._plan_job_chunks(limit)
+        jobs, failed = [], 0
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ai-data-jobs") as executor:
+            futures = [
+                executor.submit(self._generate_job_chunk, keywords, location, experience_level, job_type,
+                                size, JOB_DIVERSITY_SEEDS[index % len(JOB_DIVERSITY_SEEDS)], max_wait)
+                for index, size in enumerate(sizes)
+            ]
+            for future in futures:
+                try:
+                    chunk = future.result()
+                except Exception as e:
+                    print(f"Job generation chunk failed: {e}")
+                    chunk = None
+                if chunk:
+                    jobs.extend(job for job in chunk if isinstance(job, dict))
+                else:
+                    failed += 1
+        
+        jobs = dedupe_jobs(jobs)[:limit]
+        for job in jobs:
+            # Chunks number their jobs independently, so model-supplied ids collide.
+            job["id"] = job_id("ai", job)
+        if failed:
+            print(f"{failed} of {len(sizes)} job generation chunks failed; returning {len(jobs)} jobs")
+        return {"requested": len(jobs) if failed else limit, "jobs": jobs}
+    
+    def _plan_job_chunks(self, limit: int) -> Tuple[List[int], int, float]:
+        """Chunk sizes, how many chunks run at once, and how long each may wait for the rate limiter.
+        
+        Chunks stay at JOB_CHUNK_SIZE while the token bucket admits several of them together.
+        When it cannot, parallel chunks would only queue and be shed, so each chunk grows to
+        the largest reservation the scheduler admits and they run one at a time. A chunk may
+        wait as long as the bucket takes to refill for the chunks running alongside it.
+        """
+        scheduler = self.groq_service.scheduler
+        model = self.groq_service.router.models_for("generate_dynamic_jobs")[0]
+        admissible = scheduler.admissible_tokens(model)
+        size = JOB_CHUNK_SIZE
+        if admissible < 2 * _job_chunk_tokens(size):
+            size = max(1, int((admissible - JOB_PROMPT_TOKENS - 200) // JOB_TOKENS))
+        sizes = [min(size, limit - start) for start in range(0, limit, size)]
+        workers = max(1, min(JOB_CHUNK_WORKERS, len(sizes), int(admissible // _job_chunk_tokens(size))))
+        rate = scheduler.tokens_per_second(model) or scheduler.tokens_per_minute / 60
+        max_wait = scheduler.max_wait[PRIORITY_DEFAULT] + workers * _job_chunk_tokens(size) / rate
+        return sizes, workers, max_wait
+    
+    def _generate_job_chunk(self, keywords: str, location: str, experience_level: str, job_type: str,
+                            limit: int, focus: str, max_wait: Optional[float] = None) -> Optional[List[Dict]]:
+        prompt = f"""
             Generate {limit} realistic, current job opportunities in JSON format based on these criteria:
             - Keywords: {keywords}
             - Location: {location or 'various locations including remote'}
             - Experience Level: {experience_level or 'various levels'}
             - Job Type: {job_type}
+            - Focus: {focus}
             
             Create diverse, realistic job postings that reflect current market trends. Each job should include:
             
@@ -82,30 +202,14 @@ class AIDataService:
                 }}
             ]
             """
-            
-            response = self.groq_service.chat_completion(prompt)
-            jobs = self._parse_ai_response(response)
-            
-            if jobs:
-                # Cache the result
-                self.cache[cache_key] = {
-                    'data': jobs,
-                    'timestamp': datetime.now().timestamp()
-                }
-                return jobs
-            else:
-                return self._generate_minimal_fallback_jobs(keywords, location, limit)
-                
-        except Exception as e:
-            print(f"Error generating AI jobs: {e}")
-            return self._generate_minimal_fallback_jobs(keywords, location, limit)
+        
+        return self._generate_json(prompt, "generate_dynamic_jobs", max_tokens=_job_chunk_max_tokens(limit),
+                                   max_wait=max_wait)
     
     def generate_dynamic_salary_insights(self, job_title: str, location: str = "") -> Dict:
         """Generate AI-powered salary insights"""
-        cache_key = f"salary_{job_title}_{location}"
-        
-        if self._is_cache_valid(cache_key):
-            return self.cache[cache_key]['data']
+        raw_key = f"salary_{job_title}_{location}"
+        cache_key = cache_keys.salary_key(job_title, location)
         
         try:
             prompt = f"""
@@ -144,14 +248,13 @@ class AIDataService:
             }}
             """
             
-            response = self.groq_service.chat_completion(prompt)
-            salary_data = self._parse_ai_response(response, expect_list=False)
+            salary_data = self._cached_generate(
+                cache_key,
+                lambda: self._generate_json(prompt, "generate_dynamic_salary_insights", expect_list=False),
+                raw_key=raw_key
+            )
             
             if salary_data:
-                self.cache[cache_key] = {
-                    'data': salary_data,
-                    'timestamp': datetime.now().timestamp()
-                }
                 return salary_data
             else:
                 return self._generate_fallback_salary_data(job_title, location)
@@ -162,10 +265,8 @@ class AIDataService:
     
     def generate_trending_skills(self, industry: str = "", keywords: str = "") -> List[str]:
         """Generate AI-powered trending skills"""
-        cache_key = f"skills_{industry}_{keywords}"
-        
-        if self._is_cache_valid(cache_key):
-            return self.cache[cache_key]['data']
+        raw_key = f"skills_{industry}_{keywords}"
+        cache_key = cache_keys.skills_key(industry, keywords)
         
         try:
             prompt = f"""
@@ -183,14 +284,14 @@ class AIDataService:
             ["skill1", "skill2", "skill3", ...]
             """
             
-            response = self.groq_service.chat_completion(prompt)
-            skills = self._parse_ai_response(response)
+            skills = self._cached_generate(
+                cache_key,
+                lambda: self._generate_json(prompt, "generate_trending_skills", max_tokens=500),
+                valid=lambda value: isinstance(value, list),
+                raw_key=raw_key
+            )
             
             if skills and isinstance(skills, list):
-                self.cache[cache_key] = {
-                    'data': skills,
-                    'timestamp': datetime.now().timestamp()
-                }
                 return skills[:15]
             else:
                 return self._get_fallback_skills(keywords)
@@ -201,10 +302,8 @@ class AIDataService:
     
     def generate_company_insights(self, company_name: str) -> Dict:
         """Generate AI-powered company insights"""
-        cache_key = f"company_{company_name}"
-        
-        if self._is_cache_valid(cache_key):
-            return self.cache[cache_key]['data']
+        raw_key = f"company_{company_name}"
+        cache_key = cache_keys.company_key(company_name)
         
         try:
             prompt = f"""
@@ -228,14 +327,13 @@ class AIDataService:
             }}
             """
             
-            response = self.groq_service.chat_completion(prompt)
-            company_data = self._parse_ai_response(response, expect_list=False)
+            company_data = self._cached_generate(
+                cache_key,
+                lambda: self._generate_json(prompt, "generate_company_insights", expect_list=False),
+                raw_key=raw_key
+            )
             
             if company_data:
-                self.cache[cache_key] = {
-                    'data': company_data,
-                    'timestamp': datetime.now().timestamp()
-                }
                 return company_data
             else:
                 return self._generate_fallback_company_data(company_name)
@@ -246,10 +344,8 @@ class AIDataService:
     
     def generate_market_trends(self, industry: str = "technology") -> Dict:
         """Generate AI-powered market trends and insights"""
-        cache_key = f"trends_{industry}"
-        
-        if self._is_cache_valid(cache_key):
-            return self.cache[cache_key]['data']
+        raw_key = f"trends_{industry}"
+        cache_key = cache_keys.trends_key(industry)
         
         try:
             prompt = f"""
@@ -273,14 +369,13 @@ class AIDataService:
             }}
             """
             
-            response = self.groq_service.chat_completion(prompt)
-            trends_data = self._parse_ai_response(response, expect_list=False)
+            trends_data = self._cached_generate(
+                cache_key,
+                lambda: self._generate_json(prompt, "generate_market_trends", expect_list=False),
+                raw_key=raw_key
+            )
             
             if trends_data:
-                self.cache[cache_key] = {
-                    'data': trends_data,
-                    'timestamp': datetime.now().timestamp()
-                }
                 return trends_data
             else:
                 return self._generate_fallback_trends()
@@ -289,43 +384,71 @@ class AIDataService:
             print(f"Error generating market trends: {e}")
             return self._generate_fallback_trends()
     
-    def _parse_ai_response(self, response: str, expect_list: bool = True) -> Any:
-        """Parse AI response and extract JSON"""
-        try:
-            # Clean the response
-            clean_response = response.strip()
-            if clean_response.startswith('```json'):
-                clean_response = clean_response[7:]
-            elif clean_response.startswith('```'):
-                clean_response = clean_response[3:]
-            
-            if clean_response.endswith('```'):
-                clean_response = clean_response[:-3]
-            
-            clean_response = clean_response.strip()
-            
-            # Parse JSON
-            data = json.loads(clean_response)
-            
-            # Validate structure
-            if expect_list and not isinstance(data, list):
-                return None
-            elif not expect_list and not isinstance(data, dict):
-                return None
-                
-            return data
-            
-        except (json.JSONDecodeError, KeyError) as e:
-            print(f"Error parsing AI response: {e}")
-            return None
+    def _generate_json(self, prompt: str, feature: str, expect_list: bool = True, max_tokens: int = 1500,
+                       max_wait: Optional[float] = None) -> Any:
+        """Request JSON for a generator, continuing or repairing truncated output and checking its schema"""
+        messages = [
+            {"role": "system", "content": "You are a job market data assistant. Return only valid JSON."},
+            {"role": "user", "content": prompt}
+        ]
+        return self.groq_service.request_json(messages, expect=list if expect_list else dict,
+                                              max_tokens=max_tokens, temperature=0.7, feature=feature,
+                                              max_wait=max_wait)
     
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cache entry is still valid"""
-        if cache_key not in self.cache:
-            return False
+    def _cached_generate(self, cache_key: str, generate: Callable[[], Any],
+                         valid: Callable[[Any], bool] = bool,
+                         usable: Optional[Callable[[Any], bool]] = None,
+                         raw_key: Optional[str] = None,
+                         regenerate: Optional[Callable[[Any], Any]] = None) -> Any:
+        """Serve cache_key from the cache, generating at most once per key at a time.
+        
+        A stale entry is returned immediately while one background call refreshes it;
+        on a miss, the pre-built market snapshot is tried before the LLM, and concurrent
+        callers for the same key wait for a single generation.
+        `usable` rejects cached or shared values that cannot answer this call (too few jobs).
+        `raw_key` is the pre-canonicalization key, tracked only to report the hit-rate gain.
+        `regenerate`, given the stale value, replaces `generate` for the background refresh.
+        """
+        raw_key, raw_ttl = raw_key or cache_key, self._ttl(cache_key) + self.stale_ttl
+        entry = self.cache.lookup(cache_key) if self.cache is not None else None
+        if entry is not None and (usable is None or usable(entry[0])):
+            value, fresh = entry
+            if not fresh and not self._flights.in_flight(cache_key):
+                refresh = generate if regenerate is None else (lambda: regenerate(value))
+                self._refresh_executor.submit(self._refresh, cache_key, refresh, valid)
+            self._key_stats.record(raw_key, True, raw_ttl)
+            return value
         
-        cache_time = self.cache[cache_key]['timestamp']
-        return (datetime.now().timestamp() - cache_time) < self.cache_duration
+        value = self.snapshot.get(cache_key) if self.snapshot is not None else None
+        if value is not None and valid(value) and (usable is None or usable(value)):
+            # Seed the cache so the normal TTL and stale refresh take over from here.
+            if self.cache is not None:
+                self.cache.set(cache_key, value, self._ttl(cache_key), self.stale_ttl)
+            self._key_stats.record(raw_key, True, raw_ttl)
+            return copy.deepcopy(value)
+        
+        self._key_stats.record(raw_key, False, raw_ttl)
+        value, shared = self._flights.do(cache_key, lambda: self._generate_and_store(cache_key, generate, valid))
+        if shared and usable is not None and not usable(value):
+            value, shared = self._generate_and_store(cache_key, generate, valid), False
+        # Waiters get their own copy; callers tag the jobs they receive.
+        return copy.deepcopy(value) if shared else value
+    
+    def _ttl(self, cache_key: str) -> float:
+        # The key's prefix names the generator whose TTL applies.
+        return self.ttls.get(cache_key.split('_', 1)[0], DEFAULT_TTL)
+    
+    def _generate_and_store(self, cache_key: str, generate: Callable[[], Any], valid: Callable[[Any], bool]) -> Any:
+        value = generate()
+        if self.cache is not None and valid(value):
+            self.cache.set(cache_key, value, self._ttl(cache_key), self.stale_ttl)
+        return value
+    
+    def _refresh(self, cache_key: str, generate: Callable[[], Any], valid: Callable[[Any], bool]):
+        try:
+            self._flights.do(cache_key, lambda: self._generate_and_store(cache_key, generate, valid))
+        except Exception as e:
+            print(f"Background refresh of {cache_key} failed: {e}")
     
     def _generate_minimal_fallback_jobs(self, keywords: str, location: str, limit: int) -> List[Dict]:
         """Minimal fallback when AI fails completely"""
@@ -455,15 +578,35 @@ class AIDataService:
     
     def clear_cache(self):
         """Clear the entire cache"""
-        self.cache = {}
+        if self.cache is not None:
+            self.cache.clear()
     
-    def clear_expired_cache(self):
-        """Clear only expired cache entries"""
-        current_time = datetime.now().timestamp()
-        expired_keys = [
-            key for key, value in self.cache.items()
-            if (current_time - value['timestamp']) > self.cache_duration
-        ]
-        
-        for key in expired_keys:
-            del self.cache[key]
+    def clear_expired_cache(self) -> int:
+        """Drop expired entries now; backends also expire them on access"""
+        return self.cache.purge_expired() if self.cache is not None else 0
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        stats = self.cache.stats() if self.cache is not None else {}
+        stats["single_flight"] = self._flights.stats()
+        stats["keys"] = self._key_stats.stats()
+        if self.snapshot is not None:
+            stats["snapshot"] = self.snapshot.stats()
+        return stats
+
+
+_SERVICES: Dict[str, AIDataService] = {}
+_SERVICES_LOCK = threading.Lock()
+
+
+def get_shared_ai_data_service(api_key: Optional[str] = None) -> AIDataService:
+    """One AIDataService (and so one cache and one Groq client) per API key, shared by every caller"""
+    load_dotenv()
+    api_key = api_key or os.getenv("GROQ_API_KEY")
+    if not api_key:
+        raise ValueError("GROQ_API_KEY is required for AIDataService")
+    with _SERVICES_LOCK:
+        service = _SERVICES.get(api_key)
+        if service is None:
+            service = AIDataService(api_key)
+            _SERVICES[api_key] = service
+        return service
@@ -0,0 +1,83 @@
+"""Compare full-page html.parser parsing with the strained job-card parser.
+
+Usage: python benchmarks/job_card_parsing.py [iterations]
+
+Runs against the saved search pages in benchmarks/fixtures and checks that both
+paths extract the same fields before timing them.
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from job_scraper import HTML_PARSER, extract_card_fields, parse_job_cards
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def text_of(element):
+    return element.get_text(strip=True) if element else None
+
+
+def legacy_indeed(html):
+    # The previous path: whole-page html.parser tree, then card.find chains.
+    soup = BeautifulSoup(html, 'html.parser')
+    rows = []
+    for card in soup.find_all('div', class_='job_seen_beacon') or soup.find_all('a', {'data-jk': True}):
+        title_elem = card.find('span', {'title': True}) or card.find('h2', class_='jobTitle')
+        link_elem = card.find('a', href=True)
+        rows.append({
+            'title': title_elem.get('title') if title_elem else None,
+            'company': text_of(card.find('span', class_='companyName') or card.find('a', {'data-testid': 'company-name'})),
+            'location': text_of(card.find('div', {'data-testid': 'job-location'}) or card.find('div', class_='companyLocation')),
+            'link': link_elem['href'] if link_elem else None,
+            'salary': text_of(card.find('span', class_='salary-snippet') or card.find('span', {'data-testid': 'attribute_snippet_testid'})),
+            'description': text_of(card.find('div', class_='job-snippet') or card.find('ul', class_='jobsearch-jobDescriptionText')),
+            'posted': text_of(card.find('span', class_='date') or card.find('span', {'data-testid': 'myJobsStateDate'}))
+        })
+    return rows
+
+
+def legacy_glassdoor(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    rows = []
+    for card in soup.find_all('li', class_='react-job-listing') or soup.find_all('article', class_='jobContainer'):
+        title_elem = card.find('a', class_='jobTitle') or card.find('a', {'data-test': 'job-title'})
+        link_elem = title_elem if title_elem else card.find('a', href=True)
+        rows.append({
+            'title': text_of(title_elem),
+            'company': text_of(card.find('span', class_='employerName') or card.find('div', class_='jobHeader')),
+            'location': text_of(card.find('span', class_='loc') or card.find('div', class_='jobLocation')),
+            'salary': text_of(card.find('span', class_='salaryText') or card.find('div', class_='jobSalary')),
+            'link': link_elem.get('href') if link_elem else None
+        })
+    return rows
+
+
+def strained(source, html):
+    return [extract_card_fields(source, card) for card in parse_job_cards(source, html)]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"HTML parser for strained path: {HTML_PARSER}")
+    for source, legacy in (('indeed', legacy_indeed), ('glassdoor', legacy_glassdoor)):
+        with open(os.path.join(FIXTURES, f"{source}_search.html"), "rb") as f:
+            html = f.read()
+
+        expected, actual = legacy(html), strained(source, html)
+        if expected != actual:
+            raise SystemExit(f"{source}: strained parser disagrees with the legacy parser")
+
+        legacy_ms = timeit.timeit(lambda: legacy(html), number=iterations) / iterations * 1000
+        strained_ms = timeit.timeit(lambda: strained(source, html), number=iterations) / iterations * 1000
+        print(f"{source:<10} {len(html) / 1024:6.0f} KiB  {len(actual):3d} cards  "
+              f"legacy {legacy_ms:7.2f} ms  strained {strained_ms:7.2f} ms  "
+              f"speedup {legacy_ms / strained_ms:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
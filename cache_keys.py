@@ -0,0 +1,127 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from job_identity import normalize_company, normalize_text
+
+LOCATION_ALIASES = {
+    "nyc": "New York, NY", "new york": "New York, NY", "new york city": "New York, NY",
+    "new york ny": "New York, NY", "manhattan": "New York, NY",
+    "sf": "San Francisco, CA", "san francisco": "San Francisco, CA", "san francisco ca": "San Francisco, CA",
+    "bay area": "San Francisco, CA", "sf bay area": "San Francisco, CA",
+    "la": "Los Angeles, CA", "los angeles": "Los Angeles, CA", "los angeles ca": "Los Angeles, CA",
+    "seattle": "Seattle, WA", "seattle wa": "Seattle, WA",
+    "austin": "Austin, TX", "austin tx": "Austin, TX",
+    "boston": "Boston, MA", "boston ma": "Boston, MA",
+    "chicago": "Chicago, IL", "chicago il": "Chicago, IL",
+    "dc": "Washington, DC", "washington dc": "Washington, DC",
+    "remote": "Remote", "anywhere": "Remote", "wfh": "Remote", "work from home": "Remote",
+    "remote us": "Remote", "us remote": "Remote",
+}
+
+# First matching word wins, so "Senior Level (6-10 years)" and "senior" share an entry.
+_EXPERIENCE_WORDS = (
+    ("entry", "entry"), ("junior", "entry"), ("intern", "entry"), ("graduate", "entry"),
+    ("mid", "mid"), ("intermediate", "mid"),
+    ("senior", "senior"), ("lead", "senior"), ("principal", "senior"), ("staff", "senior"),
+    ("executive", "executive"), ("director", "executive"), ("vp", "executive"), ("chief", "executive"),
+)
+_JOB_TYPE_WORDS = (("full", "full-time"), ("part", "part-time"), ("contract", "contract"),
+                   ("freelance", "contract"), ("intern", "internship"), ("remote", "remote"))
+
+
+def canonical_terms(text: Any) -> str:
+    """Lowercased, de-duplicated tokens in sorted order: word order and spacing do not matter."""
+    return " ".join(sorted(set(normalize_text(text).split())))
+
+
+def canonical_location(location: Any) -> str:
+    normalized = normalize_text(location)
+    return LOCATION_ALIASES.get(normalized, normalized).lower()
+
+
+def canonical_experience(level: Any) -> str:
+    words = normalize_text(level).replace("-", " ").split()
+    for word, canonical in _EXPERIENCE_WORDS:
+        if word in words or any(w.startswith(word) for w in words if len(word) > 3):
+            return canonical
+    return ""
+
+
+def canonical_job_type(job_type: Any) -> str:
+    text = normalize_text(job_type)
+    for word, canonical in _JOB_TYPE_WORDS:
+        if re.search(rf"\b{word}", text):
+            return canonical
+    return text
+
+
+def jobs_key(keywords: str, location: str, experience_level: str, job_type: str) -> str:
+    # No limit: one entry serves every request for as many jobs as were generated or fewer.
+    return "jobs_" + "|".join((canonical_terms(keywords), canonical_location(location),
+                               canonical_experience(experience_level), canonical_job_type(job_type)))
+
+
+def salary_key(job_title: str, location: str) -> str:
+    return f"salary_{canonical_terms(job_title)}|{canonical_location(location)}"
+
+
+def skills_key(industry: str, keywords: str) -> str:
+    return f"skills_{canonical_terms(industry)}|{canonical_terms(keywords)}"
+
+
+def company_key(company_name: str) -> str:
+    return f"company_{normalize_company(company_name)}"
+
+
+def trends_key(industry: str) -> str:
+    return f"trends_{canonical_terms(industry)}"
+
+
+class KeyHitStats:
+    """Compares the hit rate of canonical keys with what the raw parameter strings would have got.
+
+    Raw keys are tracked in a bounded shadow table that mirrors when each would have been
+    cached and for how long; nothing is stored under them.
+    """
+
+    def __init__(self, max_shadow_keys: int = 4096):
+        self.max_shadow_keys = max_shadow_keys
+        self._lock = threading.Lock()
+        self._raw: "OrderedDict[str, float]" = OrderedDict()
+        self._counters = {"requests": 0, "canonical_hits": 0, "raw_hits": 0}
+
+    def record(self, raw_key: str, hit: bool, ttl: float):
+        """Count one request under both schemes.
+
+        A raw-key miss stores the raw key for `ttl` whatever the canonical outcome, as a
+        raw-keyed cache would have generated and stored it on that miss.
+        """
+        now = time.time()
+        with self._lock:
+            expires_at = self._raw.get(raw_key)
+            raw_hit = expires_at is not None and expires_at >= now
+            self._counters["requests"] += 1
+            self._counters["canonical_hits"] += 1 if hit else 0
+            self._counters["raw_hits"] += 1 if raw_hit else 0
+            if not raw_hit:
+                self._raw[raw_key] = now + ttl
+            self._raw.move_to_end(raw_key)
+            while len(self._raw) > self.max_shadow_keys:
+                self._raw.popitem(last=False)
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        with self._lock:
+            counters = dict(self._counters)
+        requests = counters["requests"]
+        canonical = round(counters["canonical_hits"] / requests, 3) if requests else None
+        raw = round(counters["raw_hits"] / requests, 3) if requests else None
+        counters.update({
+            "canonical_hit_rate": canonical,
+            "raw_key_hit_rate": raw,
+            "hit_rate_gain": (round((counters["canonical_hits"] - counters["raw_hits"]) / requests, 3)
+                              if requests else None)
+        })
+        return counters
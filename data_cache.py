@@ -0,0 +1,338 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Seconds each AIDataService generator's results stay valid.
+DEFAULT_METHOD_TTLS = {
+    "jobs": 3600,
+    "salary": 24 * 3600,
+    "skills": 24 * 3600,
+    "company": 7 * 24 * 3600,
+    "trends": 24 * 3600,
+}
+DEFAULT_TTL = 3600
+# How long past its TTL an entry may still be served while a fresh one is generated.
+DEFAULT_STALE_TTL = 24 * 3600
+
+
+class DataCacheBackend:
+    """Key/value store for generated data. Values round-trip through JSON, so callers get their own copy.
+
+    Entries are fresh for `ttl` seconds and then stale for another `stale_ttl`; lookup()
+    returns stale values too, flagged, so callers can serve them while they regenerate.
+    """
+
+    def __init__(self):
+        self._counter_lock = threading.Lock()
+        self._counters = {"hits": 0, "stale_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def _count(self, name: str, value: int = 1):
+        with self._counter_lock:
+            self._counters[name] += value
+
+    def _counted(self, entry: Optional[Tuple[Any, bool]]) -> Optional[Tuple[Any, bool]]:
+        self._count("misses" if entry is None else "hits" if entry[1] else "stale_hits")
+        return entry
+
+    def lookup(self, key: str) -> Optional[Tuple[Any, bool]]:
+        """(value, is_fresh) for a fresh or stale entry, None when there is nothing to serve."""
+        raise NotImplementedError
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.lookup(key)
+        return entry[0] if entry is not None and entry[1] else None
+
+    def set(self, key: str, value: Any, ttl: float, stale_ttl: float = 0):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def purge_expired(self) -> int:
+        return 0
+
+    def entries(self) -> Optional[int]:
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._counter_lock:
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["stale_hits"] + counters["misses"]
+        counters.update({
+            "backend": type(self).__name__,
+            "entries": self.entries(),
+            "hit_rate": round(counters["hits"] / lookups, 3) if lookups else None
+        })
+        return counters
+
+
+class MemoryLRUCache(DataCacheBackend):
+    """In-process LRU with a size cap; expired entries are dropped when touched or evicted."""
+
+    def __init__(self, max_entries: int = 512):
+        super().__init__()
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def lookup(self, key: str) -> Optional[Tuple[Any, bool]]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] < now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        return self._counted(None if entry is None else (json.loads(entry[0]), entry[1] >= now))
+
+    def set(self, key: str, value: Any, ttl: float, stale_ttl: float = 0):
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        now = time.time()
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (payload, now + ttl, now + ttl + stale_ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        self._count("stores")
+        if evicted:
+            self._count("evictions", evicted)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (_, _, keep_until) in self._entries.items() if keep_until < now]
+            for key in expired:
+                del self._entries[key]
+        return len(expired)
+
+    def entries(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteDataCache(DataCacheBackend):
+    """On-disk cache shared by every process on the host."""
+
+    def __init__(self, path: str, max_entries: int = 5000):
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access)")
+        if "keep_until" not in {row[1] for row in self._conn.execute("PRAGMA table_info(entries)")}:
+            self._conn.execute("ALTER TABLE entries ADD COLUMN keep_until REAL")
+
+    def lookup(self, key: str) -> Optional[Tuple[Any, bool]]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at, COALESCE(keep_until, expires_at) FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[2] < now:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                row = None
+            if row is not None:
+                self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+        return self._counted(None if row is None else (json.loads(row[0]), row[1] >= now))
+
+    def set(self, key: str, value: Any, ttl: float, stale_ttl: float = 0):
+        now = time.time()
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires_at, keep_until, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, now + ttl, now + ttl + stale_ttl, now)
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            evicted = 0
+            if count > self.max_entries:
+                evicted = self._conn.execute(
+                    "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY last_access ASC LIMIT ?)",
+                    (count - self.max_entries,)
+                ).rowcount
+        self._count("stores")
+        if evicted:
+            self._count("evictions", evicted)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "DELETE FROM entries WHERE COALESCE(keep_until, expires_at) < ?", (time.time(),)
+            ).rowcount
+
+    def entries(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+class RedisDataCache(DataCacheBackend):
+    """Cache on any Redis-protocol server (Redis, Valkey, KeyDB, ...); the server expires keys itself.
+
+    Values are stored with their freshness deadline so stale entries can still be served.
+    """
+
+    def __init__(self, client=None, url: Optional[str] = None, prefix: str = "resumate:ai:"):
+        super().__init__()
+        if client is None:
+            if redis is None:
+                raise ImportError("the redis package is required for the Redis cache backend")
+            client = redis.Redis.from_url(url or "redis://localhost:6379/0")
+        self.client = client
+        self.prefix = prefix
+
+    def lookup(self, key: str) -> Optional[Tuple[Any, bool]]:
+        payload = self.client.get(self.prefix + key)
+        entry = json.loads(payload) if payload is not None else None
+        if not isinstance(entry, dict) or "fresh_until" not in entry:
+            return self._counted(None)
+        return self._counted((entry["value"], entry["fresh_until"] >= time.time()))
+
+    def set(self, key: str, value: Any, ttl: float, stale_ttl: float = 0):
+        payload = json.dumps({"value": value, "fresh_until": time.time() + ttl}, ensure_ascii=False, default=str)
+        self.client.set(self.prefix + key, payload, ex=max(1, int(ttl + stale_ttl)))
+        self._count("stores")
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; callers arriving meanwhile wait and share its outcome."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._counters = {"calls": 0, "coalesced": 0}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Return (result, shared); shared is True when the result came from another caller's call."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            self._counters["calls" if leader else "coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, True
+
+        try:
+            flight.value = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.value, False
+
+    def in_flight(self, key: str) -> bool:
+        with self._lock:
+            return key in self._flights
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters, in_flight=len(self._flights))
+
+
+_DATA_CACHE: Optional[DataCacheBackend] = None
+_DATA_CACHE_LOCK = threading.Lock()
+
+
+def default_data_cache_path() -> str:
+    path = os.getenv("AI_DATA_CACHE_PATH")
+    return os.path.expanduser(path) if path else os.path.join(
+        os.path.expanduser("~"), ".cache", "resumate", "ai_data_cache.sqlite3"
+    )
+
+
+def create_data_cache(backend: str) -> DataCacheBackend:
+    if backend == "memory":
+        return MemoryLRUCache(int(os.getenv("AI_DATA_CACHE_MAX_ENTRIES", "512")))
+    if backend == "sqlite":
+        return SQLiteDataCache(default_data_cache_path())
+    if backend == "redis":
+        return RedisDataCache(url=os.getenv("AI_DATA_CACHE_REDIS_URL") or os.getenv("REDIS_URL"))
+    raise ValueError(f"unknown AI data cache backend: {backend}")
+
+
+def get_shared_data_cache() -> Optional[DataCacheBackend]:
+    """Process-wide generated-data cache chosen by AI_DATA_CACHE_BACKEND (memory, sqlite or redis).
+
+    Returns None when AI_DATA_CACHE_DISABLED is set; a backend that cannot be opened falls
+    back to the in-memory LRU.
+    """
+    global _DATA_CACHE
+    if os.getenv("AI_DATA_CACHE_DISABLED", "").lower() in ("1", "true", "yes"):
+        return None
+    with _DATA_CACHE_LOCK:
+        if _DATA_CACHE is None:
+            backend = os.getenv("AI_DATA_CACHE_BACKEND", "sqlite").lower()
+            try:
+                _DATA_CACHE = create_data_cache(backend)
+            except (ImportError, ValueError, OSError, sqlite3.Error) as e:
+                print(f"Warning: AI data cache backend '{backend}' unavailable, using memory: {e}")
+                _DATA_CACHE = MemoryLRUCache()
+        return _DATA_CACHE
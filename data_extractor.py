@@ -8,8 +8,20 @@ from bs4 import BeautifulSoup
 import re
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
-from ai_data_service import AIDataService
+from ai_data_service import get_shared_ai_data_service
+from job_identity import dedupe_jobs
+from job_index import get_shared_job_index
+from posting_dates import DAY, ensure_posted_at
+from skill_matcher import PhraseMatcher, get_skill_matcher
+
+# Shared across JobSearcher instances, since Streamlit builds a new one on every rerun.
+_REFRESH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="job-refresh")
+_REFRESHING = set()
+_REFRESHING_LOCK = threading.Lock()
 
 class DataExtractor:
     def __init__(self):
@@ -95,17 +107,7 @@ def parse_resume_data(text: str) -> Dict:
                     data['name'] = line
                     break
         
-        skill_keywords = [
-            'Python', 'JavaScript', 'Java', 'C++', 'React', 'Node.js', 'SQL',
-            'Machine Learning', 'Data Analysis', 'Project Management', 'Leadership',
-            'Communication', 'Problem Solving', 'Teamwork', 'HTML', 'CSS', 'PHP',
-            'Ruby', 'Swift', 'Kotlin', 'Go', 'Rust', 'Docker', 'Kubernetes', 'AWS',
-            'Azure', 'GCP', 'MongoDB', 'PostgreSQL', 'Redis', 'Git', 'Linux'
-        ]
-        
-        for skill in skill_keywords:
-            if skill.lower() in text.lower():
-                data['skills'].append(skill)
+        data['skills'] = get_skill_matcher().skills(text)
         
         data['education'] = _extract_education_section(text)
         
@@ -324,6 +326,8 @@ class JobSearcher:
         self.job_scraper = None
         self.scraper_available = False
         self.job_cache = {} 
+        self._experience_matchers = {}
+        self.job_index = get_shared_job_index()
         self.ai_data_service = None
         try:
             import os
@@ -331,7 +335,7 @@ class JobSearcher:
             load_dotenv()
             api_key = os.getenv("GROQ_API_KEY")
             if api_key:
-                self.ai_data_service = AIDataService(api_key)
+                self.ai_data_service = get_shared_ai_data_service(api_key)
             else:
                 print("⚠️ No GROQ_API_KEY found for AI data service")
         except Exception as e:
@@ -353,25 +357,31 @@ class JobSearcher:
             self.scraper_available = False
     
     def search_jobs(self, keywords: str, location: str = "", experience_level: str = "", 
-                    company_size: str = "", remote: bool = False, job_type: str = "Full-time Jobs", limit: int = 20) -> List[Dict]:
+                    company_size: str = "", remote: bool = False, job_type: str = "Full-time Jobs", limit: int = 20,
+                    posted_within_days: Optional[int] = None) -> List[Dict]:
+        posted_within = posted_within_days * DAY if posted_within_days else None
         try:
+            if self.job_index:
+                self.job_index.record_search(keywords, location)
+            
+            # Serve from the local index when it has matches; re-scrape in the background only if stale.
+            indexed_jobs = self.job_index.search(keywords, location, limit, posted_within) if self.job_index else []
+            if indexed_jobs:
+                if self.job_index.is_stale(keywords, location):
+                    self._refresh_in_background(keywords, location, limit)
+                filtered_jobs = self._finish_jobs(indexed_jobs, keywords, location, experience_level, company_size, remote,
+                                                  posted_within)
+                if filtered_jobs:
+                    return filtered_jobs
+            
             if self.scraper_available and self.job_scraper:
                 print(f"🔍 Searching for latest {keywords} jobs...")
                 
-                jobs = self.job_scraper.aggregate_job_search(
-                    keywords=keywords,
-                    location=location,
-                    limit=limit
-                )
+                jobs = self._scrape_and_index(keywords, location, limit)
                 
                 if jobs:
-                    filtered_jobs = self._filter_jobs_by_criteria(jobs, experience_level, company_size, remote)
-                    
-                    for job in filtered_jobs:
-                        job = self._enhance_job_with_insights(job, keywords)
-                    
-                    cache_key = f"{keywords}_{location}_{experience_level}"
-                    self.job_cache[cache_key] = filtered_jobs
+                    filtered_jobs = self._finish_jobs(jobs, keywords, location, experience_level, company_size, remote,
+                                                      posted_within)
                     print(f"✅ Found {len(filtered_jobs)} latest job postings!")
                     return filtered_jobs
                     
@@ -380,25 +390,78 @@ class JobSearcher:
         
         return self._fallback_search(keywords, location, experience_level, job_type, limit)
     
+    def _finish_jobs(self, jobs: List[Dict], keywords: str, location: str, experience_level: str,
+                     company_size: str, remote: bool, posted_within: Optional[float] = None) -> List[Dict]:
+        filtered_jobs = self._filter_jobs_by_criteria(dedupe_jobs(jobs), experience_level, company_size, remote,
+                                                      posted_within)
+        
+        for job in filtered_jobs:
+            job = self._enhance_job_with_insights(job, keywords)
+        
+        cache_key = f"{keywords}_{location}_{experience_level}"
+        self.job_cache[cache_key] = filtered_jobs
+        return filtered_jobs
+    
+    def _scrape_and_index(self, keywords: str, location: str, limit: int) -> List[Dict]:
+        from job_scraper import is_fallback_job
+        
+        jobs = self.job_scraper.aggregate_job_search(
+            keywords=keywords,
+            location=location,
+            limit=limit
+        )
+        # Generated fallback listings are served but never indexed as if they had been scraped.
+        scraped = [job for job in jobs if not is_fallback_job(job)]
+        if self.job_index and scraped:
+            self.job_index.upsert(scraped)
+            self.job_index.mark_refreshed(keywords, location, len(scraped))
+        return jobs
+    
+    def _refresh_in_background(self, keywords: str, location: str, limit: int):
+        if not (self.scraper_available and self.job_scraper):
+            return
+        key = (keywords.lower().strip(), location.lower().strip())
+        with _REFRESHING_LOCK:
+            if key in _REFRESHING:
+                return
+            _REFRESHING.add(key)
+        
+        def refresh():
+            try:
+                self._scrape_and_index(keywords, location, limit)
+            except Exception as e:
+                print(f"Background job refresh failed for '{keywords}': {e}")
+            finally:
+                with _REFRESHING_LOCK:
+                    _REFRESHING.discard(key)
+        
+        _REFRESH_EXECUTOR.submit(refresh)
+    
     def _filter_jobs_by_criteria(self, jobs: List[Dict], experience_level: str, 
-                                company_size: str, remote: bool) -> List[Dict]:
+                                company_size: str, remote: bool,
+                                posted_within: Optional[float] = None) -> List[Dict]:
         filtered_jobs = []
+        posted_after = time.time() - posted_within if posted_within else None
+        experience_matcher = self._get_experience_matcher(experience_level) if experience_level else None
         
         for job in jobs:
             if remote and not job.get('remote_type'):
                 continue
             
+            if posted_after is not None and ensure_posted_at(job) < posted_after:
+                continue
+            
             if company_size and company_size != job.get('company_size', ''):
                 pass
             
-            if experience_level:
-                exp_keywords = self._get_experience_keywords(experience_level)
-                job_text = f"{job.get('description', '')} {job.get('title', '')}".lower()
-                
-                if exp_keywords and not any(keyword in job_text for keyword in exp_keywords):
-                    job['experience_match'] = False
-                else:
-                    job['experience_match'] = True
+            job_text = f"{job.get('title', '')} {job.get('description', '')}"
+            if not job.get('skills'):
+                job['skills'] = get_skill_matcher().skills(job_text, limit=6)
+            
+            if experience_matcher:
+                job['experience_match'] = bool(experience_matcher.find(job_text))
+            elif experience_level:
+                job['experience_match'] = True
             
             filtered_jobs.append(job)
         
@@ -414,6 +477,14 @@ class JobSearcher:
         
         return level_keywords.get(experience_level, [])
     
+    def _get_experience_matcher(self, experience_level: str) -> Optional[PhraseMatcher]:
+        if experience_level not in self._experience_matchers:
+            keywords = self._get_experience_keywords(experience_level)
+            self._experience_matchers[experience_level] = (
+                PhraseMatcher(dict.fromkeys(keywords, experience_level)) if keywords else None
+            )
+        return self._experience_matchers[experience_level]
+    
     def get_job_recommendations(self, user_skills: List[str], location: str = "") -> List[Dict]:
         try:
             if self.api_available and self.google_jobs_api:
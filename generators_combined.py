@@ -1093,7 +1093,8 @@ class ResumeGenerator:
                 {"role": "system", "content": f"You are an expert document cleaner. Remove only AI analysis and meta-commentary while preserving all actual {content_type} content."},
                 {"role": "user", "content": prompt}
             ]
-            cleaned = groq_service._make_request(messages, max_tokens=2000, temperature=0.2)
+            cleaned = groq_service._make_request(messages, max_tokens=2000, temperature=0.2,
+                                                 feature="_llm_clean_content")
             return cleaned if cleaned and not cleaned.startswith("❌") else content
         except Exception as e:
             print(f"Error in LLM content cleaning: {e}")
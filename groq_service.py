@@ -2,15 +2,133 @@ import requests
 import json
 import time
 import re
+import threading
+import logging
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from llm_cache import LLMResponseCache, get_shared_cache
+from llm_metrics import LLMMetrics, get_shared_metrics
+from model_router import ModelRouter
+from rate_limiter import (PRIORITY_BACKGROUND, PRIORITY_DEFAULT, PRIORITY_INTERACTIVE,
+                          RateLimitScheduler, get_shared_scheduler)
+from structured_output import (CONTINUE_PROMPT, SCHEMAS, STATS, IncrementalJSONParser, parse_json,
+                               prune_invalid_items, strip_code_fences, validate)
 try:
     from googlesearch import search
 except ImportError:
     print("Warning: googlesearch-python not installed. Search functionality will be limited.")
     search = None
+try:
+    import httpx
+except ImportError:
+    httpx = None
+try:
+    import asyncio
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# Metrics label for calls made without feature=; every GroqLLM method passes its own name.
+UNLABELED_FEATURE = "unlabeled"
+
+_TIMEOUT_ERRORS = (requests.exceptions.Timeout,) + ((httpx.TimeoutException,) if httpx else ())
+_NETWORK_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
+
+class PooledTransport:
+    """Long-lived keep-alive HTTP client shared by every GroqLLM in the process."""
+
+    def __init__(self, pool_size: int = 10, http2: bool = False):
+        self.pool_size = pool_size
+        self.http2 = bool(http2 and httpx)
+        self._lock = threading.Lock()
+        self._requests_sent = 0
+        self._adapter = None
+
+        if http2 and not httpx:
+            print("Warning: httpx[http2] not installed. Falling back to HTTP/1.1 keep-alive pool.")
+
+        if self.http2:
+            self.client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+            )
+        else:
+            self.client = requests.Session()
+            self._adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+            self.client.mount("https://", self._adapter)
+            self.client.mount("http://", self._adapter)
+            self.client.headers.update({"Connection": "keep-alive"})
+
+    def post(self, url: str, headers: Dict, json: Dict, timeout: float):
+        with self._lock:
+            self._requests_sent += 1
+        return self.client.post(url, headers=headers, json=json, timeout=timeout)
+
+    @contextmanager
+    def stream(self, url: str, headers: Dict, json: Dict, timeout: float):
+        """Open a streamed POST and yield (response, decoded line iterator)."""
+        with self._lock:
+            self._requests_sent += 1
+        if self.http2:
+            with self.client.stream("POST", url, headers=headers, json=json, timeout=timeout) as response:
+                yield response, response.iter_lines()
+        else:
+            response = self.client.post(url, headers=headers, json=json, timeout=timeout, stream=True)
+            try:
+                yield response, response.iter_lines(decode_unicode=True)
+            finally:
+                response.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            requests_sent = self._requests_sent
+
+        connections_opened = None
+        if self._adapter is not None:
+            pools = self._adapter.poolmanager.pools
+            connections_opened = sum(
+                getattr(pools[key], 'num_connections', 0) for key in pools.keys()
+            )
+
+        reused = requests_sent - connections_opened if connections_opened is not None else None
+        return {
+            "transport": "httpx-http2" if self.http2 else "requests-http1.1",
+            "pool_size": self.pool_size,
+            "requests_sent": requests_sent,
+            "connections_opened": connections_opened,
+            "connections_reused": reused,
+            "reuse_ratio": round(reused / requests_sent, 3) if reused is not None and requests_sent else None
+        }
+
+    def close(self):
+        self.client.close()
+
+
+_TRANSPORTS: Dict[tuple, PooledTransport] = {}
+_TRANSPORTS_LOCK = threading.Lock()
+
+
+def get_shared_transport(pool_size: int = 10, http2: bool = False) -> PooledTransport:
+    key = (pool_size, bool(http2 and httpx))
+    with _TRANSPORTS_LOCK:
+        transport = _TRANSPORTS.get(key)
+        if transport is None:
+            transport = PooledTransport(pool_size=pool_size, http2=http2)
+            _TRANSPORTS[key] = transport
+        return transport
 
 class GroqLLM:
-    def __init__(self, api_key: str, model: str = "llama-3.1-8b-instant"):
+    def __init__(self, api_key: str, model: str = "llama-3.1-8b-instant",
+                 pool_size: int = 10, http2: bool = False,
+                 cache: Optional[LLMResponseCache] = None, use_cache: bool = True,
+                 scheduler: Optional[RateLimitScheduler] = None,
+                 metrics: Optional[LLMMetrics] = None,
+                 router: Optional[ModelRouter] = None):
         self.api_key = api_key
         self.model = model
         self.base_url = "https://api.groq.com/openai/v1/chat/completions"
@@ -18,53 +136,414 @@ class GroqLLM:
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        self.transport = get_shared_transport(pool_size=pool_size, http2=http2)
+        self.cache = (cache or get_shared_cache()) if use_cache else None
+        self.scheduler = scheduler or get_shared_scheduler()
+        self.metrics = metrics or get_shared_metrics()
+        self.router = router or ModelRouter(default_model=model)
+    
+    def connection_stats(self) -> Dict[str, Any]:
+        return self.transport.stats()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        return self.cache.stats() if self.cache else {}
+    
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        return self.scheduler.stats()
+    
+    def metrics_summary(self) -> Dict[str, Dict[str, Any]]:
+        return self.metrics.summary()
+    
+    def routing_stats(self) -> Dict[str, Dict[str, Any]]:
+        return self.router.stats()
+    
+    def _record_usage(self, call: Dict[str, Any], usage: Optional[Dict[str, Any]]):
+        usage = usage or {}
+        call["prompt_tokens"] = usage.get("prompt_tokens", 0) or 0
+        call["completion_tokens"] = usage.get("completion_tokens", 0) or 0
+    
+    def _estimate_request_tokens(self, messages: List[Dict], max_tokens: int) -> int:
+        return sum(len(str(m.get('content', ''))) for m in messages) // 4 + max_tokens
+    
+    def _cache_lookup(self, model: str, messages: List[Dict], max_tokens: int, temperature: float,
+                      use_cache: Optional[bool], call: Dict[str, Any],
+                      response_format: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        if self.cache is None or not self.cache.should_cache(temperature, use_cache):
+            return None
+        cached = self.cache.get(LLMResponseCache.make_key(model, messages, max_tokens, temperature, response_format))
+        if cached is not None:
+            call["status"] = 200
+            call["cache_hit"] = True
+        return cached
+    
+    def _cache_store(self, model: str, messages: List[Dict], max_tokens: int, temperature: float,
+                     use_cache: Optional[bool], content: str, response_format: Optional[Dict[str, Any]] = None,
+                     validator=None):
+        # A reply the caller would reject must not be replayed to its retries for the whole TTL.
+        if not content or self.cache is None or not self.cache.should_cache(temperature, use_cache):
+            return
+        if validator is None or self._passes_validation(validator, content):
+            key = LLMResponseCache.make_key(model, messages, max_tokens, temperature, response_format)
+            self.cache.set(key, content, model=model)
+    
+    def _start_call(self, feature: str, models: List[str], escalated: bool = False) -> Dict[str, Any]:
+        call = self.metrics.start_call(feature, models[0])
+        call["tier"] = self.router.tier_for(feature) or "default"
+        call["fallback"] = False
+        call["escalated"] = escalated
+        return call
+    
+    def _finish_call(self, call: Dict[str, Any]):
+        record = self.metrics.finish_call(call)
+        self.router.record(record)
+    
+    def _available_model_index(self, models: List[str], model_index: int) -> int:
+        """Skip models still serving a 429 block while a fallback remains, instead of waiting on them."""
+        while model_index < len(models) - 1 and self.scheduler.blocked_for(models[model_index]) > 0:
+            model_index += 1
+        return model_index
+    
+    def _use_model(self, call: Dict[str, Any], payload: Dict[str, Any], models: List[str], model_index: int):
+        payload["model"] = models[model_index]
+        call["model"] = models[model_index]
+        call["fallback"] = model_index > 0
+    
+    def _passes_validation(self, validator, content: str) -> bool:
+        if not content or content.startswith("❌"):
+            return False
+        try:
+            return bool(validator(content))
+        except Exception:
+            return False
+    
+    def request_json(self, messages: List[Dict], expect: type = dict, schema: Optional[Dict[str, Any]] = None,
+                     max_tokens: int = 1500, temperature: float = 0.3, timeout: int = 30,
+                     priority: int = PRIORITY_DEFAULT, feature: Optional[str] = None,
+                     max_continuations: int = 1, max_wait: Optional[float] = None) -> Optional[Any]:
+        """Request a JSON value and return it parsed and schema-checked, or None.
+
+        Objects use Groq JSON mode. Truncated output is continued with a follow-up call
+        that appends to the partial text, then repaired by closing it at the last complete
+        element, rather than re-running the whole prompt. `max_wait` overrides how long
+        each call may wait for the rate limiter.
+        """
+        feature = feature or UNLABELED_FEATURE
+        schema = schema if schema is not None else SCHEMAS.get(feature)
+        response_format = {"type": "json_object"} if expect is dict else None
+        
+        def acceptable(text):
+            result = parse_json(text, expect)
+            return result.value is not None and not validate(prune_invalid_items(result.value, schema), schema)
+        
+        text = self._make_request(messages, max_tokens=max_tokens, temperature=temperature, timeout=timeout,
+                                  priority=priority, feature=feature, validator=acceptable,
+                                  response_format=response_format, max_wait=max_wait)
+        if text.startswith("❌"):
+            text = self._failed_generation(text)
+            if text is None:
+                STATS.record(feature, "failed", 0, [])
+                return None
+        
+        result = parse_json(text, expect)
+        continuations = 0
+        while result.truncated and continuations < max_continuations:
+            follow_up = messages + [
+                {"role": "assistant", "content": text},
+                {"role": "user", "content": CONTINUE_PROMPT}
+            ]
+            more = self._make_request(follow_up, max_tokens=max_tokens, temperature=temperature, timeout=timeout,
+                                      use_cache=False, priority=priority, feature=feature, max_wait=max_wait)
+            continuations += 1
+            if more.startswith("❌"):
+                break
+            text += strip_code_fences(more)
+            result = parse_json(text, expect)
+        
+        value = prune_invalid_items(result.value, schema)
+        errors = validate(value, schema) if value is not None else []
+        STATS.record(feature, result.status, continuations, errors)
+        if errors:
+            print(f"Warning: {feature} returned JSON that failed validation: {'; '.join(errors[:3])}")
+            return None
+        return value
+    
+    def stream_json_items(self, messages: List[Dict], max_tokens: int = 2000, temperature: float = 0.3,
+                          timeout: int = 30, priority: int = PRIORITY_DEFAULT, feature: Optional[str] = None,
+                          item_schema: Optional[Dict[str, Any]] = None, limit: Optional[int] = None):
+        """Stream a JSON array and yield each valid element as soon as it is complete.
+
+        Stops reading once `limit` items have been yielded. `item_schema` defaults to the
+        item schema registered for `feature`.
+        """
+        feature = feature or UNLABELED_FEATURE
+        if item_schema is None:
+            item_schema = (SCHEMAS.get(feature) or {}).get("items")
+        parser = IncrementalJSONParser(list)
+        yielded = 0
+        for delta in self._make_request_stream(messages, max_tokens=max_tokens, temperature=temperature,
+                                               timeout=timeout, priority=priority, feature=feature):
+            if delta.startswith("❌"):
+                break
+            for item in parser.feed(delta):
+                if validate(item, item_schema):
+                    continue
+                yield item
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    break
+            if parser.complete or (limit is not None and yielded >= limit):
+                break
+        if yielded:
+            STATS.record(feature, "ok" if parser.complete or yielded == limit else "repaired", 0, [])
+    
+    def structured_output_stats(self) -> Dict[str, Dict[str, int]]:
+        return STATS.snapshot()
+    
+    @staticmethod
+    def _failed_generation(error_text: str) -> Optional[str]:
+        # JSON mode rejects malformed output with a 400 that still carries the generated text.
+        if "json_validate_failed" not in error_text:
+            return None
+        try:
+            body = json.loads(error_text.split(": ", 1)[1])
+            return body.get("error", {}).get("failed_generation") or None
+        except (IndexError, ValueError, AttributeError):
+            return None
     
     def _make_request(self, messages: List[Dict], max_tokens: int = 2000, 
-                        temperature: float = 0.7, timeout: int = 30) -> str:
+                        temperature: float = 0.7, timeout: int = 30,
+                        use_cache: Optional[bool] = None, priority: int = PRIORITY_DEFAULT,
+                        feature: Optional[str] = None, validator=None,
+                        response_format: Optional[Dict[str, Any]] = None, max_wait: Optional[float] = None) -> str:
+        feature = feature or UNLABELED_FEATURE
+        
+        # Cheap-first cascade: escalate to the next model only when the answer fails validation.
+        cascade = self.router.cascade_for(feature) if validator else None
+        if cascade:
+            for step, model in enumerate(cascade):
+                call = self._start_call(feature, [model], escalated=step > 0)
+                try:
+                    content = self._send_request(messages, max_tokens, temperature, timeout,
+                                                 use_cache, priority, call, [model], response_format, max_wait,
+                                                 validator)
+                    call["validated"] = self._passes_validation(validator, content)
+                finally:
+                    self._finish_call(call)
+                # Escalating to a throttled model would only wait or be shed; keep the cheaper answer.
+                if (step == len(cascade) - 1 or call["validated"]
+                        or self.scheduler.blocked_for(cascade[step + 1]) > 0):
+                    return content
+        
+        models = self.router.models_for(feature)
+        call = self._start_call(feature, models)
+        try:
+            return self._send_request(messages, max_tokens, temperature, timeout, use_cache, priority, call, models,
+                                      response_format, max_wait, validator)
+        finally:
+            self._finish_call(call)
+    
+    def _send_request(self, messages: List[Dict], max_tokens: int, temperature: float, timeout: int,
+                      use_cache: Optional[bool], priority: int, call: Dict[str, Any], models: List[str],
+                      response_format: Optional[Dict[str, Any]] = None, max_wait: Optional[float] = None,
+                      validator=None) -> str:
+        cached = self._cache_lookup(models[0], messages, max_tokens, temperature, use_cache, call,
+                                    response_format)
+        if cached is not None:
+            return cached
+        
         payload = {
-            "model": self.model,
+            "model": models[0],
             "messages": messages,
             "max_tokens": max_tokens,
             "temperature": temperature
         }
+        if response_format:
+            payload["response_format"] = response_format
         
         max_retries = 3
         retry_delay = 1
+        model_index = 0
+        estimated_tokens = self._estimate_request_tokens(messages, max_tokens)
         
         for attempt in range(max_retries):
+            call["retries"] = attempt
+            model_index = self._available_model_index(models, model_index)
+            self._use_model(call, payload, models, model_index)
+            if not self.scheduler.acquire(estimated_tokens, priority=priority, max_wait=max_wait,
+                                          model=payload["model"]):
+                call["status"] = "shed"
+                return "❌ Rate limit exceeded. Please try again later."
             try:
-                response = requests.post(
+                response = self.transport.post(
                     self.base_url,
                     headers=self.headers,
                     json=payload,
                     timeout=timeout
                 )
+                call["status"] = response.status_code
+                elapsed = getattr(response, "elapsed", None)
+                call["ttfb_ms"] = round(elapsed.total_seconds() * 1000, 1) if elapsed is not None else None
                 
                 if response.status_code == 200:
                     result = response.json()
-                    return result["choices"][0]["message"]["content"]
-                elif response.status_code == 429: 
+                    self._record_usage(call, result.get("usage"))
+                    self.scheduler.record_response(response.headers, response.status_code, estimated_tokens,
+                                                   result.get("usage", {}).get("total_tokens"),
+                                                   model=payload["model"])
+                    content = result["choices"][0]["message"]["content"]
+                    if model_index == 0:
+                        self._cache_store(models[0], messages, max_tokens, temperature, use_cache, content,
+                                          response_format, validator)
+                    return content
+                
+                self.scheduler.record_response(response.headers, response.status_code, model=payload["model"])
+                if response.status_code == 429: 
                     if attempt < max_retries - 1:
-                        time.sleep(retry_delay * (2 ** attempt))
+                        model_index = min(model_index + 1, len(models) - 1)
                         continue
                     else:
                         return "❌ Rate limit exceeded. Please try again later."
                 else:
                     return f"❌ API Error {response.status_code}: {response.text}"
                     
-            except requests.exceptions.Timeout:
+            except _TIMEOUT_ERRORS:
+                call["status"] = "timeout"
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                    if model_index < len(models) - 1:
+                        model_index += 1
+                    else:
+                        time.sleep(retry_delay)
                     continue
                 else:
                     return "❌ Request timeout. Please try again."
-            except requests.exceptions.RequestException as e:
+            except _NETWORK_ERRORS as e:
+                call["status"] = "network_error"
                 return f"❌ Network error: {str(e)}"
             except Exception as e:
+                call["status"] = "error"
                 return f"❌ Unexpected error: {str(e)}"
         
         return "❌ Failed to get response after multiple attempts."
     
+    def _make_request_stream(self, messages: List[Dict], max_tokens: int = 2000,
+                             temperature: float = 0.7, timeout: int = 30,
+                             use_cache: Optional[bool] = None, priority: int = PRIORITY_INTERACTIVE,
+                             feature: Optional[str] = None):
+        """Stream a completion with SSE (stream=true), returning a generator of content deltas.
+
+        Errors are yielded as the same "❌ ..." strings _make_request returns.
+        """
+        return self._stream_request(messages, max_tokens, temperature, timeout, use_cache, priority,
+                                    feature or UNLABELED_FEATURE)
+    
+    def _stream_request(self, messages: List[Dict], max_tokens: int, temperature: float, timeout: int,
+                        use_cache: Optional[bool], priority: int, feature: str):
+        # Runs on the first next(), so latency is measured from when the caller starts consuming.
+        models = self.router.models_for(feature)
+        call = self._start_call(feature, models)
+        try:
+            yield from self._stream_request_attempts(messages, max_tokens, temperature, timeout,
+                                                     use_cache, priority, call, models)
+        finally:
+            self._finish_call(call)
+    
+    def _stream_request_attempts(self, messages: List[Dict], max_tokens: int, temperature: float, timeout: int,
+                                 use_cache: Optional[bool], priority: int, call: Dict[str, Any], models: List[str]):
+        cached = self._cache_lookup(models[0], messages, max_tokens, temperature, use_cache, call)
+        if cached is not None:
+            yield cached
+            return
+        
+        payload = {
+            "model": models[0],
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True
+        }
+        
+        max_retries = 3
+        retry_delay = 1
+        model_index = 0
+        estimated_tokens = self._estimate_request_tokens(messages, max_tokens)
+        
+        for attempt in range(max_retries):
+            call["retries"] = attempt
+            model_index = self._available_model_index(models, model_index)
+            self._use_model(call, payload, models, model_index)
+            if not self.scheduler.acquire(estimated_tokens, priority=priority, model=payload["model"]):
+                call["status"] = "shed"
+                yield "❌ Rate limit exceeded. Please try again later."
+                return
+            
+            started = time.monotonic()
+            first_token_at = None
+            parts = []
+            usage = {}
+            try:
+                with self.transport.stream(self.base_url, headers=self.headers, json=payload,
+                                           timeout=timeout) as (response, lines):
+                    call["status"] = response.status_code
+                    if response.status_code != 200:
+                        self.scheduler.record_response(response.headers, response.status_code, model=payload["model"])
+                        if response.status_code == 429:
+                            if attempt < max_retries - 1:
+                                model_index = min(model_index + 1, len(models) - 1)
+                                continue
+                            yield "❌ Rate limit exceeded. Please try again later."
+                            return
+                        yield f"❌ API Error {response.status_code}: {''.join(lines)}"
+                        return
+                    
+                    for line in lines:
+                        if not line or not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            break
+                        chunk = json.loads(data)
+                        usage = chunk.get("x_groq", {}).get("usage") or chunk.get("usage") or usage
+                        choices = chunk.get("choices") or [{}]
+                        delta = choices[0].get("delta", {}).get("content")
+                        if delta:
+                            if first_token_at is None:
+                                first_token_at = time.monotonic()
+                                call["ttfb_ms"] = round((first_token_at - started) * 1000, 1)
+                                logger.info("Groq stream time-to-first-token: %.0f ms (model=%s)",
+                                            (first_token_at - started) * 1000, payload["model"])
+                            parts.append(delta)
+                            yield delta
+                    
+                    self._record_usage(call, usage)
+                    self.scheduler.record_response(response.headers, response.status_code, estimated_tokens,
+                                                   usage.get("total_tokens"),
+                                                   model=payload["model"])
+                    logger.info("Groq stream completed in %.0f ms", (time.monotonic() - started) * 1000)
+                    if model_index == 0:
+                        self._cache_store(models[0], messages, max_tokens, temperature, use_cache, "".join(parts))
+                    return
+            
+            except _TIMEOUT_ERRORS:
+                call["status"] = "timeout"
+                if not parts and attempt < max_retries - 1:
+                    if model_index < len(models) - 1:
+                        model_index += 1
+                    else:
+                        time.sleep(retry_delay)
+                    continue
+                yield "❌ Request timeout. Please try again."
+                return
+            except _NETWORK_ERRORS as e:
+                call["status"] = "network_error"
+                yield f"❌ Network error: {str(e)}"
+                return
+            except Exception as e:
+                call["status"] = "error"
+                yield f"❌ Unexpected error: {str(e)}"
+                return
+        
+        yield "❌ Failed to get response after multiple attempts."
+    
     def search_unknown_terms(self, text: str, context: str = "") -> Dict[str, str]:
         if not search:
             return {}
@@ -125,13 +604,13 @@ class GroqLLM:
                 {"role": "user", "content": prompt}
             ]
             
-            explanation = self._make_request(messages, max_tokens=100, temperature=0.3)
+            explanation = self._make_request(messages, max_tokens=100, temperature=0.3, feature="_get_term_explanation")
             return explanation if explanation and not explanation.startswith("❌") else ""
         except Exception:
             return ""
 
     def generate_enhanced_cover_letter(self, user_data: Dict[str, Any], job_description: str, 
-                                        company_name: str, tone: str = "Professional") -> str:
+                                        company_name: str, tone: str = "Professional", stream: bool = False):
         
         user_skills = user_data.get('skills', [])
         user_experience = user_data.get('experience', [])
@@ -194,7 +673,7 @@ class GroqLLM:
         job_analysis = self._make_request([
             {"role": "system", "content": "You are a job requirements analyst. Provide concise analysis."},
             {"role": "user", "content": job_analysis_prompt}
-        ], max_tokens=300, temperature=0.3)
+        ], max_tokens=300, temperature=0.3, feature="generate_enhanced_cover_letter")
         
         prompt = f"""
         Write a compelling, {tone.lower()} cover letter that demonstrates clear alignment between the candidate's background and the job requirements.
@@ -253,9 +732,12 @@ class GroqLLM:
             {"role": "user", "content": prompt}
         ]
         
-        return self._make_request(messages, max_tokens=1500, temperature=0.7)
+        if stream:
+            return self._make_request_stream(messages, max_tokens=1500, temperature=0.7,
+                                             feature="generate_enhanced_cover_letter")
+        return self._make_request(messages, max_tokens=1500, temperature=0.7, feature="generate_enhanced_cover_letter")
 
-    def generate_enhanced_resume(self, user_data: Dict[str, Any]) -> str:
+    def generate_enhanced_resume(self, user_data: Dict[str, Any], stream: bool = False):
         style = user_data.get('resume_style', 'Professional ATS-Optimized')
         skills_input = user_data.get('skills_input', '')
         projects = user_data.get('projects', [])
@@ -335,9 +817,12 @@ class GroqLLM:
             {"role": "user", "content": prompt}
         ]
         
-        return self._make_request(messages, max_tokens=2000, temperature=0.6)
+        if stream:
+            return self._make_request_stream(messages, max_tokens=2000, temperature=0.6,
+                                             feature="generate_enhanced_resume")
+        return self._make_request(messages, max_tokens=2000, temperature=0.6, feature="generate_enhanced_resume")
 
-    def generate_tailored_resume(self, user_data: Dict[str, Any], job_description: str) -> str:
+    def generate_tailored_resume(self, user_data: Dict[str, Any], job_description: str, stream: bool = False):
         search_results = self.search_unknown_terms(job_description, "job requirements career skills")
         projects = user_data.get('projects', [])
         
@@ -353,9 +838,9 @@ class GroqLLM:
         if projects:
             enhanced_user_data['projects'] = projects
             
-        return self.generate_resume(enhanced_user_data, enhanced_job_description)
+        return self.generate_resume(enhanced_user_data, enhanced_job_description, stream=stream)
 
-    def generate_resume(self, user_data: Dict[str, Any], job_description: str = "") -> str:
+    def generate_resume(self, user_data: Dict[str, Any], job_description: str = "", stream: bool = False):
         tailoring_context = f"\n\nTailor the resume for this job:\n{job_description}" if job_description else ""
         projects = user_data.get('projects', [])
         
@@ -421,7 +906,9 @@ class GroqLLM:
             {"role": "user", "content": prompt}
         ]
         
-        return self._make_request(messages, max_tokens=2000, temperature=0.6)
+        if stream:
+            return self._make_request_stream(messages, max_tokens=2000, temperature=0.6, feature="generate_resume")
+        return self._make_request(messages, max_tokens=2000, temperature=0.6, feature="generate_resume")
 
     def generate_interview_questions(self, job_description: str, user_data: Dict[str, Any], num_questions: int = 5) -> List[Dict]:
         name = str(user_data.get('name', 'Candidate'))
@@ -466,30 +953,32 @@ class GroqLLM:
             {"role": "user", "content": prompt}
         ]
         try:
-            response = self._make_request(messages, max_tokens=1500, temperature=0.7)
-            json_start = response.find('[')
-            json_end = response.rfind(']') + 1
-            if json_start != -1 and json_end != 0:
-                json_str = response[json_start:json_end]
-                questions = json.loads(json_str)
-                if isinstance(questions, list):
-                    # Always return exactly num_questions
-                    if len(questions) > num_questions:
-                        return questions[:num_questions]
-                    elif len(questions) < num_questions:
-                        # Pad with generic questions if too few
-                        default_qs = [
-                            {"question": "Tell me about yourself and your background.", "type": "General", "difficulty": "Easy", "category": "Introduction"},
-                            {"question": "Why are you interested in this position?", "type": "Behavioral", "difficulty": "Easy", "category": "Motivation"},
-                            {"question": "Describe a challenging project you worked on and how you handled it.", "type": "Behavioral", "difficulty": "Medium", "category": "Problem Solving"},
-                            {"question": "What are your greatest strengths and how do they apply to this role?", "type": "General", "difficulty": "Medium", "category": "Self Assessment"},
-                            {"question": "Where do you see yourself in 5 years?", "type": "General", "difficulty": "Medium", "category": "Career Goals"}
-                        ]
-                        while len(questions) < num_questions:
-                            questions.append(default_qs[len(questions) % len(default_qs)])
-                        return questions
-                    else:
-                        return questions
+            # Stream so a reply cut off by max_tokens still keeps every question that arrived whole.
+            questions = list(self.stream_json_items(messages, max_tokens=1500, temperature=0.7,
+                                                    priority=PRIORITY_INTERACTIVE,
+                                                    feature="generate_interview_questions",
+                                                    limit=num_questions))
+            if not questions:
+                questions = self.request_json(messages, expect=list, max_tokens=1500, temperature=0.7,
+                                              feature="generate_interview_questions")
+            if questions is not None:
+                # Always return exactly num_questions
+                if len(questions) > num_questions:
+                    return questions[:num_questions]
+                elif len(questions) < num_questions:
+                    # Pad with generic questions if too few
+                    default_qs = [
+                        {"question": "Tell me about yourself and your background.", "type": "General", "difficulty": "Easy", "category": "Introduction"},
+                        {"question": "Why are you interested in this position?", "type": "Behavioral", "difficulty": "Easy", "category": "Motivation"},
+                        {"question": "Describe a challenging project you worked on and how you handled it.", "type": "Behavioral", "difficulty": "Medium", "category": "Problem Solving"},
+                        {"question": "What are your greatest strengths and how do they apply to this role?", "type": "General", "difficulty": "Medium", "category": "Self Assessment"},
+                        {"question": "Where do you see yourself in 5 years?", "type": "General", "difficulty": "Medium", "category": "Career Goals"}
+                    ]
+                    while len(questions) < num_questions:
+                        questions.append(default_qs[len(questions) % len(default_qs)])
+                    return questions
+                else:
+                    return questions
         except Exception as e:
             print(f"Error generating interview questions: {e}")
         # Fallback: always return exactly num_questions
@@ -548,12 +1037,10 @@ class GroqLLM:
         ]
 
         try:
-            response = self._make_request(messages, max_tokens=800, temperature=0.6)
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start != -1 and json_end != 0:
-                json_str = response[json_start:json_end]
-                return json.loads(json_str)
+            evaluation = self.request_json(messages, max_tokens=800, temperature=0.6, priority=PRIORITY_INTERACTIVE,
+                                           feature="evaluate_interview_answer")
+            if evaluation is not None:
+                return evaluation
         except Exception as e:
             print(f"Error in evaluate_interview_answer: {e}")
 
@@ -608,7 +1095,8 @@ class GroqLLM:
         ]
         
         try:
-            response = self._make_request(messages, max_tokens=200, temperature=0.7)
+            response = self._make_request(messages, max_tokens=200, temperature=0.7, priority=PRIORITY_INTERACTIVE,
+                                          feature="generate_chat_interview_question")
             return response if response and not response.startswith("❌") else "Can you tell me more about your relevant experience for this role?"
         except Exception as e:
             print(f"Error generating chat interview question: {e}")
@@ -651,109 +1139,250 @@ class GroqLLM:
             {"role": "system", "content": "You are an expert interview analyst providing detailed performance feedback. Return only valid JSON."},
             {"role": "user", "content": prompt}
         ]
-        response = self._make_request(messages, max_tokens=1500, temperature=0.6)
-        try:
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start != -1 and json_end != 0:
-                json_str = response[json_start:json_end]
-                return json.loads(json_str)
-        except:
-            return {
-                "overall_score": 7.5,
-                "performance_level": "Good",
-                "strengths": ["Good communication", "Relevant experience"],
-                "improvement_areas": ["Provide more specific examples", "Quantify achievements"],
-                "detailed_feedback": "You demonstrated good knowledge and communication skills. Consider adding more specific examples and quantifiable achievements in future interviews.",
-                "question_scores": [7] * len(questions),
-                "recommendations": ["Practice the STAR method", "Prepare specific achievement stories"]
-            }
+        analysis = self.request_json(messages, max_tokens=1500, temperature=0.6, feature="analyze_chat_interview")
+        if analysis is not None:
+            return analysis
+        return {
+            "overall_score": 7.5,
+            "performance_level": "Good",
+            "strengths": ["Good communication", "Relevant experience"],
+            "improvement_areas": ["Provide more specific examples", "Quantify achievements"],
+            "detailed_feedback": "You demonstrated good knowledge and communication skills. Consider adding more specific examples and quantifiable achievements in future interviews.",
+            "question_scores": [7] * len(questions),
+            "recommendations": ["Practice the STAR method", "Prepare specific achievement stories"]
+        }
 
-    def analyze_job_matches(self, jobs: List[Dict[str, Any]], user_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        enhanced_jobs = []
-        
-        for job in jobs:
-            try:
-                job_desc = job.get('description', '')
-                job_title = job.get('title', '')
-                
-                prompt = f"""
-                Analyze this job posting against the candidate's profile:
-                
-                Job Title: {job_title}
-                Job Description: {job_desc}
-                
-                Candidate Profile:
-                Skills: {', '.join(user_data.get('skills', []))}
-                Experience: {user_data.get('experience', 'Professional experience')}
-                Title: {user_data.get('title', 'Professional')}
-                
-                Provide a match analysis:
-                {{
-                    "match_score": 85,
-                    "match_level": "Excellent",
-                    "matched_keywords": ["Python", "React", "API"],
-                    "missing_skills": ["Docker", "AWS"],
-                    "strengths": ["Strong technical background", "Relevant experience"],
-                    "recommendations": ["Highlight Python experience", "Mention API development projects"]
-                }}
-                
-                Return only valid JSON.
-                """
-                
-                messages = [
-                    {"role": "system", "content": "You are an expert job match analyzer. Return only valid JSON with match analysis."},
-                    {"role": "user", "content": prompt}
-                ]
-                
-                response = self._make_request(messages, max_tokens=500, temperature=0.3)
-                
+    def analyze_job_matches(self, jobs: List[Dict[str, Any]], user_data: Dict[str, Any],
+                            concurrent: bool = True, batched: bool = False, max_workers: int = 5,
+                            job_timeout: float = 20.0, token_budget: int = 6000) -> List[Dict[str, Any]]:
+        if concurrent and len(jobs) > 1:
+            enhanced_jobs = list(self.iter_job_matches(jobs, user_data, batched=batched, max_workers=max_workers,
+                                                       job_timeout=job_timeout, token_budget=token_budget))
+        else:
+            enhanced_jobs = []
+            for unit in self._plan_job_units(jobs, user_data, batched, token_budget):
                 try:
-                    json_start = response.find('{')
-                    json_end = response.rfind('}') + 1
-                    if json_start != -1 and json_end != 0:
-                        json_str = response[json_start:json_end]
-                        analysis = json.loads(json_str)
-                        job['ai_analysis'] = analysis
-                        job['ai_match_score'] = analysis.get('match_score', 75)
-                    else:
-                        job['ai_analysis'] = {
-                            "match_score": 75,
-                            "match_level": "Good",
-                            "matched_keywords": [],
-                            "missing_skills": [],
-                            "strengths": ["Review job requirements"],
-                            "recommendations": ["Tailor your application"]
-                        }
-                        job['ai_match_score'] = 75
-                except:
-                    job['ai_analysis'] = {
-                        "match_score": 75,
-                        "match_level": "Good",
-                        "matched_keywords": [],
-                        "missing_skills": [],
-                        "strengths": ["Review job requirements"],
-                        "recommendations": ["Tailor your application"]
-                    }
-                    job['ai_match_score'] = 75
-                
-            except Exception as e:
-                job['ai_analysis'] = {
-                    "match_score": 70,
-                    "match_level": "Fair",
-                    "matched_keywords": [],
-                    "missing_skills": [],
-                    "strengths": ["Review carefully"],
-                    "recommendations": ["Analyze job requirements"]
-                }
-                job['ai_match_score'] = 70
-            
-            enhanced_jobs.append(job)
+                    analyses = self._score_job_unit(jobs, unit, user_data)
+                except Exception:
+                    analyses = {}
+                for index in unit:
+                    analysis = analyses.get(index) or dict(self._JOB_MATCH_ERROR_ANALYSIS)
+                    enhanced_jobs.append(self._apply_job_match(jobs[index], analysis))
         
         enhanced_jobs.sort(key=lambda x: x.get('ai_match_score', 0), reverse=True)
         return enhanced_jobs
 
-    def chat_about_resume(self, resume_content: str, user_message: str, chat_history: List[Dict] = None) -> str:
+    def iter_job_matches(self, jobs: List[Dict[str, Any]], user_data: Dict[str, Any],
+                         batched: bool = False, max_workers: int = 5, job_timeout: float = 20.0,
+                         token_budget: int = 6000):
+        """Score jobs on a bounded worker pool and yield each job as soon as its analysis lands.
+
+        Jobs still running after `job_timeout` seconds (twice that for a batch) are yielded with
+        the fallback analysis so one slow posting never holds up the rest.
+        """
+        units = self._plan_job_units(jobs, user_data, batched, token_budget)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job-match")
+        started = {}
+
+        def score(unit_index, unit):
+            started[unit_index] = time.monotonic()
+            return self._score_job_unit(jobs, unit, user_data, timeout=job_timeout)
+
+        futures = {executor.submit(score, u, unit): u for u, unit in enumerate(units)}
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=0.25, return_when=FIRST_COMPLETED)
+                for future in done:
+                    unit = units[futures[future]]
+                    try:
+                        analyses = future.result()
+                    except Exception:
+                        analyses = {}
+                    for index in unit:
+                        analysis = analyses.get(index) or dict(self._JOB_MATCH_ERROR_ANALYSIS)
+                        yield self._apply_job_match(jobs[index], analysis)
+
+                now = time.monotonic()
+                for future in list(pending):
+                    unit_index = futures[future]
+                    unit = units[unit_index]
+                    limit = job_timeout if len(unit) == 1 else job_timeout * 2
+                    if unit_index in started and now - started[unit_index] > limit:
+                        pending.discard(future)
+                        future.cancel()
+                        for index in unit:
+                            yield self._apply_job_match(jobs[index], dict(self._JOB_MATCH_ERROR_ANALYSIS))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _plan_job_units(self, jobs: List[Dict[str, Any]], user_data: Dict[str, Any],
+                        batched: bool, token_budget: int) -> List[List[int]]:
+        if not batched:
+            return [[i] for i in range(len(jobs))]
+        
+        # Pack jobs greedily until the prompt would exceed the input budget or the
+        # expected completion would exceed what one response can hold.
+        available = token_budget - self._estimate_tokens(self._format_candidate_profile(user_data)) - 400
+        max_per_batch = max(1, (self._BATCH_MAX_OUTPUT_TOKENS - 100) // self._BATCH_TOKENS_PER_JOB)
+        units, current, used = [], [], 0
+        for i, job in enumerate(jobs):
+            cost = self._estimate_tokens(self._format_batch_job(job, i))
+            if current and (used + cost > available or len(current) >= max_per_batch):
+                units.append(current)
+                current, used = [], 0
+            current.append(i)
+            used += cost
+        if current:
+            units.append(current)
+        return units
+
+    def _score_job_unit(self, jobs: List[Dict[str, Any]], unit: List[int], user_data: Dict[str, Any],
+                        timeout: int = 30) -> Dict[int, Dict[str, Any]]:
+        if len(unit) == 1:
+            return {unit[0]: self._score_job_match(jobs[unit[0]], user_data, timeout=timeout)}
+        
+        analyses = self._score_job_batch(jobs, unit, user_data, timeout=timeout)
+        for index in unit:
+            if index not in analyses:
+                try:
+                    analyses[index] = self._score_job_match(jobs[index], user_data, timeout=timeout)
+                except Exception:
+                    analyses[index] = dict(self._JOB_MATCH_ERROR_ANALYSIS)
+        return analyses
+
+    _BATCH_TOKENS_PER_JOB = 160
+    _BATCH_MAX_OUTPUT_TOKENS = 3000
+    _BATCH_DESCRIPTION_CHARS = 1500
+
+    def _estimate_tokens(self, text: str) -> int:
+        return len(text) // 4 + 1
+
+    def _format_candidate_profile(self, user_data: Dict[str, Any]) -> str:
+        return f"""Skills: {', '.join(user_data.get('skills', []))}
+        Experience: {user_data.get('experience', 'Professional experience')}
+        Title: {user_data.get('title', 'Professional')}"""
+
+    def _batch_job_id(self, job: Dict[str, Any], index: int) -> str:
+        return f"{index}:{job.get('id') or 'job'}"
+
+    def _format_batch_job(self, job: Dict[str, Any], index: int) -> str:
+        return f"""
+        job_id: {self._batch_job_id(job, index)}
+        Job Title: {job.get('title', '')}
+        Job Description: {str(job.get('description', ''))[:self._BATCH_DESCRIPTION_CHARS]}
+        """
+
+    def _score_job_batch(self, jobs: List[Dict[str, Any]], unit: List[int], user_data: Dict[str, Any],
+                         timeout: int = 30) -> Dict[int, Dict[str, Any]]:
+        """Score several jobs in one call; entries missing or unparseable in the reply are left out."""
+        jobs_context = "".join(self._format_batch_job(jobs[i], i) for i in unit)
+        prompt = f"""
+        Analyze each of these job postings against the candidate's profile.
+        
+        Candidate Profile:
+        {self._format_candidate_profile(user_data)}
+        
+        Job Postings:
+        {jobs_context}
+        
+        Return a JSON array with exactly one object per job, using the job_id given above:
+        [
+            {{
+                "job_id": "0:indeed_123",
+                "match_score": 85,
+                "match_level": "Excellent",
+                "matched_keywords": ["Python", "React", "API"],
+                "missing_skills": ["Docker", "AWS"],
+                "strengths": ["Strong technical background", "Relevant experience"],
+                "recommendations": ["Highlight Python experience", "Mention API development projects"]
+            }}
+        ]
+        
+        Return only valid JSON.
+        """
+        
+        messages = [
+            {"role": "system", "content": "You are an expert job match analyzer. Return only a valid JSON array with one match analysis per job."},
+            {"role": "user", "content": prompt}
+        ]
+        
+        max_tokens = min(self._BATCH_MAX_OUTPUT_TOKENS, self._BATCH_TOKENS_PER_JOB * len(unit) + 100)
+        # A truncated array is continued or cut back to its complete leading objects.
+        entries = self.request_json(messages, expect=list, max_tokens=max_tokens, temperature=0.3,
+                                    timeout=timeout, priority=PRIORITY_BACKGROUND, feature="_score_job_batch") or []
+        
+        ids = {self._batch_job_id(jobs[i], i): i for i in unit}
+        analyses = {}
+        for entry in entries:
+            index = ids.get(str(entry.get('job_id', '')))
+            if index is not None and isinstance(entry.get('match_score'), (int, float)):
+                entry.pop('job_id', None)
+                analyses[index] = entry
+        return analyses
+
+    _JOB_MATCH_DEFAULT_ANALYSIS = {
+        "match_score": 75,
+        "match_level": "Good",
+        "matched_keywords": [],
+        "missing_skills": [],
+        "strengths": ["Review job requirements"],
+        "recommendations": ["Tailor your application"]
+    }
+
+    _JOB_MATCH_ERROR_ANALYSIS = {
+        "match_score": 70,
+        "match_level": "Fair",
+        "matched_keywords": [],
+        "missing_skills": [],
+        "strengths": ["Review carefully"],
+        "recommendations": ["Analyze job requirements"]
+    }
+
+    def _apply_job_match(self, job: Dict[str, Any], analysis: Dict[str, Any]) -> Dict[str, Any]:
+        job['ai_analysis'] = analysis
+        job['ai_match_score'] = analysis.get('match_score', 75)
+        return job
+
+    def _score_job_match(self, job: Dict[str, Any], user_data: Dict[str, Any], timeout: int = 30) -> Dict[str, Any]:
+        job_desc = job.get('description', '')
+        job_title = job.get('title', '')
+        
+        prompt = f"""
+        Analyze this job posting against the candidate's profile:
+        
+        Job Title: {job_title}
+        Job Description: {job_desc}
+        
+        Candidate Profile:
+        Skills: {', '.join(user_data.get('skills', []))}
+        Experience: {user_data.get('experience', 'Professional experience')}
+        Title: {user_data.get('title', 'Professional')}
+        
+        Provide a match analysis:
+        {{
+            "match_score": 85,
+            "match_level": "Excellent",
+            "matched_keywords": ["Python", "React", "API"],
+            "missing_skills": ["Docker", "AWS"],
+            "strengths": ["Strong technical background", "Relevant experience"],
+            "recommendations": ["Highlight Python experience", "Mention API development projects"]
+        }}
+        
+        Return only valid JSON.
+        """
+        
+        messages = [
+            {"role": "system", "content": "You are an expert job match analyzer. Return only valid JSON with match analysis."},
+            {"role": "user", "content": prompt}
+        ]
+        
+        analysis = self.request_json(messages, max_tokens=500, temperature=0.3, timeout=timeout,
+                                     priority=PRIORITY_BACKGROUND, feature="_score_job_match")
+        return analysis if analysis is not None else dict(self._JOB_MATCH_DEFAULT_ANALYSIS)
+
+    def chat_about_resume(self, resume_content: str, user_message: str, chat_history: List[Dict] = None,
+                          stream: bool = False):
         if chat_history is None:
             chat_history = []
         
@@ -789,11 +1418,14 @@ class GroqLLM:
             {"role": "user", "content": prompt}
         ]
         
-        return self._make_request(messages, max_tokens=1000, temperature=0.7)
+        if stream:
+            return self._make_request_stream(messages, max_tokens=1000, temperature=0.7, feature="chat_about_resume")
+        return self._make_request(messages, max_tokens=1000, temperature=0.7, priority=PRIORITY_INTERACTIVE,
+                                  feature="chat_about_resume")
 
-    def chat_with_resume(self, user_message: str, context: str) -> str:
+    def chat_with_resume(self, user_message: str, context: str, stream: bool = False):
         try:
-            return self.chat_about_resume(context, user_message, chat_history=None)
+            return self.chat_about_resume(context, user_message, chat_history=None, stream=stream)
         except Exception as e:
             return f"I apologize, but I encountered an error while processing your request: {str(e)}. Please try asking your question in a different way."
 
@@ -810,35 +1442,29 @@ class GroqLLM:
         Title: {user_data.get('title', 'Professional')}
         
         Provide analysis:
-        {
+        {{
             "match_percentage": 85,
             "keyword_matches": 12,
             "missing_skills": ["Python", "Docker"],
             "matching_skills": ["JavaScript", "React", "Node.js"],
             "recommendations": ["Highlight your JavaScript experience", "Consider learning Python"]
-        }
+        }}
         """
         
         messages = [
             {"role": "system", "content": "You are an expert job match analyzer. Return only valid JSON."},
             {"role": "user", "content": prompt}        ]
         
-        response = self._make_request(messages, max_tokens=800, temperature=0.3)
-        
-        try:
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start != -1 and json_end != 0:
-                json_str = response[json_start:json_end]
-                return json.loads(json_str)
-        except:
-            return {
-                "match_percentage": 75,
-                "keyword_matches": 8,
-                "missing_skills": ["Review job requirements"],
-                "matching_skills": user_data.get('skills', [])[:5],
-                "recommendations": ["Tailor your resume to match job requirements"]
-            }
+        analysis = self.request_json(messages, max_tokens=800, temperature=0.3, feature="analyze_job_requirements")
+        if analysis is not None:
+            return analysis
+        return {
+            "match_percentage": 75,
+            "keyword_matches": 8,
+            "missing_skills": ["Review job requirements"],
+            "matching_skills": user_data.get('skills', [])[:5],
+            "recommendations": ["Tailor your resume to match job requirements"]
+        }
 
     def parse_resume_data(self, resume_text: str) -> Dict[str, Any]:
         prompt = f"""
@@ -955,20 +1581,16 @@ class GroqLLM:
             {"role": "user", "content": prompt}
         ]
         
-        response = self._make_request(messages, max_tokens=2500, temperature=0.2)
+        # Long resumes can overrun max_tokens; allow two continuations before repairing.
+        parsed_data = self.request_json(messages, max_tokens=2500, temperature=0.2, max_continuations=2,
+                                        feature="parse_resume_data")
         
         try:
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start != -1 and json_end != 0:
-                json_str = response[json_start:json_end]
-                parsed_data = json.loads(json_str)
-                parsed_data = self._validate_and_enhance_parsed_data(parsed_data)
-                
-                return parsed_data
+            if parsed_data is not None:
+                return self._validate_and_enhance_parsed_data(parsed_data)
         except Exception as e:
             print(f"Error parsing resume data with enhanced LLM: {e}")
-            return self._fallback_resume_parsing(resume_text)
+        return self._fallback_resume_parsing(resume_text)
     
     def _validate_and_enhance_parsed_data(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
         try:
@@ -1269,7 +1891,8 @@ class GroqLLM:
         ]
         
         try:
-            response = self._make_request(messages, max_tokens=2500, temperature=0.8)
+            response = self._make_request(messages, max_tokens=2500, temperature=0.8,
+                                          feature="generate_enhanced_portfolio")
             
             json_start = response.find('{')
             json_end = response.rfind('}') + 1
@@ -1360,3 +1983,166 @@ class GroqLLM:
             "education": user_data.get('education', 'Educational background in relevant field'),
             "certifications": user_data.get('certifications', ['Professional Certifications'])
         }
+
+
+class AsyncGroqLLM(GroqLLM):
+    """GroqLLM with non-blocking requests over a shared aiohttp session and concurrent fan-out."""
+
+    def __init__(self, api_key: str, model: str = "llama-3.1-8b-instant",
+                 pool_size: int = 10, http2: bool = False, concurrency: int = 5, **kwargs):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncGroqLLM")
+        super().__init__(api_key, model=model, pool_size=pool_size, http2=http2, **kwargs)
+        self.pool_size = pool_size
+        self.concurrency = concurrency
+        self._sessions: Dict[int, "aiohttp.ClientSession"] = {}
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(id(loop))
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=60)
+            session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+            self._sessions[id(loop)] = session
+        return session
+
+    async def aclose(self):
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(id(loop), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def _make_request_async(self, messages: List[Dict], max_tokens: int = 2000,
+                                  temperature: float = 0.7, timeout: int = 30,
+                                  use_cache: Optional[bool] = None, priority: int = PRIORITY_DEFAULT,
+                                  feature: Optional[str] = None) -> str:
+        feature = feature or UNLABELED_FEATURE
+        models = self.router.models_for(feature)
+        call = self._start_call(feature, models)
+        try:
+            return await self._send_request_async(messages, max_tokens, temperature, timeout,
+                                                  use_cache, priority, call, models)
+        finally:
+            self._finish_call(call)
+
+    async def _send_request_async(self, messages: List[Dict], max_tokens: int, temperature: float,
+                                  timeout: int, use_cache: Optional[bool], priority: int,
+                                  call: Dict[str, Any], models: List[str]) -> str:
+        cached = self._cache_lookup(models[0], messages, max_tokens, temperature, use_cache, call)
+        if cached is not None:
+            return cached
+        
+        payload = {
+            "model": models[0],
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+
+        max_retries = 3
+        retry_delay = 1
+        model_index = 0
+        estimated_tokens = self._estimate_request_tokens(messages, max_tokens)
+        session = self._get_session()
+
+        for attempt in range(max_retries):
+            call["retries"] = attempt
+            model_index = self._available_model_index(models, model_index)
+            self._use_model(call, payload, models, model_index)
+            if not await asyncio.to_thread(self.scheduler.acquire, estimated_tokens, priority,
+                                           model=payload["model"]):
+                call["status"] = "shed"
+                return "❌ Rate limit exceeded. Please try again later."
+            try:
+                sent_at = time.monotonic()
+                async with session.post(self.base_url, json=payload,
+                                        timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    call["status"] = response.status
+                    call["ttfb_ms"] = round((time.monotonic() - sent_at) * 1000, 1)
+                    if response.status == 200:
+                        result = await response.json()
+                        self._record_usage(call, result.get("usage"))
+                        self.scheduler.record_response(response.headers, response.status, estimated_tokens,
+                                                       result.get("usage", {}).get("total_tokens"),
+                                                       model=payload["model"])
+                        content = result["choices"][0]["message"]["content"]
+                        if model_index == 0:
+                            self._cache_store(models[0], messages, max_tokens, temperature, use_cache, content)
+                        return content
+
+                    self.scheduler.record_response(response.headers, response.status, model=payload["model"])
+                    if response.status == 429:
+                        if attempt < max_retries - 1:
+                            model_index = min(model_index + 1, len(models) - 1)
+                            continue
+                        else:
+                            return "❌ Rate limit exceeded. Please try again later."
+                    else:
+                        return f"❌ API Error {response.status}: {await response.text()}"
+
+            except asyncio.TimeoutError:
+                call["status"] = "timeout"
+                if attempt < max_retries - 1:
+                    if model_index < len(models) - 1:
+                        model_index += 1
+                    else:
+                        await asyncio.sleep(retry_delay)
+                    continue
+                else:
+                    return "❌ Request timeout. Please try again."
+            except aiohttp.ClientError as e:
+                call["status"] = "network_error"
+                return f"❌ Network error: {str(e)}"
+            except Exception as e:
+                call["status"] = "error"
+                return f"❌ Unexpected error: {str(e)}"
+
+        return "❌ Failed to get response after multiple attempts."
+
+    async def complete(self, prompt: str, system: str = "You are a helpful assistant.",
+                       max_tokens: int = 1000, temperature: float = 0.7, feature: str = "complete") -> str:
+        messages = [
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt}
+        ]
+        return await self._make_request_async(messages, max_tokens=max_tokens, temperature=temperature,
+                                              feature=feature)
+
+    async def gather(self, requests_: List[Any], concurrency: Optional[int] = None) -> List[str]:
+        """Run prompts concurrently; each item is a prompt string or a dict of complete()/_make_request_async() kwargs.
+
+        Pass "feature" in an item to label its metrics; unlabeled items are recorded as "complete" or "gather".
+
+        Results come back in input order. At most `concurrency` requests are in flight.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def run_one(item):
+            async with semaphore:
+                if isinstance(item, str):
+                    return await self.complete(item)
+                if "messages" in item:
+                    return await self._make_request_async(**{"feature": "gather", **item})
+                return await self.complete(**item)
+
+        return await asyncio.gather(*(run_one(item) for item in requests_))
+
+    async def gather_methods(self, calls: List[tuple], concurrency: Optional[int] = None) -> List[Any]:
+        """Run independent GroqLLM generators, given as (method_name, args, kwargs), side by side in worker threads."""
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def run_one(call):
+            method_name, args, kwargs = (tuple(call) + ((), {}))[:3]
+            async with semaphore:
+                return await asyncio.to_thread(getattr(self, method_name), *args, **kwargs)
+
+        return await asyncio.gather(*(run_one(call) for call in calls))
+
+    def run_sync(self, coro):
+        """Drive a coroutine from synchronous code such as a Streamlit page and release its session afterwards."""
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+        return asyncio.run(runner())
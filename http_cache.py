@@ -0,0 +1,223 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Seconds a stored page is served without asking the server; after that it is revalidated.
+DEFAULT_SOURCE_TTLS = {
+    "www.indeed.com": 15 * 60,
+    "www.glassdoor.com": 30 * 60,
+    "www.linkedin.com": 30 * 60,
+}
+
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control", "Date")
+
+
+class HTTPPageCache:
+    """SQLite store of compressed GET responses with their validators."""
+
+    def __init__(self, path: str, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 10 * 60,
+                 max_age: float = 7 * 24 * 3600, max_entries: int = 2000, compress_level: int = 6):
+        self.path = path
+        self.ttls = dict(DEFAULT_SOURCE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.compress_level = compress_level
+        self._lock = threading.Lock()
+        self._counters = {
+            "requests": 0, "fresh_hits": 0, "revalidations": 0, "revalidated": 0,
+            "misses": 0, "stores": 0, "bytes_saved": 0
+        }
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_size INTEGER NOT NULL,
+                validated_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_validated_at ON pages(validated_at)")
+
+    def ttl_for(self, url: str) -> float:
+        return self.ttls.get(urlparse(url).netloc.lower(), self.default_ttl)
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, size, validated_at FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        status, headers, body, size, validated_at = row
+        age = time.time() - validated_at
+        if age > self.max_age:
+            return None
+        return {
+            "status": status,
+            "headers": json.loads(headers),
+            "body": body,
+            "size": size,
+            "fresh": age <= self.ttl_for(url)
+        }
+
+    def is_fresh(self, url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT validated_at FROM pages WHERE url = ?", (url,)).fetchone()
+        return row is not None and time.time() - row[0] <= self.ttl_for(url)
+
+    def store(self, url: str, response: requests.Response):
+        content = response.content or b""
+        body = zlib.compress(content, self.compress_level)
+        headers = {name: response.headers[name] for name in _STORED_HEADERS if name in response.headers}
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url, status, headers, body, size, stored_size, validated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, response.status_code, json.dumps(headers), body, len(content), len(body), time.time())
+            )
+            self._counters["stores"] += 1
+            count = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM pages WHERE url IN (SELECT url FROM pages ORDER BY validated_at ASC LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+
+    def touch(self, url: str, headers: Dict[str, str]):
+        with self._lock:
+            row = self._conn.execute("SELECT headers FROM pages WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return
+            merged = json.loads(row[0])
+            merged.update({name: headers[name] for name in _STORED_HEADERS if name in headers})
+            self._conn.execute(
+                "UPDATE pages SET headers = ?, validated_at = ? WHERE url = ?",
+                (json.dumps(merged), time.time(), url)
+            )
+
+    def count(self, **increments):
+        with self._lock:
+            for name, value in increments.items():
+                self._counters[name] += value
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM pages")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            entries, size, stored_size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM pages"
+            ).fetchone()
+        counters.update({
+            "entries": entries,
+            "stored_bytes": stored_size,
+            "compression_ratio": round(size / stored_size, 2) if stored_size else None,
+            "revalidation_hit_rate": (round(counters["revalidated"] / counters["revalidations"], 3)
+                                      if counters["revalidations"] else None)
+        })
+        return counters
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """Transport adapter that serves fresh pages from HTTPPageCache and revalidates stale ones.
+
+    Mounted on a requests.Session, so callers keep using session.get. Stale entries are
+    re-requested with If-None-Match/If-Modified-Since, and a 304 is answered from the store.
+    """
+
+    def __init__(self, cache: HTTPPageCache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        url = request.url
+        self.cache.count(requests=1)
+        entry = self.cache.lookup(url)
+        if entry is not None and entry["fresh"]:
+            self.cache.count(fresh_hits=1, bytes_saved=entry["size"])
+            return self._cached_response(request, entry, "HIT")
+
+        if entry is not None:
+            etag = entry["headers"].get("ETag")
+            last_modified = entry["headers"].get("Last-Modified")
+            if etag:
+                request.headers["If-None-Match"] = etag
+            if last_modified:
+                request.headers["If-Modified-Since"] = last_modified
+            if etag or last_modified:
+                self.cache.count(revalidations=1)
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(url, response.headers)
+            self.cache.count(revalidated=1, bytes_saved=max(0, entry["size"] - len(response.content or b"")))
+            return self._cached_response(request, entry, "REVALIDATED")
+
+        self.cache.count(misses=1)
+        if response.status_code == 200 and "no-store" not in response.headers.get("Cache-Control", ""):
+            self.cache.store(url, response)
+        return response
+
+    def _cached_response(self, request, entry: Dict[str, Any], state: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.headers["X-Cache"] = state
+        response._content = zlib.decompress(entry["body"])
+        response.url = request.url
+        response.request = request
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+
+_PAGE_CACHES: Dict[str, HTTPPageCache] = {}
+_PAGE_CACHES_LOCK = threading.Lock()
+
+
+def default_page_cache_path() -> str:
+    path = os.getenv("SCRAPER_CACHE_PATH")
+    return os.path.expanduser(path) if path else os.path.join(
+        os.path.expanduser("~"), ".cache", "resumate", "page_cache.sqlite3"
+    )
+
+
+def get_shared_page_cache(path: Optional[str] = None, **kwargs) -> Optional[HTTPPageCache]:
+    """Return the process-wide page cache, or None when SCRAPER_CACHE_DISABLED is set."""
+    if os.getenv("SCRAPER_CACHE_DISABLED", "").lower() in ("1", "true", "yes"):
+        return None
+    path = path or default_page_cache_path()
+    with _PAGE_CACHES_LOCK:
+        cache = _PAGE_CACHES.get(path)
+        if cache is None:
+            try:
+                cache = HTTPPageCache(path, **kwargs)
+            except (sqlite3.Error, OSError) as e:
+                print(f"Warning: scraper page cache unavailable at {path}: {e}")
+                return None
+            _PAGE_CACHES[path] = cache
+        return cache
@@ -0,0 +1,216 @@
+import argparse
+import itertools
+import json
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import schedule
+
+from job_index import JobIndex, get_shared_job_index, query_key
+from job_scraper import JobScraper
+
+logger = logging.getLogger(__name__)
+
+
+class SourceBackoff:
+    """Exponential backoff per job source after failed crawls."""
+
+    def __init__(self, base: float = 60.0, maximum: float = 3600.0):
+        self.base = base
+        self.maximum = maximum
+        self._failures = defaultdict(int)
+        self._until = {}
+        self._lock = threading.Lock()
+
+    def available(self, source: str) -> bool:
+        with self._lock:
+            return time.monotonic() >= self._until.get(source, 0.0)
+
+    def record(self, source: str, ok: bool):
+        with self._lock:
+            if ok:
+                self._failures[source] = 0
+                self._until.pop(source, None)
+                return
+            self._failures[source] += 1
+            delay = min(self.maximum, self.base * 2 ** (self._failures[source] - 1))
+            self._until[source] = time.monotonic() + delay
+
+    def remaining(self) -> Dict[str, float]:
+        now = time.monotonic()
+        with self._lock:
+            return {source: round(until - now, 1) for source, until in self._until.items() if until > now}
+
+
+class JobCrawler:
+    """Keeps the most-searched keyword/location pairs warm in the job index.
+
+    Popular queries are learned from JobSearcher traffic recorded in the index. A planning
+    job queues the ones whose data is stale, and a crawl job refreshes them one at a time,
+    skipping sources that are backing off. Searches run with fallbacks off, so a board that
+    cannot be scraped yields nothing rather than canned or LLM-generated listings, and the
+    crawler never spends LLM calls.
+    """
+
+    def __init__(self, scraper: Optional[JobScraper] = None, index: Optional[JobIndex] = None,
+                 top_n: int = 20, limit: int = 30, refresh_after: Optional[float] = None,
+                 sources: Optional[List[str]] = None, backoff: Optional[SourceBackoff] = None):
+        self.index = index or get_shared_job_index()
+        if self.index is None:
+            raise ValueError("JobCrawler needs a job index; unset JOB_INDEX_DISABLED")
+        self.scraper = scraper or JobScraper()
+        self.top_n = top_n
+        self.limit = limit
+        self.refresh_after = self.index.refresh_after if refresh_after is None else refresh_after
+        self.sources = list(sources or JobScraper.PAGED_SOURCES)
+        self.backoff = backoff or SourceBackoff()
+        self.scheduler = schedule.Scheduler()
+
+        self._queue = queue.PriorityQueue()
+        self._queued = set()
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._counters = {"planned": 0, "crawls": 0, "deferred": 0, "jobs_indexed": 0, "new_jobs": 0}
+        self._source_attempts = defaultdict(int)
+        self._source_successes = defaultdict(int)
+
+    def plan(self) -> int:
+        """Queue popular queries whose indexed data is older than refresh_after."""
+        now = time.time()
+        added = 0
+        for query in self.index.popular_queries(self.top_n):
+            refreshed_at = query["refreshed_at"]
+            if refreshed_at is not None and now - refreshed_at < self.refresh_after:
+                continue
+            key = query_key(query["keywords"], query["location"])
+            with self._lock:
+                if key in self._queued:
+                    continue
+                self._queued.add(key)
+            self._queue.put((-query["hits"], next(self._sequence), key, query["keywords"], query["location"]))
+            added += 1
+        with self._lock:
+            self._counters["planned"] += added
+        return added
+
+    def crawl_next(self) -> bool:
+        """Refresh the most popular queued query; False if nothing was crawled.
+
+        The query is marked refreshed only when at least one job was actually scraped, so a
+        crawl that found nothing is retried on the next planning pass.
+        """
+        try:
+            item = self._queue.get_nowait()
+        except queue.Empty:
+            return False
+        _, _, key, keywords, location = item
+
+        sources = [source for source in self.sources if self.backoff.available(source)]
+        if not sources:
+            self._queue.put(item)
+            with self._lock:
+                self._counters["deferred"] += 1
+            return False
+
+        try:
+            jobs = self.scraper.aggregate_job_search(keywords, location, self.limit, sources=sources,
+                                                     fallback=False)
+            for source, meta in getattr(jobs, "metadata", {}).get("sources", {}).items():
+                self._record_source(source, meta)
+            if jobs:
+                new = self.index.upsert(jobs)
+                with self._lock:
+                    self._counters["jobs_indexed"] += len(jobs)
+                    self._counters["new_jobs"] += new
+                self.index.mark_refreshed(keywords, location, len(jobs))
+            logger.info(f"Crawled '{keywords}' ({location or 'any location'}): {len(jobs)} jobs")
+        except Exception as e:
+            logger.error(f"Crawl failed for '{keywords}': {e}")
+        finally:
+            with self._lock:
+                self._queued.discard(key)
+                self._counters["crawls"] += 1
+        return True
+
+    def _record_source(self, source: str, meta: Dict[str, Any]):
+        # Fallbacks are off, so a source that fetched no pages could not be scraped.
+        ok = meta.get("status") in ("ok", "stopped") and meta.get("pages", 0) > 0
+        self.backoff.record(source, ok)
+        with self._lock:
+            self._source_attempts[source] += 1
+            self._source_successes[source] += 1 if ok else 0
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        lags = []
+        for query in self.index.popular_queries(self.top_n):
+            since = query["refreshed_at"] or query["last_requested"]
+            lags.append(now - since)
+        with self._lock:
+            stats = dict(self._counters)
+            success_rate = {
+                source: round(self._source_successes[source] / attempts, 3)
+                for source, attempts in self._source_attempts.items() if attempts
+            }
+        stats.update({
+            "queue_depth": self._queue.qsize(),
+            "crawl_lag_max_s": round(max(lags), 1) if lags else None,
+            "crawl_lag_avg_s": round(sum(lags) / len(lags), 1) if lags else None,
+            "source_success_rate": success_rate,
+            "source_backoff_s": self.backoff.remaining()
+        })
+        return stats
+
+    def schedule_jobs(self, plan_every_minutes: int = 10, crawl_every_seconds: int = 15,
+                      report_every_minutes: int = 5):
+        self.scheduler.every(plan_every_minutes).minutes.do(self.plan)
+        self.scheduler.every(crawl_every_seconds).seconds.do(self.crawl_next)
+        self.scheduler.every(report_every_minutes).minutes.do(
+            lambda: logger.info(f"Crawler stats: {json.dumps(self.stats())}")
+        )
+
+    def run_forever(self, **schedule_kwargs):
+        if not self.scheduler.jobs:
+            self.schedule_jobs(**schedule_kwargs)
+        self.plan()
+        while not self._stop.is_set():
+            self.scheduler.run_pending()
+            self._stop.wait(1)
+
+    def start(self, **schedule_kwargs) -> threading.Thread:
+        """Run the crawler on a daemon thread inside the current process."""
+        self._thread = threading.Thread(target=self.run_forever, kwargs=schedule_kwargs,
+                                        daemon=True, name="job-crawler")
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep popular job searches warm in the local job index.")
+    parser.add_argument("--top", type=int, default=20, help="number of popular queries to keep warm")
+    parser.add_argument("--limit", type=int, default=30, help="jobs to fetch per query")
+    parser.add_argument("--plan-every", type=int, default=10, help="minutes between planning passes")
+    parser.add_argument("--crawl-every", type=int, default=15, help="seconds between crawls")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    crawler = JobCrawler(top_n=args.top, limit=args.limit)
+    try:
+        crawler.run_forever(plan_every_minutes=args.plan_every, crawl_every_seconds=args.crawl_every)
+    except KeyboardInterrupt:
+        logger.info(f"Crawler stopped: {json.dumps(crawler.stats())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import hashlib
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_BIN_RANGE = 1 << 48
+_EMPTY_BIN = 1 << 64
+_COMPANY_SUFFIXES = {"inc", "llc", "ltd", "corp", "corporation", "co", "company", "plc", "gmbh", "limited"}
+
+
+# "+", "#" and "." stay in tokens so "c++", "c#", ".net" and "node.js" don't collapse to "c", "net" or
+# "node js"; a dot ending a token is sentence or abbreviation punctuation and is trimmed.
+_TOKEN = re.compile(r"[\w+#.]+")
+
+
+def normalize_text(value: Any) -> str:
+    tokens = (token.rstrip(".") for token in _TOKEN.findall(str(value or "").lower()))
+    return " ".join(token for token in tokens if token)
+
+
+def job_fingerprint(job: Dict) -> str:
+    """Same job from any source, search or process maps to the same fingerprint."""
+    basis = "|".join(normalize_text(job.get(field)) for field in ("title", "company", "location"))
+    return hashlib.sha1(basis.encode("utf-8")).hexdigest()
+
+
+def job_id(prefix: str, job: Dict) -> str:
+    return f"{prefix}_{job_fingerprint(job)[:16]}"
+
+
+def normalize_company(value: Any) -> str:
+    return " ".join(token for token in normalize_text(value).split() if token not in _COMPANY_SUFFIXES)
+
+
+def _token_overlap(a: str, b: str) -> float:
+    a_tokens, b_tokens = set(a.split()), set(b.split())
+    if not a_tokens or not b_tokens:
+        return 0.0
+    return len(a_tokens & b_tokens) / len(a_tokens | b_tokens)
+
+
+def merge_duplicate(kept: Dict, duplicate: Dict) -> Dict:
+    """Fold a near-duplicate posting into the one already kept."""
+    entry = {"source": duplicate.get("source"), "url": duplicate.get("url")}
+    if entry["source"] != kept.get("source") and entry not in kept.get("also_listed", []):
+        kept.setdefault("also_listed", []).append(entry)
+    for field, value in duplicate.items():
+        if value and not kept.get(field):
+            kept[field] = value
+    return kept
+
+
+class NearDuplicateIndex:
+    """MinHash/LSH index that finds the same posting listed under different sources.
+
+    Each description is shingled into word n-grams and reduced to a MinHash signature with
+    one-permutation hashing (one hash per shingle, binned), so signing costs O(shingles).
+    Signatures are split into bands and only jobs sharing a band bucket are compared, so
+    indexing n jobs is roughly linear instead of pairwise. Candidates must also agree on
+    company and mostly on title before they count as duplicates.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.7,
+                 shingle_size: int = 3, title_overlap: float = 0.5):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.title_overlap = title_overlap
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [defaultdict(list) for _ in range(bands)]
+        self._jobs: List[Dict] = []
+        self._signatures: List[Tuple[int, ...]] = []
+        self._by_fingerprint: Dict[str, int] = {}
+
+    def shingles(self, job: Dict) -> set:
+        words = normalize_text(job.get("description")).split()
+        if len(words) < self.shingle_size:
+            words = normalize_text(f"{job.get('title', '')} {job.get('company', '')}").split()
+        if len(words) < self.shingle_size:
+            return {" ".join(words)} if words else set()
+        return {" ".join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+
+    def signature(self, job: Dict) -> Tuple[int, ...]:
+        bins = [_EMPTY_BIN] * self.num_perm
+        for shingle in self.shingles(job):
+            value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+            position, rank = divmod(value, _BIN_RANGE)
+            position %= self.num_perm
+            if rank < bins[position]:
+                bins[position] = rank
+        # Densify: an empty bin borrows the next filled bin's value so sparse texts still band.
+        if _EMPTY_BIN in bins and any(rank != _EMPTY_BIN for rank in bins):
+            for position in range(self.num_perm):
+                offset = 1
+                while bins[position] == _EMPTY_BIN:
+                    borrowed = bins[(position + offset) % self.num_perm]
+                    if borrowed != _EMPTY_BIN:
+                        bins[position] = borrowed + offset * _BIN_RANGE
+                    offset += 1
+        return tuple(bins)
+
+    def _bands_of(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def similarity(self, first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+        return sum(1 for a, b in zip(first, second) if a == b) / self.num_perm
+
+    def find(self, job: Dict, signature: Optional[Tuple[int, ...]] = None) -> Optional[Dict]:
+        """The already indexed job this one duplicates, if any."""
+        exact = self._by_fingerprint.get(job_fingerprint(job))
+        if exact is not None:
+            return self._jobs[exact]
+
+        signature = signature or self.signature(job)
+        company = normalize_company(job.get("company"))
+        title = normalize_text(job.get("title"))
+        checked = set()
+        for band, key in self._bands_of(signature):
+            for position in self._buckets[band].get(key, ()):
+                if position in checked:
+                    continue
+                checked.add(position)
+                candidate = self._jobs[position]
+                if (normalize_company(candidate.get("company")) == company
+                        and _token_overlap(normalize_text(candidate.get("title")), title) >= self.title_overlap
+                        and self.similarity(signature, self._signatures[position]) >= self.threshold):
+                    return candidate
+        return None
+
+    def add(self, job: Dict, signature: Optional[Tuple[int, ...]] = None):
+        signature = signature or self.signature(job)
+        position = len(self._jobs)
+        self._jobs.append(job)
+        self._signatures.append(signature)
+        self._by_fingerprint.setdefault(job_fingerprint(job), position)
+        for band, key in self._bands_of(signature):
+            self._buckets[band][key].append(position)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+
+def dedupe_jobs(jobs: Iterable[Dict], **kwargs) -> List[Dict]:
+    """Drop exact and near-duplicate postings, keeping the first and merging the rest into it."""
+    index = NearDuplicateIndex(**kwargs)
+    unique = []
+    for job in jobs:
+        signature = index.signature(job)
+        kept = index.find(job, signature)
+        if kept is not None:
+            merge_duplicate(kept, job)
+            continue
+        index.add(job, signature)
+        unique.append(job)
+    return unique
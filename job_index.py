@@ -0,0 +1,239 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from job_identity import job_fingerprint, normalize_text
+from posting_dates import DEFAULT_AGE_BUCKETS, age_buckets, ensure_posted_at
+
+
+def query_key(keywords: str, location: str = "") -> str:
+    return f"{' '.join(sorted(set(normalize_text(keywords).split())))}|{normalize_text(location)}"
+
+
+class JobIndex:
+    """Persistent SQLite store of every job seen, with an FTS5 index for instant local search."""
+
+    def __init__(self, path: str, refresh_after: float = 6 * 3600, max_job_age: float = 30 * 24 * 3600):
+        self.path = path
+        self.refresh_after = refresh_after
+        self.max_job_age = max_job_age
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_key TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                source TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs(last_seen);
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                job_key UNINDEXED, title, company, location, description, skills
+            );
+            CREATE TABLE IF NOT EXISTS queries (
+                query_key TEXT PRIMARY KEY,
+                refreshed_at REAL,
+                result_count INTEGER NOT NULL DEFAULT 0
+            );
+        """)
+        self._add_columns("queries", (("keywords", "TEXT"), ("location", "TEXT"),
+                                      ("hits", "INTEGER NOT NULL DEFAULT 0"), ("last_requested", "REAL")))
+        self._add_columns("jobs", (("posted_at", "REAL"),))
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_posted_at ON jobs(posted_at)")
+    
+    def _add_columns(self, table: str, columns):
+        existing = {row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+        for column, ddl in columns:
+            if column not in existing:
+                self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+
+    def upsert(self, jobs: List[Dict]) -> int:
+        """Insert new jobs and refresh last_seen on known ones; returns how many were new."""
+        now = time.time()
+        new = 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for job in jobs:
+                    key = job_fingerprint(job)
+                    row = self._conn.execute("SELECT first_seen FROM jobs WHERE job_key = ?", (key,)).fetchone()
+                    first_seen = row[0] if row else now
+                    new += 0 if row else 1
+                    posted_at = ensure_posted_at(job)
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO jobs (job_key, data, source, first_seen, last_seen, posted_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, json.dumps(job, ensure_ascii=False, default=str), job.get("source"),
+                         first_seen, now, posted_at)
+                    )
+                    self._conn.execute("DELETE FROM jobs_fts WHERE job_key = ?", (key,))
+                    self._conn.execute(
+                        "INSERT INTO jobs_fts (job_key, title, company, location, description, skills) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, job.get("title", ""), job.get("company", ""), job.get("location", ""),
+                         job.get("description", ""), " ".join(str(s) for s in job.get("skills", []) or []))
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return new
+
+    def search(self, keywords: str, location: str = "", limit: int = 20,
+               posted_within: Optional[float] = None) -> List[Dict]:
+        """Best-matching recent jobs that contain every keyword, padded with any-keyword matches.
+        
+        Jobs matching only some keywords are used only to fill out a result that has at least
+        one full match; when no job has every keyword the query is a miss, so the caller
+        scrapes instead of showing unrelated jobs. `posted_within` (seconds) keeps only jobs
+        posted that recently.
+        """
+        terms = normalize_text(keywords).split()
+        if not terms:
+            return []
+        location_terms = normalize_text(location).split()
+        location_filter = ""
+        if location_terms and location_terms != ["remote"]:
+            location_filter = " AND location : (" + " ".join(f'"{t}"*' for t in location_terms) + ")"
+
+        results, seen = [], set()
+        for joiner in (" AND ", " OR "):
+            match = "(" + joiner.join(f'"{t}"*' for t in terms) + ")" + location_filter
+            for job in self._query(match, limit, posted_within):
+                if job["job_key"] not in seen:
+                    seen.add(job["job_key"])
+                    results.append(job)
+            if not results or len(results) >= limit or len(terms) == 1:
+                break
+        return results[:limit]
+
+    def _query(self, match: str, limit: int, posted_within: Optional[float] = None) -> List[Dict]:
+        now = time.time()
+        posted_after = now - posted_within if posted_within else 0
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT jobs.job_key, jobs.data, jobs.first_seen, jobs.last_seen
+                FROM jobs_fts JOIN jobs ON jobs.job_key = jobs_fts.job_key
+                WHERE jobs_fts MATCH ? AND jobs.last_seen >= ? AND COALESCE(jobs.posted_at, jobs.first_seen) >= ?
+                ORDER BY bm25(jobs_fts, 0, 10.0, 4.0, 2.0, 1.0, 3.0), jobs.posted_at DESC
+                LIMIT ?
+            """, (match, now - self.max_job_age, posted_after, limit)).fetchall()
+
+        jobs = []
+        for key, data, first_seen, last_seen in rows:
+            job = json.loads(data)
+            job.update({
+                "job_key": key,
+                "first_seen": datetime.fromtimestamp(first_seen).isoformat(timespec="seconds"),
+                "last_seen": datetime.fromtimestamp(last_seen).isoformat(timespec="seconds")
+            })
+            jobs.append(job)
+        return jobs
+
+    def mark_refreshed(self, keywords: str, location: str, result_count: int):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO queries (query_key, keywords, location, refreshed_at, result_count) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(query_key) DO UPDATE SET "
+                "refreshed_at = excluded.refreshed_at, result_count = excluded.result_count",
+                (query_key(keywords, location), keywords, location, time.time(), result_count)
+            )
+
+    def record_search(self, keywords: str, location: str = ""):
+        """Count a user search so the crawler can learn which queries to keep warm."""
+        if not normalize_text(keywords):
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO queries (query_key, keywords, location, hits, last_requested) VALUES (?, ?, ?, 1, ?) "
+                "ON CONFLICT(query_key) DO UPDATE SET hits = hits + 1, last_requested = excluded.last_requested",
+                (query_key(keywords, location), keywords, location, time.time())
+            )
+
+    def popular_queries(self, limit: int = 20, window: float = 7 * 24 * 3600) -> List[Dict[str, Any]]:
+        """Most-searched queries requested within `window`, with when each was last refreshed."""
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT keywords, location, hits, last_requested, refreshed_at FROM queries
+                WHERE hits > 0 AND last_requested >= ?
+                ORDER BY hits DESC, last_requested DESC LIMIT ?
+            """, (time.time() - window, limit)).fetchall()
+        return [
+            {"keywords": k, "location": l or "", "hits": h, "last_requested": r, "refreshed_at": f}
+            for k, l, h, r, f in rows
+        ]
+
+    def refreshed_at(self, keywords: str, location: str = "") -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT refreshed_at FROM queries WHERE query_key = ?", (query_key(keywords, location),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_stale(self, keywords: str, location: str = "") -> bool:
+        refreshed_at = self.refreshed_at(keywords, location)
+        return refreshed_at is None or time.time() - refreshed_at > self.refresh_after
+
+    def prune(self) -> int:
+        """Drop jobs not seen within max_job_age."""
+        cutoff = time.time() - self.max_job_age
+        with self._lock:
+            keys = [row[0] for row in self._conn.execute("SELECT job_key FROM jobs WHERE last_seen < ?", (cutoff,))]
+            self._conn.executemany("DELETE FROM jobs_fts WHERE job_key = ?", [(k,) for k in keys])
+            self._conn.executemany("DELETE FROM jobs WHERE job_key = ?", [(k,) for k in keys])
+        return len(keys)
+
+    def posting_age_buckets(self, edges_days=DEFAULT_AGE_BUCKETS) -> Dict[str, int]:
+        """How many live jobs fall in each posting-age bucket."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT COALESCE(posted_at, first_seen) FROM jobs WHERE last_seen >= ?",
+                (time.time() - self.max_job_age,)
+            ).fetchall()
+        return age_buckets((row[0] for row in rows), edges_days)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            jobs, oldest, newest = self._conn.execute(
+                "SELECT COUNT(*), MIN(first_seen), MAX(last_seen) FROM jobs"
+            ).fetchone()
+            queries = self._conn.execute("SELECT COUNT(*) FROM queries").fetchone()[0]
+        return {"jobs": jobs, "queries": queries, "oldest_first_seen": oldest, "newest_last_seen": newest}
+
+
+_INDEXES: Dict[str, JobIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def default_index_path() -> str:
+    path = os.getenv("JOB_INDEX_PATH")
+    return os.path.expanduser(path) if path else os.path.join(
+        os.path.expanduser("~"), ".cache", "resumate", "job_index.sqlite3"
+    )
+
+
+def get_shared_job_index(path: Optional[str] = None, **kwargs) -> Optional[JobIndex]:
+    """Return the process-wide job index, or None when JOB_INDEX_DISABLED is set or FTS5 is missing."""
+    if os.getenv("JOB_INDEX_DISABLED", "").lower() in ("1", "true", "yes"):
+        return None
+    path = path or default_index_path()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(path)
+        if index is None:
+            try:
+                index = JobIndex(path, **kwargs)
+            except (sqlite3.Error, OSError) as e:
+                print(f"Warning: job index unavailable at {path}: {e}")
+                return None
+            _INDEXES[path] = index
+        return index
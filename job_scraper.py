@@ -1,34 +1,136 @@
 import requests
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import importlib.util
 import json
 import time
 import random
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
+from datetime import datetime
 from urllib.parse import urlencode, quote_plus
 import logging
 import re
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, zip_longest
+from http_cache import CachingHTTPAdapter, HTTPPageCache, get_shared_page_cache
+from job_identity import NearDuplicateIndex, job_id, merge_duplicate
+from politeness import HostPolitenessScheduler, get_shared_politeness
+from posting_dates import ensure_posted_at, parse_posted_at, response_time
+from skill_matcher import get_skill_matcher
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# Per-source selectors. Only elements matching a card spec (tag, attribute, value or None
+# for "present") are built into the tree; specs are tried in order and the first that
+# finds cards wins. Field selectors are CSS tried in order, '@attr' reads an attribute.
+JOB_CARD_SELECTORS = {
+    'indeed': {
+        'cards': [('div', 'class', 'job_seen_beacon'), ('a', 'data-jk', None)],
+        'fields': {
+            'title': ['span[title]@title', 'h2.jobTitle'],
+            'company': ['span.companyName', 'a[data-testid="company-name"]'],
+            'location': ['div[data-testid="job-location"]', 'div.companyLocation'],
+            'link': ['a[href]@href'],
+            'salary': ['span.salary-snippet', 'span[data-testid="attribute_snippet_testid"]'],
+            'description': ['div.job-snippet', 'ul.jobsearch-jobDescriptionText'],
+            'posted': ['span.date', 'span[data-testid="myJobsStateDate"]']
+        }
+    },
+    'glassdoor': {
+        'cards': [('li', 'class', 'react-job-listing'), ('article', 'class', 'jobContainer')],
+        'fields': {
+            'title': ['a.jobTitle', 'a[data-test="job-title"]'],
+            'company': ['span.employerName', 'div.jobHeader'],
+            'location': ['span.loc', 'div.jobLocation'],
+            'salary': ['span.salaryText', 'div.jobSalary'],
+            'link': ['a.jobTitle@href', 'a[data-test="job-title"]@href', 'a[href]@href'],
+            'posted': ['div[data-test="job-age"]', 'div.listing-age']
+        }
+    }
+}
+
+
+def card_strainer(spec) -> SoupStrainer:
+    tag, attribute, value = spec
+    if value is None:
+        return SoupStrainer(tag, attrs={attribute: True})
+    # Attributes are not yet split into class lists while the strainer runs, so match a whole word.
+    return SoupStrainer(tag, attrs={attribute: re.compile(rf'(^|\s){re.escape(value)}(\s|$)')})
+
+
+def parse_job_cards(source: str, html: bytes) -> List:
+    """Parse only the job-card subtrees of a results page."""
+    for spec in JOB_CARD_SELECTORS[source]['cards']:
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=card_strainer(spec))
+        cards = [element for element in soup.contents if getattr(element, 'name', None) == spec[0]]
+        if cards:
+            return cards
+    return []
+
+
+def extract_card_fields(source: str, card) -> Dict[str, Optional[str]]:
+    fields = {}
+    for field, selectors in JOB_CARD_SELECTORS[source]['fields'].items():
+        fields[field] = None
+        for selector in selectors:
+            css, _, attribute = selector.partition('@')
+            element = card.select_one(css)
+            if element is None:
+                continue
+            value = element.get(attribute) if attribute else element.get_text(strip=True)
+            if value:
+                fields[field] = value
+                break
+    return fields
+
+def is_fallback_job(job: Dict) -> bool:
+    """True for listings generated when a board could not be scraped (canned or AI-written)."""
+    return str(job.get('source', '')).endswith('_fallback')
+
+class JobSearchResult(list):
+    """Jobs returned by aggregate_job_search, with per-source timing and outcome in `metadata`."""
+    
+    def __init__(self, jobs=(), metadata: Optional[Dict] = None):
+        super().__init__(jobs)
+        self.metadata = metadata or {}
+
+
 class JobScraper:
-    def __init__(self):
+    SOURCES = ('indeed', 'linkedin', 'glassdoor')
+    PAGED_SOURCES = ('indeed', 'glassdoor')
+    PAGE_SIZE = 50
+    MAX_PAGES = 5
+    SOURCE_TIMEOUT = 12.0
+    OVERALL_TIMEOUT = 20.0
+    
+    def __init__(self, politeness: Optional[HostPolitenessScheduler] = None,
+                 http_cache: Optional[HTTPPageCache] = None):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
-        self.rate_limit_delay = 1  
+        self.http_cache = http_cache or get_shared_page_cache()
+        if self.http_cache is not None:
+            adapter = CachingHTTPAdapter(self.http_cache)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+        self.politeness = politeness or get_shared_politeness()
+        self._executors = {}
+        self._executor_lock = threading.Lock()
         self.ai_data_service = None
         try:
             import os
             from dotenv import load_dotenv
-            from ai_data_service import AIDataService
+            from ai_data_service import get_shared_ai_data_service
             load_dotenv()
             api_key = os.getenv("GROQ_API_KEY")
             if api_key:
-                self.ai_data_service = AIDataService(api_key)
+                self.ai_data_service = get_shared_ai_data_service(api_key)
                 logger.info("✅ AI data service initialized for job scraper fallback")
             else:
                 logger.warning("⚠️ No GROQ_API_KEY found for AI data service")
@@ -36,83 +138,53 @@ class JobScraper:
             logger.warning(f"⚠️ Could not initialize AI data service: {e}")
             self.ai_data_service = None
         
-    def _make_request(self, url: str, params: Dict = None) -> Optional[BeautifulSoup]:
+    def _make_request(self, url: str, params: Dict = None) -> Optional[requests.Response]:
         try:
-            time.sleep(self.rate_limit_delay + random.uniform(0.5, 1.5))
+            # Pages the cache can serve without asking the host do not need a politeness slot.
+            full_url = requests.Request('GET', url, params=params).prepare().url
+            cached = self.http_cache is not None and self.http_cache.is_fresh(full_url)
+            if not cached and not self.politeness.acquire(url):
+                logger.warning(f"Skipping {url}: host is backing off")
+                return None
             
             response = self.session.get(url, params=params, timeout=10)
+            self.politeness.record_response(url, response.status_code, response.headers)
             response.raise_for_status()
             
-            return BeautifulSoup(response.content, 'html.parser')
+            return response
             
         except requests.RequestException as e:
             logger.error(f"Request failed for {url}: {str(e)}")
             return None
     
+    def http_cache_stats(self) -> Dict:
+        """Bytes saved, revalidation hit rate and store size of the scraper's page cache."""
+        return self.http_cache.stats() if self.http_cache else {}
+    
     def search_indeed_jobs(self, keywords: str, location: str = "", limit: int = 20) -> List[Dict]:
-        jobs = []
-        
-        try:
-            base_url = "https://www.indeed.com/jobs"
-            params = {
-                'q': keywords,
-                'l': location,
-                'sort': 'date', 
-                'limit': min(limit, 50)
-            }
-            
-            soup = self._make_request(base_url, params)
-            if not soup:
-                return self._fallback_indeed_jobs(keywords, location, limit)
-            
-            job_cards = soup.find_all('div', class_='job_seen_beacon') or soup.find_all('a', {'data-jk': True})
-            
-            for i, card in enumerate(job_cards[:limit]):
-                try:
-                    job = self._parse_indeed_job(card, keywords, location)
-                    if job:
-                        jobs.append(job)
-                except Exception as e:
-                    logger.error(f"Error parsing Indeed job {i}: {str(e)}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Error scraping Indeed: {str(e)}")
-            return self._fallback_indeed_jobs(keywords, location, limit)
-        
-        return jobs[:limit]
+        return list(self.iter_jobs('indeed', keywords, location, fallback_limit=limit, limit=limit))
     
-    def _parse_indeed_job(self, card, keywords: str, location: str) -> Optional[Dict]:
+    def _parse_indeed_job(self, card, keywords: str, location: str, fetched_at: float) -> Optional[Dict]:
         try:
-            title_elem = card.find('span', {'title': True}) or card.find('h2', class_='jobTitle')
-            title = title_elem.get('title', '') if title_elem else keywords + ' Developer'
-            
-            company_elem = card.find('span', class_='companyName') or card.find('a', {'data-testid': 'company-name'})
-            company = company_elem.get_text(strip=True) if company_elem else 'Tech Company'
-            
-            location_elem = card.find('div', {'data-testid': 'job-location'}) or card.find('div', class_='companyLocation')
-            job_location = location_elem.get_text(strip=True) if location_elem else location or 'Remote'
-            
-            link_elem = card.find('a', href=True)
-            job_url = f"https://www.indeed.com{link_elem['href']}" if link_elem and link_elem['href'].startswith('/') else '#'
-            
-            salary_elem = card.find('span', class_='salary-snippet') or card.find('span', {'data-testid': 'attribute_snippet_testid'})
-            salary = salary_elem.get_text(strip=True) if salary_elem else 'Competitive salary'
-            
-            snippet_elem = card.find('div', class_='job-snippet') or card.find('ul', class_='jobsearch-jobDescriptionText')
-            description = snippet_elem.get_text(strip=True) if snippet_elem else f'Exciting {keywords} opportunity with growth potential.'
-            
-            date_elem = card.find('span', class_='date') or card.find('span', {'data-testid': 'myJobsStateDate'})
-            posted_date = self._parse_posting_date(date_elem.get_text(strip=True) if date_elem else 'Recently')
+            fields = extract_card_fields('indeed', card)
+            title = fields['title'] or keywords + ' Developer'
+            company = fields['company'] or 'Tech Company'
+            job_location = fields['location'] or location or 'Remote'
+            link = fields['link']
+            job_url = f"https://www.indeed.com{link}" if link and link.startswith('/') else '#'
+            salary = fields['salary'] or 'Competitive salary'
+            description = fields['description'] or f'Exciting {keywords} opportunity with growth potential.'
+            # A card without an age is left undated rather than given a made-up one.
+            posted_date = self._parse_posting_date(fields['posted']) if fields['posted'] else 'Unknown'
             
             return {
-                'id': f'indeed_{hash(title + company)}',
                 'title': title,
                 'company': company,
                 'location': job_location,
                 'description': description,
                 'employment_type': self._detect_employment_type(title, description),
                 'posted_date': posted_date,
+                'posted_at': parse_posted_at(fields['posted'], fetched_at),
                 'url': job_url,
                 'application_url': job_url,
                 'salary_range': salary,
@@ -130,81 +202,153 @@ class JobScraper:
         jobs = []
         
         try:
-            jobs = self._fallback_linkedin_jobs(keywords, location, limit)
+            jobs = self._source_fallback('linkedin', keywords, location, limit)
             
         except Exception as e:
             logger.error(f"Error scraping LinkedIn: {str(e)}")
-            jobs = self._fallback_linkedin_jobs(keywords, location, limit)
+            jobs = self._source_fallback('linkedin', keywords, location, limit)
         
         return jobs[:limit]
     
     def search_glassdoor_jobs(self, keywords: str, location: str = "", limit: int = 20) -> List[Dict]:
-        jobs = []
+        return list(self.iter_jobs('glassdoor', keywords, location, fallback_limit=limit, limit=limit))
+    
+    def _page_request(self, source: str, keywords: str, location: str, page: int):
+        if source == 'indeed':
+            return "https://www.indeed.com/jobs", {
+                'q': keywords,
+                'l': location,
+                'sort': 'date',
+                'limit': self.PAGE_SIZE,
+                'start': page * self.PAGE_SIZE
+            }
         
+        params = {
+            'sc.keyword': keywords,
+            'locT': 'C',
+            'locId': '1147401',  
+            'jobType': 'all',
+            'fromAge': 1,  
+            'minSalary': 0,
+            'includeNoSalaryJobs': 'true',
+            'radius': 25
+        }
+        if location:
+            params['locKeyword'] = location
+        if page:
+            params['p'] = page + 1
+        return "https://www.glassdoor.com/Job/jobs.htm", params
+    
+    def _fetch_page(self, source: str, keywords: str, location: str, page: int) -> Optional[Tuple[bytes, float]]:
+        """Page body and when it was fetched (a cached page keeps its original Date)."""
+        url, params = self._page_request(source, keywords, location, page)
+        response = self._make_request(url, params)
+        if response is None:
+            return None
+        return response.content, response_time(response.headers)
+    
+    def _parse_page(self, source: str, html: bytes, keywords: str, location: str, fetched_at: float) -> List[Dict]:
+        parse_card = self._parse_indeed_job if source == 'indeed' else self._parse_glassdoor_job
+        jobs = []
+        for i, card in enumerate(parse_job_cards(source, html)):
+            try:
+                job = parse_card(card, keywords, location, fetched_at)
+                if job:
+                    job['id'] = job_id(source, job)
+                    ensure_posted_at(job, fetched_at)
+                    jobs.append(job)
+            except Exception as e:
+                logger.error(f"Error parsing {source.title()} job {i}: {str(e)}")
+        return jobs
+    
+    def _source_fallback(self, source: str, keywords: str, location: str, limit: int) -> List[Dict]:
+        generated_at = time.time()
+        jobs = {
+            'indeed': self._fallback_indeed_jobs,
+            'linkedin': self._fallback_linkedin_jobs,
+            'glassdoor': self._fallback_glassdoor_jobs
+        }[source](keywords, location, limit)
+        for job in jobs:
+            job['id'] = job_id(source, job)
+            ensure_posted_at(job, generated_at)
+        return jobs
+    
+    def iter_jobs(self, source: str, keywords: str, location: str = "", max_pages: Optional[int] = None,
+                  fallback_limit: int = 20, stats: Optional[Dict] = None, limit: Optional[int] = None,
+                  fallback: bool = True):
+        """Yield up to `limit` jobs from one board page by page.
+        
+        The next page is fetched while the current one is parsed when more than a page of
+        jobs is still wanted; otherwise it is fetched only if this page leaves the limit
+        unmet. Stops at the first empty page or after max_pages. If the first page cannot
+        be fetched, or the source is not paged, the source's fallback jobs are yielded
+        instead unless `fallback` is False. Closing the generator early cancels the prefetch.
+        """
+        stats = stats if stats is not None else {}
+        stats.setdefault('pages', 0)
+        if source not in self.PAGED_SOURCES:
+            if fallback:
+                yield from self._source_fallback(source, keywords, location, fallback_limit)
+            return
+        
+        max_pages = self.MAX_PAGES if max_pages is None else max_pages
+        wanted = float('inf') if limit is None else limit
+        executor = self._get_executor('prefetch')
+        future = executor.submit(self._fetch_page, source, keywords, location, 0)
         try:
-            search_url = f"https://www.glassdoor.com/Job/jobs.htm"
-            params = {
-                'sc.keyword': keywords,
-                'locT': 'C',
-                'locId': '1147401',  
-                'jobType': 'all',
-                'fromAge': 1,  
-                'minSalary': 0,
-                'includeNoSalaryJobs': 'true',
-                'radius': 25
-            }
-            
-            if location:
-                params['locKeyword'] = location
-            
-            soup = self._make_request(search_url, params)
-            if not soup:
-                return self._fallback_glassdoor_jobs(keywords, location, limit)
-            
-            job_cards = soup.find_all('li', class_='react-job-listing') or soup.find_all('article', class_='jobContainer')
-            
-            for i, card in enumerate(job_cards[:limit]):
+            for page in range(max_pages):
                 try:
-                    job = self._parse_glassdoor_job(card, keywords, location)
-                    if job:
-                        jobs.append(job)
+                    fetched = future.result()
                 except Exception as e:
-                    logger.error(f"Error parsing Glassdoor job {i}: {str(e)}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Error scraping Glassdoor: {str(e)}")
-            return self._fallback_glassdoor_jobs(keywords, location, limit)
-        
-        return jobs[:limit]
+                    logger.error(f"Error scraping {source.title()} page {page + 1}: {str(e)}")
+                    fetched = None
+                future = None
+                
+                if fetched is None:
+                    if page == 0 and fallback:
+                        yield from islice(self._source_fallback(source, keywords, location, fallback_limit),
+                                          limit)
+                    return
+                
+                has_next = page + 1 < max_pages
+                if has_next and wanted > self.PAGE_SIZE:
+                    future = executor.submit(self._fetch_page, source, keywords, location, page + 1)
+                html, fetched_at = fetched
+                jobs = self._parse_page(source, html, keywords, location, fetched_at)
+                stats['pages'] += 1
+                if not jobs:
+                    return
+                jobs = jobs[:wanted] if limit is not None else jobs
+                wanted -= len(jobs)
+                yield from jobs
+                if wanted <= 0:
+                    return
+                if has_next and future is None:
+                    future = executor.submit(self._fetch_page, source, keywords, location, page + 1)
+        finally:
+            if future is not None:
+                future.cancel()
     
-    def _parse_glassdoor_job(self, card, keywords: str, location: str) -> Optional[Dict]:
+    def _parse_glassdoor_job(self, card, keywords: str, location: str, fetched_at: float) -> Optional[Dict]:
         try:
-            title_elem = card.find('a', class_='jobTitle') or card.find('a', {'data-test': 'job-title'})
-            title = title_elem.get_text(strip=True) if title_elem else f'{keywords} Specialist'
-            
-            company_elem = card.find('span', class_='employerName') or card.find('div', class_='jobHeader')
-            company = company_elem.get_text(strip=True) if company_elem else 'Growing Company'
-            
-            location_elem = card.find('span', class_='loc') or card.find('div', class_='jobLocation')
-            job_location = location_elem.get_text(strip=True) if location_elem else location or 'Multiple Locations'
-            
-            salary_elem = card.find('span', class_='salaryText') or card.find('div', class_='jobSalary')
-            salary = salary_elem.get_text(strip=True) if salary_elem else 'Competitive package'
-            
-            link_elem = title_elem if title_elem else card.find('a', href=True)
-            job_url = link_elem['href'] if link_elem and link_elem.get('href') else '#'
+            fields = extract_card_fields('glassdoor', card)
+            title = fields['title'] or f'{keywords} Specialist'
+            company = fields['company'] or 'Growing Company'
+            job_location = fields['location'] or location or 'Multiple Locations'
+            salary = fields['salary'] or 'Competitive package'
+            job_url = fields['link'] or '#'
             if job_url.startswith('/'):
                 job_url = f"https://www.glassdoor.com{job_url}"
+            # A card without an age is left undated rather than given a made-up one.
+            posted_date = self._parse_posting_date(fields['posted']) if fields['posted'] else 'Unknown'
             
             return {
-                'id': f'glassdoor_{hash(title + company)}',
                 'title': title,
                 'company': company,
                 'location': job_location,
                 'description': f'Exciting {keywords} role at {company}. Join a dynamic team working on innovative projects.',
                 'employment_type': 'Full-time',
-                'posted_date': self._get_recent_date(),
+                'posted_date': posted_date,
                 'url': job_url,
                 'application_url': job_url,
                 'salary_range': salary,
@@ -218,44 +362,150 @@ class JobScraper:
             logger.error(f"Error parsing Glassdoor job card: {str(e)}")
             return None
     
-    def aggregate_job_search(self, keywords: str, location: str = "", limit: int = 20) -> List[Dict]:
-        all_jobs = []
-        
-        per_source_limit = max(1, limit // 3)
-        
-        try:
-            indeed_jobs = self.search_indeed_jobs(keywords, location, per_source_limit)
-            all_jobs.extend(indeed_jobs)
-            logger.info(f"Found {len(indeed_jobs)} jobs from Indeed")
-        except Exception as e:
-            logger.error(f"Indeed search failed: {str(e)}")
-        
-        try:
-            linkedin_jobs = self.search_linkedin_jobs(keywords, location, per_source_limit)
-            all_jobs.extend(linkedin_jobs)
-            logger.info(f"Found {len(linkedin_jobs)} jobs from LinkedIn")
-        except Exception as e:
-            logger.error(f"LinkedIn search failed: {str(e)}")
-        
-        try:
-            glassdoor_jobs = self.search_glassdoor_jobs(keywords, location, per_source_limit)
-            all_jobs.extend(glassdoor_jobs)
-            logger.info(f"Found {len(glassdoor_jobs)} jobs from Glassdoor")
-        except Exception as e:
-            logger.error(f"Glassdoor search failed: {str(e)}")
+    def _get_executor(self, kind: str = 'source') -> ThreadPoolExecutor:
+        # Long-lived so a source that overruns its deadline never blocks the caller on shutdown.
+        # Prefetches get their own pool so they cannot starve behind the sources waiting on them.
+        with self._executor_lock:
+            if kind not in self._executors:
+                self._executors[kind] = ThreadPoolExecutor(max_workers=6, thread_name_prefix=f"job-{kind}")
+            return self._executors[kind]
+    
+    def aggregate_job_search(self, keywords: str, location: str = "", limit: int = 20,
+                             source_timeout: Optional[float] = None,
+                             overall_timeout: Optional[float] = None,
+                             sources: Optional[List[str]] = None, fallback: bool = True) -> List[Dict]:
+        """Merge the per-source job streams until `limit` unique jobs are found or the deadline hits.
+        
+        Each source is guaranteed an equal share of the results while it is still producing;
+        jobs beyond that share are held back and fill the gaps left by sources that ran dry.
+        A source gets `source_timeout` seconds from when a worker starts it and is cut off on
+        its own when that runs out; `overall_timeout` bounds the whole search. With
+        `fallback` False, sources that cannot be scraped contribute nothing instead of
+        generated listings.
+        """
+        source_timeout = self.SOURCE_TIMEOUT if source_timeout is None else source_timeout
+        overall_timeout = self.OVERALL_TIMEOUT if overall_timeout is None else overall_timeout
+        names = tuple(sources) if sources else self.SOURCES
+        quota = max(1, -(-limit // len(names)))
+        
+        start = time.monotonic()
+        deadline = start + overall_timeout
+        executor = self._get_executor()
+        events = queue.Queue()
+        stops = {name: threading.Event() for name in names}
+        source_deadlines = {}
+        
+        source_stats = {}
+        for name in names:
+            source_stats[name] = {'status': 'pending', 'jobs': 0, 'accepted': 0, 'duplicates': 0, 'pages': 0,
+                             'elapsed_ms': None}
+            executor.submit(self._drain_source, name, keywords, location, limit, stops[name], events, source_stats[name],
+                            fallback)
         
         unique_jobs = []
-        seen_jobs = set()
-        
-        for job in all_jobs:
-            job_key = f"{job['title'].lower()}_{job['company'].lower()}"
-            if job_key not in seen_jobs:
-                seen_jobs.add(job_key)
+        duplicates = NearDuplicateIndex()
+        overflow = {name: [] for name in names}
+        active = set(names)
+        deadline_hit = False
+        
+        while active and len(unique_jobs) < limit:
+            now = time.monotonic()
+            for name in [name for name in active if source_deadlines.get(name, deadline) <= now]:
+                active.discard(name)
+                stops[name].set()
+                source_stats[name].update(status='timeout', elapsed_ms=round(source_timeout * 1000, 1))
+                logger.warning(f"{name.title()} search missed its deadline; keeping what it sent so far")
+            if now >= deadline:
+                deadline_hit = True
+                break
+            if not active:
+                break
+            
+            wake_at = min([deadline] + [source_deadlines[name] for name in active if name in source_deadlines])
+            try:
+                kind, name, payload = events.get(timeout=wake_at - now)
+            except queue.Empty:
+                continue
+            if name not in active:
+                continue
+            
+            if kind == 'start':
+                source_deadlines[name] = min(payload + source_timeout, deadline)
+                continue
+            
+            if kind == 'job':
+                source_stats[name]['jobs'] += 1
+                signature = duplicates.signature(payload)
+                kept = duplicates.find(payload, signature)
+                if kept is not None:
+                    merge_duplicate(kept, payload)
+                    source_stats[name]['duplicates'] += 1
+                    continue
+                if source_stats[name]['accepted'] < quota:
+                    duplicates.add(payload, signature)
+                    unique_jobs.append(payload)
+                    source_stats[name]['accepted'] += 1
+                else:
+                    overflow[name].append((payload, signature))
+                continue
+            
+            elapsed, error = payload
+            active.discard(name)
+            source_stats[name]['elapsed_ms'] = round(elapsed * 1000, 1)
+            if error is not None:
+                source_stats[name].update(status='error', error=str(error))
+                logger.error(f"{name.title()} search failed: {error}")
+            else:
+                source_stats[name]['status'] = 'ok'
+                logger.info(f"Found {source_stats[name]['jobs']} jobs from {name.title()} in {elapsed:.2f}s")
+        
+        for stop in stops.values():
+            stop.set()
+        for name in active:
+            source_stats[name].update(status='timeout' if deadline_hit else 'stopped',
+                                 elapsed_ms=round((time.monotonic() - start) * 1000, 1))
+            if deadline_hit:
+                logger.warning(f"{name.title()} search missed the overall deadline; returning what it sent so far")
+        
+        held_back = [[(name, job, signature) for job, signature in jobs] for name, jobs in overflow.items()]
+        for batch in zip_longest(*held_back):
+            for entry in batch:
+                if entry is None or len(unique_jobs) >= limit:
+                    continue
+                name, job, signature = entry
+                kept = duplicates.find(job, signature)
+                if kept is not None:
+                    merge_duplicate(kept, job)
+                    continue
+                duplicates.add(job, signature)
                 unique_jobs.append(job)
+                source_stats[name]['accepted'] += 1
         
-        unique_jobs.sort(key=lambda x: self._parse_date_for_sorting(x.get('posted_date', '')), reverse=True)
+        unique_jobs.sort(key=ensure_posted_at, reverse=True)
         
-        return unique_jobs[:limit]
+        return JobSearchResult(unique_jobs[:limit], {
+            'sources': source_stats,
+            'elapsed_ms': round((time.monotonic() - start) * 1000, 1),
+            'deadline_hit': deadline_hit
+        })
+    
+    def _drain_source(self, name: str, keywords: str, location: str, limit: int,
+                      stop: threading.Event, events: queue.Queue, stats: Dict, fallback: bool = True):
+        started = time.monotonic()
+        events.put(('start', name, started))
+        jobs = self.iter_jobs(name, keywords, location, fallback_limit=limit, stats=stats, limit=limit,
+                              fallback=fallback)
+        error = None
+        try:
+            for job in islice(jobs, limit):
+                if stop.is_set():
+                    break
+                events.put(('job', name, job))
+        except Exception as e:
+            error = e
+        finally:
+            jobs.close()
+            events.put(('done', name, (time.monotonic() - started, error)))
     
     def _parse_posting_date(self, date_text: str) -> str:
         date_text = date_text.lower().strip()
@@ -277,27 +527,15 @@ class JobScraper:
                     return f"{int(weeks.group(1)) * 7} days ago"
             elif 'month' in date_text:
                 return '30+ days ago'
+            else:
+                # Compact ages such as Glassdoor's "5h" or "30d+".
+                short = re.fullmatch(r'(\d+)\s*([hd])\+?', date_text)
+                if short:
+                    return 'Today' if short.group(2) == 'h' else f"{short.group(1)} days ago"
         except:
             pass
         
-        return 'Recently'
-    
-    def _parse_date_for_sorting(self, date_text: str) -> datetime:
-        try:
-            if 'today' in date_text.lower():
-                return datetime.now()
-            elif 'yesterday' in date_text.lower():
-                return datetime.now() - timedelta(days=1)
-            elif 'days ago' in date_text.lower():
-                days = re.search(r'(\d+)', date_text)
-                if days:
-                    return datetime.now() - timedelta(days=int(days.group(1)))
-            elif 'recently' in date_text.lower():
-                return datetime.now() - timedelta(days=3)
-        except:
-            pass
-        
-        return datetime.now() - timedelta(days=7) 
+        return 'Recently' if 'recent' in date_text else 'Unknown'
     
     def _detect_employment_type(self, title: str, description: str) -> str:
         text = f"{title} {description}".lower()
@@ -322,23 +560,7 @@ class JobScraper:
         return None
     
     def _extract_skills_from_text(self, text: str) -> List[str]:
-        skills_keywords = [
-            'Python', 'JavaScript', 'Java', 'React', 'Node.js', 'SQL', 'AWS',
-            'Docker', 'Kubernetes', 'Git', 'Agile', 'Scrum', 'REST API',
-            'Machine Learning', 'Data Analysis', 'Cloud Computing', 'TypeScript',
-            'Angular', 'Vue.js', 'MongoDB', 'PostgreSQL', 'Redis', 'GraphQL',
-            'Microservices', 'DevOps', 'CI/CD', 'Jenkins', 'Terraform', 'HTML',
-            'CSS', 'C++', 'C#', '.NET', 'PHP', 'Ruby', 'Go', 'Rust', 'Swift'
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in skills_keywords:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        
-        return found_skills[:6] 
+        return get_skill_matcher().skills(text, limit=6)
     
     def _generate_relevant_skills(self, keywords: str) -> List[str]:
         skill_mapping = {
@@ -358,25 +580,14 @@ class JobScraper:
         
         return ['Problem Solving', 'Team Collaboration', 'Communication', 'Agile']
     
-    def _get_recent_date(self) -> str:
-        """Get a recent date for fallback jobs"""
-        days_ago = random.randint(0, 7)
-        date = datetime.now() - timedelta(days=days_ago)
-        
-        if days_ago == 0:
-            return 'Today'
-        elif days_ago == 1:
-            return 'Yesterday'
-        else:
-            return f'{days_ago} days ago'
     def _fallback_indeed_jobs(self, keywords: str, location: str, limit: int) -> List[Dict]:
         try:
             if self.ai_data_service:
                 logger.info("🤖 Using AI data service for Indeed fallback jobs")
                 ai_jobs = self.ai_data_service.generate_dynamic_jobs(
-                    query=keywords or "software developer",
+                    keywords=keywords or "software developer",
                     location=location or "Remote",
-                    count=limit
+                    limit=limit
                 )
                 if ai_jobs:
                     for job in ai_jobs:
@@ -392,9 +603,9 @@ class JobScraper:
             if self.ai_data_service:
                 logger.info("🤖 Using AI data service for LinkedIn fallback jobs")
                 ai_jobs = self.ai_data_service.generate_dynamic_jobs(
-                    query=keywords or "software developer",
+                    keywords=keywords or "software developer",
                     location=location or "Remote",
-                    count=limit
+                    limit=limit
                 )
                 if ai_jobs:
                     for job in ai_jobs:
@@ -410,9 +621,9 @@ class JobScraper:
             if self.ai_data_service:
                 logger.info("🤖 Using AI data service for Glassdoor fallback jobs")
                 ai_jobs = self.ai_data_service.generate_dynamic_jobs(
-                    query=keywords or "software developer",
+                    keywords=keywords or "software developer",
                     location=location or "Remote",
-                    count=limit
+                    limit=limit
                 )
                 if ai_jobs:
                     # Mark as Glassdoor source
@@ -453,13 +664,12 @@ class JobScraper:
             job_location = location or locations[i % len(locations)]
             
             job = {
-                'id': f'{source}_{hash(title + company + str(i))}',
                 'title': title,
                 'company': company,
                 'location': job_location,
                 'description': f'Join {company} as a {title}. Work on cutting-edge {keywords} projects with a talented team.',
                 'employment_type': 'Full-time',
-                'posted_date': self._get_recent_date(),
+                'posted_date': 'Unknown',
                 'url': f'https://www.{source}.com/jobs/view/{i}',
                 'application_url': f'https://www.{source}.com/jobs/view/{i}',
                 'salary_range': self._generate_salary_range(title),
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+class LLMResponseCache:
+    """Content-addressed SQLite cache for chat completions, shared by every process on the host."""
+
+    def __init__(self, path: str, ttl: float = 7 * 24 * 3600, max_entries: int = 5000,
+                 max_bytes: int = 100 * 1024 * 1024, max_temperature: float = 0.3):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_temperature = max_temperature
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "expired": 0, "evictions": 0}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict], max_tokens: int, temperature: float,
+                 response_format: Optional[Dict[str, Any]] = None) -> str:
+        request = {"model": model, "messages": messages, "max_tokens": max_tokens, "temperature": temperature}
+        if response_format:
+            # JSON-mode and plain completions of the same messages are different answers.
+            request["response_format"] = response_format
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def should_cache(self, temperature: float, use_cache: Optional[bool] = None) -> bool:
+        if use_cache is not None:
+            return use_cache
+        return temperature <= self.max_temperature
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._counters["misses"] += 1
+                return None
+            value, created_at = row
+            if now - created_at > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._counters["expired"] += 1
+                self._counters["misses"] += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._counters["hits"] += 1
+            return value
+
+    def set(self, key: str, value: str, model: str = ""):
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, value, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, value, size, now, now)
+            )
+            self._counters["stores"] += 1
+            self._evict()
+
+    def _evict(self):
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        doomed = max(0, count - self.max_entries)
+        if total > self.max_bytes:
+            # Walk the oldest entries through the last_access index only as far as needed.
+            freed, needed = 0, 0
+            cursor = self._conn.execute("SELECT size FROM responses ORDER BY last_access ASC")
+            for (size,) in cursor:
+                if freed >= total - self.max_bytes:
+                    break
+                freed += size
+                needed += 1
+            cursor.close()
+            doomed = max(doomed, needed)
+        evicted = self._conn.execute(
+            "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_access ASC LIMIT ?)",
+            (doomed,)
+        ).rowcount
+        self._counters["evictions"] += evicted
+
+    def purge_expired(self) -> int:
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM responses WHERE created_at < ?", (cutoff,)).rowcount
+            self._counters["expired"] += removed
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = counters["hits"] + counters["misses"]
+        counters.update({
+            "entries": entries,
+            "bytes": total,
+            "hit_rate": round(counters["hits"] / lookups, 3) if lookups else None
+        })
+        return counters
+
+
+_CACHES: Dict[str, LLMResponseCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def default_cache_path() -> str:
+    path = os.getenv("LLM_CACHE_PATH")
+    return os.path.expanduser(path) if path else os.path.join(
+        os.path.expanduser("~"), ".cache", "resumate", "llm_cache.sqlite3"
+    )
+
+
+def get_shared_cache(path: Optional[str] = None, **kwargs) -> Optional[LLMResponseCache]:
+    """Return the process-wide cache for `path`, or None when caching is disabled via LLM_CACHE_DISABLED."""
+    if os.getenv("LLM_CACHE_DISABLED", "").lower() in ("1", "true", "yes"):
+        return None
+    path = path or default_cache_path()
+    with _CACHES_LOCK:
+        cache = _CACHES.get(path)
+        if cache is None:
+            try:
+                cache = LLMResponseCache(path, **kwargs)
+            except (sqlite3.Error, OSError) as e:
+                print(f"Warning: LLM response cache unavailable at {path}: {e}")
+                return None
+            _CACHES[path] = cache
+        return cache
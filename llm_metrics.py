@@ -0,0 +1,259 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+# USD per million tokens (input, output).
+MODEL_PRICING = {
+    "llama-3.1-8b-instant": (0.05, 0.08),
+    "llama-3.3-70b-versatile": (0.59, 0.79),
+    "llama3-70b-8192": (0.59, 0.79),
+    "llama3-8b-8192": (0.05, 0.08),
+    "gemma2-9b-it": (0.20, 0.20),
+}
+
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    input_price, output_price = MODEL_PRICING.get(model, (0.0, 0.0))
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class MetricsSink:
+    """Receives one record per finished LLM call."""
+
+    def emit(self, record: Dict[str, Any]):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class RingBufferSink(MetricsSink):
+    """Keeps the most recent calls in memory for summaries and debugging."""
+
+    def __init__(self, capacity: int = 2000):
+        self.records = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def emit(self, record: Dict[str, Any]):
+        with self._lock:
+            self.records.append(record)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self.records)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-feature call counts, latency percentiles, token totals and cost."""
+        grouped = defaultdict(list)
+        for record in self.snapshot():
+            grouped[record["feature"]].append(record)
+
+        summary = {}
+        for feature, records in grouped.items():
+            latencies = [r["wall_ms"] for r in records if not r["cache_hit"]]
+            ttfbs = [r["ttfb_ms"] for r in records if r.get("ttfb_ms") is not None]
+            summary[feature] = {
+                "calls": len(records),
+                "errors": sum(1 for r in records if r["status"] != 200),
+                "cache_hits": sum(1 for r in records if r["cache_hit"]),
+                "retries": sum(r["retries"] for r in records),
+                "p50_ms": percentile(latencies, 50),
+                "p95_ms": percentile(latencies, 95),
+                "p99_ms": percentile(latencies, 99),
+                "ttfb_p50_ms": percentile(ttfbs, 50),
+                "prompt_tokens": sum(r["prompt_tokens"] for r in records),
+                "completion_tokens": sum(r["completion_tokens"] for r in records),
+                "cost_usd": round(sum(r["cost_usd"] for r in records), 6)
+            }
+        return summary
+
+
+class JSONLFileSink(MetricsSink):
+    """Appends each call as one JSON line, for offline analysis."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def emit(self, record: Dict[str, Any]):
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class PrometheusSink(MetricsSink):
+    """Aggregates counters and latency histograms and renders Prometheus text exposition."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = defaultdict(int)
+        self._tokens = defaultdict(int)
+        self._cost = defaultdict(float)
+        self._retries = defaultdict(int)
+        self._buckets = defaultdict(lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+        self._latency_sum = defaultdict(float)
+        self._server = None
+
+    def emit(self, record: Dict[str, Any]):
+        feature, model = record["feature"], record["model"]
+        with self._lock:
+            self._calls[(feature, model, str(record["status"]), str(record["cache_hit"]).lower())] += 1
+            self._tokens[(feature, model, "prompt")] += record["prompt_tokens"]
+            self._tokens[(feature, model, "completion")] += record["completion_tokens"]
+            self._cost[(feature, model)] += record["cost_usd"]
+            self._retries[(feature, model)] += record["retries"]
+            if not record["cache_hit"]:
+                buckets = self._buckets[(feature, model)]
+                for i, bound in enumerate(LATENCY_BUCKETS_MS):
+                    if record["wall_ms"] <= bound:
+                        buckets[i] += 1
+                buckets[-1] += 1
+                self._latency_sum[(feature, model)] += record["wall_ms"] / 1000
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            lines += ["# HELP llm_calls_total LLM calls by feature, model, status and cache hit.",
+                      "# TYPE llm_calls_total counter"]
+            for (feature, model, status, cache_hit), value in sorted(self._calls.items()):
+                lines.append(f'llm_calls_total{{feature="{feature}",model="{model}",status="{status}",cache_hit="{cache_hit}"}} {value}')
+
+            lines += ["# HELP llm_tokens_total Tokens used by feature and model.", "# TYPE llm_tokens_total counter"]
+            for (feature, model, kind), value in sorted(self._tokens.items()):
+                lines.append(f'llm_tokens_total{{feature="{feature}",model="{model}",kind="{kind}"}} {value}')
+
+            lines += ["# HELP llm_cost_usd_total Estimated spend in USD.", "# TYPE llm_cost_usd_total counter"]
+            for (feature, model), value in sorted(self._cost.items()):
+                lines.append(f'llm_cost_usd_total{{feature="{feature}",model="{model}"}} {value:.6f}')
+
+            lines += ["# HELP llm_retries_total Retried attempts.", "# TYPE llm_retries_total counter"]
+            for (feature, model), value in sorted(self._retries.items()):
+                lines.append(f'llm_retries_total{{feature="{feature}",model="{model}"}} {value}')
+
+            lines += ["# HELP llm_request_seconds Wall time of uncached LLM calls.",
+                      "# TYPE llm_request_seconds histogram"]
+            for (feature, model), buckets in sorted(self._buckets.items()):
+                labels = f'feature="{feature}",model="{model}"'
+                for bound, count in zip(LATENCY_BUCKETS_MS, buckets):
+                    lines.append(f'llm_request_seconds_bucket{{{labels},le="{bound / 1000}"}} {count}')
+                lines.append(f'llm_request_seconds_bucket{{{labels},le="+Inf"}} {buckets[-1]}')
+                lines.append(f'llm_request_seconds_sum{{{labels}}} {self._latency_sum[(feature, model)]:.3f}')
+                lines.append(f'llm_request_seconds_count{{{labels}}} {buckets[-1]}')
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int, host: str = "127.0.0.1"):
+        """Expose /metrics on a daemon thread."""
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") != "/metrics":
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = sink.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True, name="llm-metrics").start()
+        return self._server
+
+    def close(self):
+        if self._server is not None:
+            self._server.shutdown()
+
+
+class LLMMetrics:
+    """Collects per-call LLM measurements and fans them out to the configured sinks."""
+
+    def __init__(self, sinks: Optional[List[MetricsSink]] = None):
+        self.ring = RingBufferSink()
+        self.sinks = [self.ring] + list(sinks or [])
+
+    def add_sink(self, sink: MetricsSink):
+        self.sinks.append(sink)
+
+    def start_call(self, feature: str, model: str) -> Dict[str, Any]:
+        return {
+            "feature": feature,
+            "model": model,
+            "started": time.monotonic(),
+            "status": None,
+            "retries": 0,
+            "cache_hit": False,
+            "ttfb_ms": None,
+            "prompt_tokens": 0,
+            "completion_tokens": 0
+        }
+
+    def finish_call(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        record = dict(call)
+        started = record.pop("started")
+        record["timestamp"] = time.time()
+        record["wall_ms"] = round((time.monotonic() - started) * 1000, 1)
+        record["status"] = record["status"] if record["status"] is not None else "error"
+        record["cost_usd"] = estimate_cost(record["model"], record["prompt_tokens"], record["completion_tokens"])
+        for sink in self.sinks:
+            try:
+                sink.emit(record)
+            except Exception as e:
+                print(f"Warning: metrics sink {type(sink).__name__} failed: {e}")
+        return record
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        return self.ring.summary()
+
+
+_METRICS: Optional[LLMMetrics] = None
+_METRICS_LOCK = threading.Lock()
+
+
+def get_shared_metrics() -> LLMMetrics:
+    """Process-wide metrics; LLM_METRICS_JSONL adds a file sink, LLM_METRICS_PORT serves /metrics."""
+    global _METRICS
+    with _METRICS_LOCK:
+        if _METRICS is None:
+            _METRICS = LLMMetrics()
+            jsonl_path = os.getenv("LLM_METRICS_JSONL")
+            if jsonl_path:
+                _METRICS.add_sink(JSONLFileSink(jsonl_path))
+            port = os.getenv("LLM_METRICS_PORT")
+            if port:
+                prometheus = PrometheusSink()
+                try:
+                    prometheus.serve(int(port))
+                    _METRICS.add_sink(prometheus)
+                except OSError as e:
+                    print(f"Warning: could not serve LLM metrics on port {port}: {e}")
+        return _METRICS
@@ -1108,11 +1108,14 @@ def resume_page(groq_service, resume_gen):
                         skills_list.append(skill)
             enhanced_data['skills'] = skills_list
             
-            if job_description:
-                enhanced_data['target_job'] = job_description
-                resume_content = groq_service.generate_tailored_resume(enhanced_data, job_description)
-            else:
-                resume_content = groq_service.generate_enhanced_resume(enhanced_data)
+            stream_area = st.empty()
+            with stream_area.container():
+                if job_description:
+                    enhanced_data['target_job'] = job_description
+                    resume_content = st.write_stream(groq_service.generate_tailored_resume(enhanced_data, job_description, stream=True))
+                else:
+                    resume_content = st.write_stream(groq_service.generate_enhanced_resume(enhanced_data, stream=True))
+            stream_area.empty()
             
             if resume_content:
                 st.session_state.resume_content = resume_content
@@ -1312,12 +1315,16 @@ def cover_letter_page(groq_service, cover_letter_gen):
         
         with st.spinner("🤖 AI is crafting your personalized cover letter..."):
             try:
-                cover_letter_content = groq_service.generate_enhanced_cover_letter(
-                    user_data=st.session_state.user_data,
-                    job_description=job_description,
-                    company_name=company_name,
-                    tone=tone
-                )
+                stream_area = st.empty()
+                with stream_area.container():
+                    cover_letter_content = st.write_stream(groq_service.generate_enhanced_cover_letter(
+                        user_data=st.session_state.user_data,
+                        job_description=job_description,
+                        company_name=company_name,
+                        tone=tone,
+                        stream=True
+                    ))
+                stream_area.empty()
                 
                 if cover_letter_content:
                     st.session_state.cover_letter_content = cover_letter_content
@@ -1367,6 +1374,14 @@ def cover_letter_page(groq_service, cover_letter_gen):
     
     st.markdown('</div>', unsafe_allow_html=True)
 
+DATE_POSTED_OPTIONS = {
+    "Any time": None,
+    "Past 24 hours": 1,
+    "Past 3 days": 3,
+    "Past week": 7,
+    "Past month": 30
+}
+
 def job_search_page(job_searcher, groq_service):
     st.header("🔍 AI-Powered Job Search")
     
@@ -1394,6 +1409,7 @@ def job_search_page(job_searcher, groq_service):
     
     with col3:
         limit = st.slider("📊 Results Limit:", 5, 50, 20)
+        date_posted = st.selectbox("📅 Date Posted:", list(DATE_POSTED_OPTIONS))
     
     col_search1, col_search2, col_search3 = st.columns(3)
     
@@ -1409,14 +1425,16 @@ def job_search_page(job_searcher, groq_service):
                             location=location,
                             experience_level=experience_level,
                             job_type=job_type,
-                            limit=limit
+                            limit=limit,
+                            posted_within_days=DATE_POSTED_OPTIONS[date_posted]
                         )
                         st.session_state.search_results = jobs
                         st.session_state.search_params = {
                             'job_title': job_title,
                             'location': location,
                             'experience_level': experience_level,
-                            'job_type': job_type
+                            'job_type': job_type,
+                            'date_posted': date_posted
                         }
                         st.success(f"✅ Found {len(jobs)} job opportunities!")
                     except Exception as e:
@@ -1596,6 +1614,15 @@ def interview_page(interview_sim):
     
     st.markdown('</div>', unsafe_allow_html=True)
 
+def stream_chat_reply(groq_service, question, container):
+    st.session_state.chat_history.append({"role": "user", "content": question})
+    with container:
+        with st.chat_message("user"):
+            st.write(question)
+        with st.chat_message("assistant"):
+            response = st.write_stream(groq_service.chat_with_resume(question, st.session_state.resume_context, stream=True))
+    st.session_state.chat_history.append({"role": "assistant", "content": response})
+
 def resume_chat_page(groq_service):
     st.header("💬 Chat with Resume AI")
     
@@ -1640,37 +1667,25 @@ def resume_chat_page(groq_service):
     with col1:
         if st.button("📄 Analyze My Resume", use_container_width=True):
             question = "Please analyze my resume and provide feedback on strengths and areas for improvement."
-            st.session_state.chat_history.append({"role": "user", "content": question})
-            with st.spinner("🤖 Analyzing your resume..."):
-                response = groq_service.chat_with_resume(question, st.session_state.resume_context)
-                st.session_state.chat_history.append({"role": "assistant", "content": response})
+            stream_chat_reply(groq_service, question, chat_container)
             st.rerun()
     
     with col2:
         if st.button("💡 Career Advice", use_container_width=True):
             question = "Based on my background, what career advice and next steps would you recommend?"
-            st.session_state.chat_history.append({"role": "user", "content": question})
-            with st.spinner("🤖 Generating career advice..."):
-                response = groq_service.chat_with_resume(question, st.session_state.resume_context)
-                st.session_state.chat_history.append({"role": "assistant", "content": response})
+            stream_chat_reply(groq_service, question, chat_container)
             st.rerun()
     
     with col3:
         if st.button("🎯 Job Matching", use_container_width=True):
             question = "What types of jobs and roles would be the best fit for my skills and experience?"
-            st.session_state.chat_history.append({"role": "user", "content": question})
-            with st.spinner("🤖 Finding job matches..."):
-                response = groq_service.chat_with_resume(question, st.session_state.resume_context)
-                st.session_state.chat_history.append({"role": "assistant", "content": response})
+            stream_chat_reply(groq_service, question, chat_container)
             st.rerun()
     
     with col4:
         if st.button("📈 Skill Gaps", use_container_width=True):
             question = "What skills should I learn or improve to advance in my career and become more competitive?"
-            st.session_state.chat_history.append({"role": "user", "content": question})
-            with st.spinner("🤖 Analyzing skill gaps..."):
-                response = groq_service.chat_with_resume(question, st.session_state.resume_context)
-                st.session_state.chat_history.append({"role": "assistant", "content": response})
+            stream_chat_reply(groq_service, question, chat_container)
             st.rerun()
     
     st.markdown("### 💬 Ask Me Anything")
@@ -1686,15 +1701,11 @@ def resume_chat_page(groq_service):
     with col_send:
         if st.button("💬 Send Message", type="primary", use_container_width=True):
             if user_question.strip():
-                st.session_state.chat_history.append({"role": "user", "content": user_question})
-                
-                with st.spinner("🤖 AI is thinking..."):
-                    try:
-                        response = groq_service.chat_with_resume(user_question, st.session_state.resume_context)
-                        st.session_state.chat_history.append({"role": "assistant", "content": response})
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"❌ Error getting response: {str(e)}")
+                try:
+                    stream_chat_reply(groq_service, user_question, chat_container)
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"❌ Error getting response: {str(e)}")
             else:
                 st.error("⚠️ Please enter a question.")
     
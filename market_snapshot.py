@@ -0,0 +1,185 @@
+import argparse
+import gzip
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+import cache_keys
+
+# Bump when the file layout or the shape of a stored value changes; older files are ignored.
+SNAPSHOT_FORMAT = 1
+DEFAULT_MAX_AGE_DAYS = 30
+
+DEFAULT_INDUSTRIES = ["technology", "finance", "healthcare", "e-commerce", "education", "consulting"]
+DEFAULT_TITLES = [
+    "Software Engineer", "Senior Software Engineer", "Data Scientist", "Data Analyst",
+    "Product Manager", "DevOps Engineer", "Frontend Developer", "Backend Developer",
+    "Full Stack Developer", "Machine Learning Engineer", "UX Designer", "Cloud Architect",
+]
+DEFAULT_LOCATIONS = ["", "Remote", "New York, NY", "San Francisco, CA", "Seattle, WA", "Austin, TX"]
+DEFAULT_COMPANIES = [
+    "Google", "Microsoft", "Amazon", "Apple", "Meta", "Netflix", "Salesforce",
+    "Adobe", "Stripe", "Shopify", "Airbnb", "Uber", "Spotify", "Atlassian",
+]
+
+
+class MarketSnapshot:
+    """Read-only, pre-generated AIDataService results keyed by canonical cache key.
+
+    The file is read on first use, not at import, so processes that never ask for market
+    data never pay for it. A missing, unreadable, outdated-format or too old file
+    behaves as an empty snapshot.
+    """
+
+    def __init__(self, path: str, max_age: Optional[float] = DEFAULT_MAX_AGE_DAYS * 24 * 3600):
+        self.path = path
+        self.max_age = max_age
+        self.built_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Any]] = None
+        self._counters = {"hits": 0, "misses": 0}
+
+    def _load(self) -> Dict[str, Any]:
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read()
+            return self._entries
+
+    def _read(self) -> Dict[str, Any]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not read market snapshot {self.path}: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("format") != SNAPSHOT_FORMAT:
+            print(f"Warning: ignoring market snapshot {self.path} with unsupported format")
+            return {}
+        self.built_at = data.get("built_at")
+        if self.max_age is not None and time.time() - (self.built_at or 0) > self.max_age:
+            print(f"Warning: ignoring market snapshot {self.path} older than {self.max_age / 86400:g} days")
+            return {}
+        return data.get("entries") or {}
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self._load().get(key)
+        with self._lock:
+            self._counters["misses" if value is None else "hits"] += 1
+        return value
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def stats(self) -> Dict[str, Any]:
+        entries = len(self)
+        with self._lock:
+            return dict(self._counters, entries=entries, built_at=self.built_at, path=self.path)
+
+
+def write_snapshot(path: str, entries: Dict[str, Any]):
+    """Write entries atomically so a running app never reads a half-written file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    payload = {"format": SNAPSHOT_FORMAT, "built_at": time.time(), "entries": entries}
+    temp_path = f"{path}.tmp"
+    with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"), default=str)
+    os.replace(temp_path, path)
+
+
+def build_snapshot(path: str, industries: Iterable[str] = DEFAULT_INDUSTRIES,
+                   titles: Iterable[str] = DEFAULT_TITLES, locations: Iterable[str] = DEFAULT_LOCATIONS,
+                   companies: Iterable[str] = DEFAULT_COMPANIES, workers: int = 4,
+                   api_key: Optional[str] = None) -> Dict[str, int]:
+    """Generate market data live and write it to path; returns counts of stored and failed entries.
+
+    Generation runs through a private in-memory cache rather than the shared one, so only
+    results the model actually produced (never the canned fallbacks) end up in the file.
+    """
+    from ai_data_service import AIDataService
+    from data_cache import MemoryLRUCache
+
+    cache = MemoryLRUCache(max_entries=100000)
+    service = AIDataService(api_key, cache=cache)
+    service.snapshot = None
+    industries, titles, locations, companies = list(industries), list(titles), list(locations), list(companies)
+
+    tasks: List[tuple] = []
+    for industry in industries:
+        tasks.append((cache_keys.trends_key(industry), service.generate_market_trends, (industry,)))
+        tasks.append((cache_keys.skills_key(industry, ""), service.generate_trending_skills, (industry, "")))
+    for title in titles:
+        tasks.append((cache_keys.skills_key("", title), service.generate_trending_skills, ("", title)))
+        for location in locations:
+            tasks.append((cache_keys.salary_key(title, location),
+                          service.generate_dynamic_salary_insights, (title, location)))
+    for company in companies:
+        tasks.append((cache_keys.company_key(company), service.generate_company_insights, (company,)))
+    tasks = list({key: (key, fn, args) for key, fn, args in tasks}.values())
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        list(executor.map(lambda task: task[1](*task[2]), tasks))
+
+    entries = {key: value for key, _, _ in tasks if (value := cache.get(key)) is not None}
+    write_snapshot(path, entries)
+    return {"stored": len(entries), "failed": len(tasks) - len(entries)}
+
+
+_SNAPSHOT: Optional[MarketSnapshot] = None
+_SNAPSHOT_LOCK = threading.Lock()
+
+
+def default_snapshot_path() -> str:
+    path = os.getenv("MARKET_SNAPSHOT_PATH")
+    return os.path.expanduser(path) if path else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "market_snapshot.json.gz"
+    )
+
+
+def get_shared_market_snapshot() -> Optional[MarketSnapshot]:
+    """Process-wide snapshot at MARKET_SNAPSHOT_PATH; None when MARKET_SNAPSHOT_DISABLED is set."""
+    global _SNAPSHOT
+    if os.getenv("MARKET_SNAPSHOT_DISABLED", "").lower() in ("1", "true", "yes"):
+        return None
+    with _SNAPSHOT_LOCK:
+        if _SNAPSHOT is None:
+            max_age_days = float(os.getenv("MARKET_SNAPSHOT_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS))
+            _SNAPSHOT = MarketSnapshot(default_snapshot_path(), max_age_days * 24 * 3600 if max_age_days > 0 else None)
+        return _SNAPSHOT
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-generate market data so cold processes skip the LLM.")
+    parser.add_argument("--output", default=default_snapshot_path(), help="snapshot file to write")
+    parser.add_argument("--config", help="JSON file with industries, titles, locations and companies lists")
+    parser.add_argument("--industries", nargs="*", help="industries for trends and trending skills")
+    parser.add_argument("--titles", nargs="*", help="job titles for salary insights and trending skills")
+    parser.add_argument("--locations", nargs="*", help="locations for salary insights ('' for none)")
+    parser.add_argument("--companies", nargs="*", help="companies for company insights")
+    parser.add_argument("--workers", type=int, default=4, help="generations to run at once")
+    args = parser.parse_args()
+
+    config = {}
+    if args.config:
+        with open(args.config, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    started = time.time()
+    counts = build_snapshot(
+        args.output,
+        industries=args.industries or config.get("industries", DEFAULT_INDUSTRIES),
+        titles=args.titles or config.get("titles", DEFAULT_TITLES),
+        locations=args.locations if args.locations is not None else config.get("locations", DEFAULT_LOCATIONS),
+        companies=args.companies or config.get("companies", DEFAULT_COMPANIES),
+        workers=args.workers
+    )
+    print(f"Wrote {counts['stored']} entries to {args.output} in {time.time() - started:.1f}s "
+          f"({counts['failed']} failed)")
+
+
+if __name__ == "__main__":
+    main()
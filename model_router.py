@@ -0,0 +1,92 @@
+import threading
+from collections import defaultdict, deque
+from typing import Any, Dict, List, Optional
+
+from llm_metrics import percentile
+
+# Each tier is an ordered chain: the first model serves the call, the rest are
+# fallbacks tried on 429 or timeout. Cascades run the chain in reverse (cheapest first).
+DEFAULT_TIERS = {
+    "fast": ["llama-3.1-8b-instant"],
+    "quality": ["llama-3.3-70b-versatile", "llama-3.1-8b-instant"],
+}
+
+DEFAULT_ROUTES = {
+    "_get_term_explanation": {"tier": "fast"},
+    "_score_job_match": {"tier": "fast"},
+    "_score_job_batch": {"tier": "fast"},
+    "generate_chat_interview_question": {"tier": "fast"},
+    "chat_about_resume": {"tier": "fast"},
+    "generate_enhanced_cover_letter": {"tier": "quality"},
+    "generate_enhanced_resume": {"tier": "quality"},
+    "generate_resume": {"tier": "quality"},
+    "generate_enhanced_portfolio": {"tier": "quality"},
+    "parse_resume_data": {"tier": "quality", "cascade": True},
+    "analyze_job_requirements": {"tier": "quality", "cascade": True},
+    "generate_interview_questions": {"tier": "quality", "cascade": True},
+    "evaluate_interview_answer": {"tier": "quality", "cascade": True},
+    "analyze_chat_interview": {"tier": "quality", "cascade": True},
+}
+
+
+class ModelRouter:
+    """Maps GroqLLM methods to model tiers and keeps per-route latency and success stats."""
+
+    def __init__(self, default_model: str, routes: Optional[Dict[str, Dict[str, Any]]] = None,
+                 tiers: Optional[Dict[str, List[str]]] = None, history: int = 500):
+        self.default_model = default_model
+        self.routes = dict(DEFAULT_ROUTES if routes is None else routes)
+        self.tiers = dict(DEFAULT_TIERS if tiers is None else tiers)
+        self._lock = threading.Lock()
+        self._history = history
+        self._stats = defaultdict(lambda: {
+            "calls": 0, "successes": 0, "failures": 0, "fallbacks": 0,
+            "escalations": 0, "latencies": deque(maxlen=self._history)
+        })
+
+    def tier_for(self, feature: str) -> Optional[str]:
+        route = self.routes.get(feature)
+        return route.get("tier") if route else None
+
+    def models_for(self, feature: str) -> List[str]:
+        tier = self.tier_for(feature)
+        chain = self.tiers.get(tier) if tier else None
+        return list(chain) if chain else [self.default_model]
+
+    def cascade_for(self, feature: str) -> Optional[List[str]]:
+        """Cheapest-first model order for routes that escalate only when validation fails."""
+        route = self.routes.get(feature)
+        if not route or not route.get("cascade"):
+            return None
+        chain = list(reversed(self.models_for(feature)))
+        return chain if len(chain) > 1 else None
+
+    def record(self, record: Dict[str, Any]):
+        key = (record["feature"], record["model"])
+        with self._lock:
+            stats = self._stats[key]
+            stats["calls"] += 1
+            if record["status"] == 200 and record.get("validated", True):
+                stats["successes"] += 1
+            else:
+                stats["failures"] += 1
+            stats["fallbacks"] += 1 if record.get("fallback") else 0
+            stats["escalations"] += 1 if record.get("escalated") else 0
+            if not record.get("cache_hit"):
+                stats["latencies"].append(record["wall_ms"])
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            snapshot = {key: dict(value, latencies=list(value["latencies"])) for key, value in self._stats.items()}
+
+        result = {}
+        for (feature, model), stats in sorted(snapshot.items()):
+            latencies = stats.pop("latencies")
+            stats.update({
+                "tier": self.tier_for(feature) or "default",
+                "success_rate": round(stats["successes"] / stats["calls"], 3) if stats["calls"] else None,
+                "p50_ms": percentile(latencies, 50),
+                "p95_ms": percentile(latencies, 95)
+            })
+            result[f"{feature}:{model}"] = stats
+        return result
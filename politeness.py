@@ -0,0 +1,109 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+# Minimum seconds between requests to the same host, before jitter.
+DEFAULT_HOST_INTERVALS = {
+    "www.indeed.com": 2.0,
+    "www.glassdoor.com": 2.0,
+    "www.linkedin.com": 3.0,
+}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After is either delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostPolitenessScheduler:
+    """Per-host request pacing shared by every scraper in the process.
+
+    Each call reserves the next free slot for its host (last slot + interval + jitter)
+    under a short lock and then sleeps outside it, so requests to different hosts never
+    wait on each other and concurrent searches against one host share its budget.
+    A 429/503 with Retry-After pushes the host's next slot out accordingly.
+    """
+
+    def __init__(self, default_interval: float = 1.0, jitter: Tuple[float, float] = (0.5, 1.5),
+                 intervals: Optional[Dict[str, float]] = None, max_wait: float = 30.0,
+                 default_backoff: float = 30.0):
+        self.default_interval = default_interval
+        self.jitter = jitter
+        self.intervals = dict(DEFAULT_HOST_INTERVALS if intervals is None else intervals)
+        self.max_wait = max_wait
+        self.default_backoff = default_backoff
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def host_for(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def _host_stats(self, host: str) -> Dict[str, Any]:
+        return self._stats.setdefault(host, {"requests": 0, "skipped": 0, "throttled": 0, "wait_seconds": 0.0})
+
+    def acquire(self, url: str, max_wait: Optional[float] = None) -> bool:
+        """Block until `url`'s host may be hit; False if that would take longer than max_wait."""
+        host = self.host_for(url)
+        max_wait = self.max_wait if max_wait is None else max_wait
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            stats = self._host_stats(host)
+            if slot - now > max_wait:
+                stats["skipped"] += 1
+                return False
+            interval = self.intervals.get(host, self.default_interval)
+            self._next_slot[host] = slot + interval + random.uniform(*self.jitter)
+            stats["requests"] += 1
+            stats["wait_seconds"] += slot - now
+
+        if slot > now:
+            time.sleep(slot - now)
+        return True
+
+    def record_response(self, url: str, status_code: int, headers: Optional[Mapping[str, str]] = None):
+        if status_code not in (429, 503):
+            return
+        host = self.host_for(url)
+        delay = parse_retry_after((headers or {}).get("Retry-After"))
+        if delay is None:
+            delay = self.default_backoff
+        with self._lock:
+            self._host_stats(host)["throttled"] += 1
+            self._next_slot[host] = max(self._next_slot.get(host, 0.0), time.monotonic() + delay)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                host: dict(stats, wait_seconds=round(stats["wait_seconds"], 2),
+                           next_slot_in=round(max(0.0, self._next_slot.get(host, 0.0) - now), 2))
+                for host, stats in self._stats.items()
+            }
+
+
+_POLITENESS: Optional[HostPolitenessScheduler] = None
+_POLITENESS_LOCK = threading.Lock()
+
+
+def get_shared_politeness() -> HostPolitenessScheduler:
+    global _POLITENESS
+    with _POLITENESS_LOCK:
+        if _POLITENESS is None:
+            _POLITENESS = HostPolitenessScheduler()
+        return _POLITENESS
@@ -0,0 +1,94 @@
+import re
+import time
+from bisect import bisect_right
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Mapping, Optional, Sequence
+
+DAY = 24 * 3600.0
+# Age assumed for "Recently" and for labels that carry no date at all.
+RECENT_AGE = 3 * DAY
+UNKNOWN_AGE = 7 * DAY
+DEFAULT_AGE_BUCKETS = (1, 3, 7, 14, 30)
+
+_RELATIVE = re.compile(r"(\d+)\+?\s*(minute|min|hour|hr|day|week|month)", re.IGNORECASE)
+_JUST_POSTED = re.compile(r"\b(today|just posted|just now|now)\b")
+_UNIT_SECONDS = {
+    "minute": 60.0, "min": 60.0, "hour": 3600.0, "hr": 3600.0,
+    "day": DAY, "week": 7 * DAY, "month": 30 * DAY
+}
+_ABSOLUTE_FORMATS = ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%b %d, %Y", "%B %d, %Y", "%d %b %Y", "%m/%d/%Y")
+
+
+def parse_posted_at(text: Optional[str], reference: float) -> Optional[float]:
+    """Absolute posting time (epoch seconds) for labels like "3 days ago", "Just posted" or "2024-05-01".
+
+    Relative labels are resolved against `reference`, the time the page was fetched.
+    Returns None when the label carries no usable date.
+    """
+    if not text:
+        return None
+    label = str(text).strip().lower()
+    match = _RELATIVE.search(label)
+    if match:
+        return reference - int(match.group(1)) * _UNIT_SECONDS[match.group(2).lower()]
+    if "yesterday" in label:
+        return reference - DAY
+    if _JUST_POSTED.search(label):
+        return reference
+    if "recent" in label:
+        return reference - RECENT_AGE
+    for fmt in _ABSOLUTE_FORMATS:
+        try:
+            return datetime.strptime(str(text).strip(), fmt).timestamp()
+        except ValueError:
+            continue
+    return None
+
+
+def response_time(headers: Optional[Mapping[str, str]]) -> float:
+    """When a (possibly cached) response was produced, from its Date header."""
+    value = (headers or {}).get("Date")
+    if value:
+        try:
+            return parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            pass
+    return time.time()
+
+
+def ensure_posted_at(job: Dict, reference: Optional[float] = None) -> float:
+    """Return job['posted_at'], deriving it once from posted_date for jobs built without one."""
+    posted_at = job.get("posted_at")
+    if isinstance(posted_at, (int, float)):
+        return posted_at
+    if reference is None:
+        try:
+            reference = datetime.fromisoformat(job["scraped_at"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            reference = time.time()
+    posted_at = parse_posted_at(job.get("posted_date"), reference)
+    job["posted_at"] = round(reference - UNKNOWN_AGE if posted_at is None else posted_at, 3)
+    return job["posted_at"]
+
+
+def bucket_labels(edges_days: Sequence[int] = DEFAULT_AGE_BUCKETS) -> list:
+    bounds = [0, *edges_days]
+    labels = [f"{low}-{high}d" for low, high in zip(bounds, bounds[1:])]
+    return labels + [f"{edges_days[-1]}d+"]
+
+
+def age_buckets(timestamps: Iterable[float], edges_days: Sequence[int] = DEFAULT_AGE_BUCKETS,
+                now: Optional[float] = None) -> Dict[str, int]:
+    """Count postings per age bucket, found by bisecting the bucket edges."""
+    now = time.time() if now is None else now
+    labels = bucket_labels(edges_days)
+    counts = [0] * len(labels)
+    for timestamp in timestamps:
+        counts[bisect_right(edges_days, (now - timestamp) / DAY)] += 1
+    return dict(zip(labels, counts))
+
+
+def job_age_buckets(jobs: Iterable[Dict], edges_days: Sequence[int] = DEFAULT_AGE_BUCKETS,
+                    now: Optional[float] = None) -> Dict[str, int]:
+    return age_buckets((ensure_posted_at(job) for job in jobs), edges_days, now)
@@ -0,0 +1,237 @@
+import heapq
+import itertools
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_DEFAULT = 1
+PRIORITY_BACKGROUND = 2
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """Parse Groq reset values such as '7.66s', '2m59.56s', '1h2m3s' or '250ms' into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    total = 0.0
+    matched = False
+    for amount, unit in re.findall(r'([\d.]+)(ms|h|m|s)', value):
+        matched = True
+        total += float(amount) * {"ms": 0.001, "s": 1, "m": 60, "h": 3600}[unit]
+    return total if matched else None
+
+
+class TokenBucket:
+    """Continuously refilling bucket whose level and refill rate can be corrected from server headers."""
+
+    def __init__(self, capacity: float, window: float = 60.0):
+        self.capacity = float(capacity)
+        self.level = float(capacity)
+        self.rate = self.capacity / window
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def seconds_until(self, amount: float) -> float:
+        deficit = amount - self.level
+        if deficit <= 0:
+            return 0.0
+        return deficit / self.rate if self.rate > 0 else float("inf")
+
+    def sync(self, limit: Optional[float], remaining: Optional[float], reset: Optional[float], now: float):
+        if limit:
+            self.capacity = float(limit)
+        if remaining is not None:
+            self.level = min(self.capacity, float(remaining))
+            self.updated = now
+            if reset and reset > 0 and self.capacity > self.level:
+                self.rate = (self.capacity - self.level) / reset
+
+
+class ModelLimits:
+    """Request and token buckets, 429 block and wait queue for one model; Groq limits each model separately."""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.blocked_until = 0.0
+        self.waiters = []
+
+    def refill(self, now: float):
+        self.requests.refill(now)
+        self.tokens.refill(now)
+
+
+class RateLimitScheduler:
+    """Process-wide admission control for Groq calls, tracking requests and tokens per minute per model.
+
+    Callers reserve capacity before sending. Waiters are served in priority order, so
+    interactive chat goes ahead of background job scoring. Background work may not drain
+    the last `background_reserve` fraction of the token bucket. A call is shed (acquire
+    returns False) when it would have to wait longer than its priority allows. Every model
+    has its own buckets, headers and 429 block, so throttling one model never holds up
+    callers that have fallen back to another.
+    """
+
+    DEFAULT_MAX_WAIT = {PRIORITY_INTERACTIVE: 30.0, PRIORITY_DEFAULT: 20.0, PRIORITY_BACKGROUND: 10.0}
+    DEFAULT_MODEL = "default"
+
+    def __init__(self, requests_per_minute: int = 30, tokens_per_minute: int = 6000,
+                 background_reserve: float = 0.2, max_wait: Optional[Dict[int, float]] = None):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.background_reserve = background_reserve
+        self.max_wait = dict(self.DEFAULT_MAX_WAIT, **(max_wait or {}))
+        self._limits: Dict[str, ModelLimits] = {}
+        self._cond = threading.Condition()
+        self._sequence = itertools.count()
+        self._counters = {"admitted": 0, "shed": 0, "throttled_429": 0, "wait_seconds": 0.0}
+
+    def limits_for(self, model: Optional[str] = None) -> ModelLimits:
+        with self._cond:
+            return self._limits_for(model)
+
+    def _limits_for(self, model: Optional[str]) -> ModelLimits:
+        model = model or self.DEFAULT_MODEL
+        limits = self._limits.get(model)
+        if limits is None:
+            limits = self._limits[model] = ModelLimits(self.requests_per_minute, self.tokens_per_minute)
+        return limits
+
+    def _wait_needed(self, limits: ModelLimits, cost: float, priority: int, now: float) -> float:
+        reserve = limits.tokens.capacity * self.background_reserve if priority >= PRIORITY_BACKGROUND else 0.0
+        return max(
+            limits.blocked_until - now,
+            limits.requests.seconds_until(1),
+            limits.tokens.seconds_until(cost + reserve),
+            0.0
+        )
+
+    def admissible_tokens(self, model: Optional[str] = None) -> float:
+        """Largest reservation a single call to `model` can make; bigger estimates are capped to it."""
+        with self._cond:
+            return self._limits_for(model).tokens.capacity * (1 - self.background_reserve)
+
+    def tokens_per_second(self, model: Optional[str] = None) -> float:
+        with self._cond:
+            return self._limits_for(model).tokens.rate
+
+    def blocked_for(self, model: Optional[str] = None) -> float:
+        """Seconds left on a 429 block for `model`."""
+        with self._cond:
+            return max(0.0, self._limits_for(model).blocked_until - time.monotonic())
+
+    def acquire(self, estimated_tokens: int, priority: int = PRIORITY_DEFAULT,
+                max_wait: Optional[float] = None, model: Optional[str] = None) -> bool:
+        max_wait = self.max_wait.get(priority, self.max_wait[PRIORITY_DEFAULT]) if max_wait is None else max_wait
+        start = time.monotonic()
+        deadline = start + max_wait
+
+        with self._cond:
+            limits = self._limits_for(model)
+            cost = min(float(estimated_tokens), limits.tokens.capacity * (1 - self.background_reserve))
+            entry = (priority, next(self._sequence))
+            heapq.heappush(limits.waiters, entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    limits.refill(now)
+                    wait_for = self._wait_needed(limits, cost, priority, now)
+
+                    if limits.waiters[0] == entry and wait_for <= 0:
+                        limits.requests.level -= 1
+                        limits.tokens.level -= cost
+                        self._counters["admitted"] += 1
+                        self._counters["wait_seconds"] += now - start
+                        return True
+
+                    if now + wait_for > deadline:
+                        self._counters["shed"] += 1
+                        return False
+
+                    self._cond.wait(timeout=min(max(wait_for, 0.05), 0.5))
+            finally:
+                limits.waiters.remove(entry)
+                heapq.heapify(limits.waiters)
+                self._cond.notify_all()
+
+    def record_response(self, headers: Mapping[str, str], status_code: int,
+                        estimated_tokens: int = 0, used_tokens: Optional[int] = None,
+                        model: Optional[str] = None):
+        """Correct `model`'s buckets from x-ratelimit-* headers and refund over-estimated tokens."""
+        now = time.monotonic()
+
+        def header_float(name):
+            try:
+                return float(headers.get(name)) if headers.get(name) is not None else None
+            except (TypeError, ValueError):
+                return None
+
+        with self._cond:
+            limits = self._limits_for(model)
+            limits.refill(now)
+            if used_tokens is not None and estimated_tokens:
+                limits.tokens.level = min(limits.tokens.capacity,
+                                          limits.tokens.level + estimated_tokens - used_tokens)
+
+            limits.requests.sync(
+                header_float("x-ratelimit-limit-requests"),
+                header_float("x-ratelimit-remaining-requests"),
+                parse_reset_duration(headers.get("x-ratelimit-reset-requests")),
+                now
+            )
+            limits.tokens.sync(
+                header_float("x-ratelimit-limit-tokens"),
+                header_float("x-ratelimit-remaining-tokens"),
+                parse_reset_duration(headers.get("x-ratelimit-reset-tokens")),
+                now
+            )
+
+            if status_code == 429:
+                self._counters["throttled_429"] += 1
+                retry_after = parse_reset_duration(headers.get("retry-after")) or 1.0
+                limits.blocked_until = max(limits.blocked_until, now + retry_after)
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = time.monotonic()
+            stats = dict(self._counters)
+            models = {}
+            for model, limits in self._limits.items():
+                limits.refill(now)
+                models[model] = {
+                    "queue_depth": len(limits.waiters),
+                    "requests_available": round(limits.requests.level, 2),
+                    "requests_capacity": limits.requests.capacity,
+                    "tokens_available": round(limits.tokens.level, 1),
+                    "tokens_capacity": limits.tokens.capacity,
+                    "blocked_for": round(max(0.0, limits.blocked_until - now), 2)
+                }
+            stats["queue_depth"] = sum(model_stats["queue_depth"] for model_stats in models.values())
+            stats["models"] = models
+        return stats
+
+
+_SCHEDULER: Optional[RateLimitScheduler] = None
+_SCHEDULER_LOCK = threading.Lock()
+
+
+def get_shared_scheduler() -> RateLimitScheduler:
+    global _SCHEDULER
+    with _SCHEDULER_LOCK:
+        if _SCHEDULER is None:
+            _SCHEDULER = RateLimitScheduler(
+                requests_per_minute=int(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30")),
+                tokens_per_minute=int(os.getenv("GROQ_TOKENS_PER_MINUTE", "6000"))
+            )
+        return _SCHEDULER
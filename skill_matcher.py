@@ -0,0 +1,175 @@
+import json
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional
+
+# Canonical skill -> category and the spellings that mean it. Aliases marked case-sensitive
+# are ordinary English words that only count as a skill when written exactly like this.
+SKILL_TAXONOMY: Dict[str, Dict] = {
+    "Python": {"category": "language"},
+    "JavaScript": {"category": "language", "aliases": ["js", "ecmascript", "es6"]},
+    "TypeScript": {"category": "language"},
+    "Java": {"category": "language"},
+    "Kotlin": {"category": "language"},
+    "Swift": {"category": "language", "case_sensitive": ["Swift"]},
+    "Go": {"category": "language", "aliases": ["golang"], "case_sensitive": ["Go"]},
+    "Rust": {"category": "language", "case_sensitive": ["Rust"]},
+    "Ruby": {"category": "language"},
+    "PHP": {"category": "language"},
+    "C++": {"category": "language", "aliases": ["cpp"]},
+    "C#": {"category": "language", "aliases": ["csharp"]},
+    "Scala": {"category": "language"},
+    "SQL": {"category": "language"},
+    "HTML": {"category": "language", "aliases": ["html5"]},
+    "CSS": {"category": "language", "aliases": ["css3"]},
+    "React": {"category": "framework", "aliases": ["reactjs", "react.js"]},
+    "React Native": {"category": "framework"},
+    "Angular": {"category": "framework", "aliases": ["angularjs"]},
+    "Vue.js": {"category": "framework", "aliases": ["vue", "vuejs"]},
+    "Node.js": {"category": "framework", "aliases": ["nodejs", "node js"]},
+    "Django": {"category": "framework"},
+    "Flask": {"category": "framework"},
+    "Spring Boot": {"category": "framework", "aliases": ["spring framework"]},
+    ".NET": {"category": "framework", "aliases": ["dotnet", "asp.net"]},
+    "TensorFlow": {"category": "framework"},
+    "PyTorch": {"category": "framework"},
+    "AWS": {"category": "cloud", "aliases": ["amazon web services"]},
+    "Azure": {"category": "cloud", "aliases": ["microsoft azure"]},
+    "GCP": {"category": "cloud", "aliases": ["google cloud", "google cloud platform"]},
+    "Cloud Computing": {"category": "cloud"},
+    "Docker": {"category": "devops"},
+    "Kubernetes": {"category": "devops", "aliases": ["k8s"]},
+    "Terraform": {"category": "devops"},
+    "Jenkins": {"category": "devops"},
+    "CI/CD": {"category": "devops", "aliases": ["cicd", "continuous integration"]},
+    "DevOps": {"category": "devops"},
+    "Linux": {"category": "devops"},
+    "Git": {"category": "tool"},
+    "GitHub": {"category": "tool"},
+    "GitLab": {"category": "tool"},
+    "REST API": {"category": "architecture", "aliases": ["rest apis", "restful", "restful api"]},
+    "GraphQL": {"category": "architecture"},
+    "Microservices": {"category": "architecture", "aliases": ["microservice"]},
+    "MongoDB": {"category": "data", "aliases": ["mongo"]},
+    "PostgreSQL": {"category": "data", "aliases": ["postgres"]},
+    "MySQL": {"category": "data"},
+    "Redis": {"category": "data"},
+    "Machine Learning": {"category": "data", "aliases": ["ml"]},
+    "Data Analysis": {"category": "data", "aliases": ["data analytics"]},
+    "Data Science": {"category": "data"},
+    "Tableau": {"category": "data"},
+    "Agile": {"category": "practice"},
+    "Scrum": {"category": "practice"},
+    "Project Management": {"category": "soft"},
+    "Leadership": {"category": "soft"},
+    "Communication": {"category": "soft"},
+    "Problem Solving": {"category": "soft", "aliases": ["problem-solving"]},
+    "Teamwork": {"category": "soft", "aliases": ["team work"]},
+}
+
+
+class SkillMatch:
+    def __init__(self, skill: str, text: str, start: int, end: int):
+        self.skill = skill
+        self.text = text
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        return f"SkillMatch({self.skill!r}, {self.start}, {self.end})"
+
+
+class PhraseMatcher:
+    """Finds whole-word phrases from a large vocabulary in one pass over the text.
+
+    The phrases are folded into a prefix trie and compiled into a single regular
+    expression, so shared prefixes are tested once and the scan runs inside the regex
+    engine rather than once per phrase. A hit only counts when it is not glued to
+    surrounding letters or digits: "Go" never matches inside "Google" and "Java" never
+    matches inside "JavaScript". At any position the longest phrase wins.
+    """
+
+    def __init__(self, phrases: Dict[str, str], case_sensitive: Iterable[str] = ()):
+        self._values = {phrase.lower(): value for phrase, value in phrases.items()}
+        self._exact = {phrase.lower(): phrase for phrase in case_sensitive}
+        trie: Dict[str, Dict] = {}
+        for phrase in self._values:
+            node = trie
+            for char in phrase:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        self._pattern = re.compile(r"(?<!\w)(?:" + self._compile(trie) + r")(?!\w)", re.IGNORECASE)
+
+    @classmethod
+    def _compile(cls, node: Dict[str, Dict]) -> str:
+        branches = [re.escape(char) + cls._compile(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional suffix: a longer phrase is preferred over its own prefix.
+        return f"(?:{body})?" if "" in node else body
+
+    def find(self, text: str) -> List[SkillMatch]:
+        """Non-overlapping whole-word matches with their character offsets, in text order."""
+        matches = []
+        for match in self._pattern.finditer(text or ""):
+            found = match.group()
+            key = found.lower()
+            if key in self._exact and found != self._exact[key]:
+                continue
+            matches.append(SkillMatch(self._values[key], found, match.start(), match.end()))
+        return matches
+
+    def values(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """Distinct canonical values found, in order of first appearance."""
+        found = list(dict.fromkeys(match.skill for match in self.find(text)))
+        return found if limit is None else found[:limit]
+
+
+class SkillMatcher(PhraseMatcher):
+    """PhraseMatcher compiled from a skills taxonomy with aliases and categories."""
+
+    def __init__(self, taxonomy: Optional[Dict[str, Dict]] = None):
+        self.taxonomy = dict(SKILL_TAXONOMY if taxonomy is None else taxonomy)
+        phrases, exact = {}, []
+        for skill, entry in self.taxonomy.items():
+            phrases[skill] = skill
+            for alias in entry.get("aliases", []):
+                phrases[alias] = skill
+            exact.extend(entry.get("case_sensitive", []))
+        super().__init__(phrases, exact)
+
+    def skills(self, text: str, limit: Optional[int] = None) -> List[str]:
+        return self.values(text, limit)
+
+    def category(self, skill: str) -> Optional[str]:
+        return self.taxonomy.get(skill, {}).get("category")
+
+
+def load_taxonomy(path: str) -> Dict[str, Dict]:
+    """The built-in taxonomy extended (or overridden per skill) by a JSON file of the same shape."""
+    taxonomy = dict(SKILL_TAXONOMY)
+    with open(path, "r", encoding="utf-8") as f:
+        taxonomy.update(json.load(f))
+    return taxonomy
+
+
+_SKILL_MATCHER: Optional[SkillMatcher] = None
+_SKILL_MATCHER_LOCK = threading.Lock()
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """Process-wide matcher, compiled once; SKILLS_TAXONOMY_PATH adds skills from a JSON file."""
+    global _SKILL_MATCHER
+    with _SKILL_MATCHER_LOCK:
+        if _SKILL_MATCHER is None:
+            taxonomy = None
+            path = os.getenv("SKILLS_TAXONOMY_PATH")
+            if path:
+                try:
+                    taxonomy = load_taxonomy(path)
+                except (OSError, ValueError) as e:
+                    print(f"Warning: could not load skills taxonomy from {path}: {e}")
+            _SKILL_MATCHER = SkillMatcher(taxonomy)
+        return _SKILL_MATCHER
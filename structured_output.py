@@ -0,0 +1,317 @@
+import json
+import re
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+CONTINUE_PROMPT = (
+    "Your previous reply was cut off. Continue the JSON exactly where it stopped. "
+    "Output only the remaining characters, with no preamble and no code fences."
+)
+
+_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+_DANGLING_KEY = re.compile(r'"(?:[^"\\]|\\.)*"\s*:\s*$')
+_PARTIAL_SCALAR = re.compile(r'([\[{:,]\s*)[-+\w.]+$')
+
+
+class IncrementalJSONParser:
+    """Character-level JSON scanner that can be fed streamed deltas.
+
+    It tracks string/escape state and bracket depth so it knows when the top-level value
+    is complete, yields each element of a top-level array as soon as it closes, and can
+    close a truncated document for repair.
+    """
+
+    def __init__(self, expect: Optional[type] = None):
+        self.opener = {dict: "{", list: "["}.get(expect)
+        self.buffer = ""
+        self.started = False
+        self.complete = False
+        self.stack: List[str] = []
+        self.in_string = False
+        self.escaped = False
+        self.string_start: Optional[int] = None
+        self.separators: List[int] = []
+        self._item_start: Optional[int] = None
+        self._pos = 0
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Consume a chunk and return any top-level array items completed by it."""
+        items = []
+        if self.complete:
+            return items
+        self.buffer += chunk
+        text = self.buffer
+
+        while self._pos < len(text) and not self.complete:
+            ch = text[self._pos]
+            i = self._pos
+            self._pos += 1
+
+            if not self.started:
+                if ch == self.opener or (self.opener is None and ch in "{["):
+                    self.buffer = text = text[i:]
+                    self._pos = 1
+                    self.started = True
+                    self.stack.append(ch)
+                    self._item_start = None
+                continue
+
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+                continue
+
+            if ch == '"':
+                self.in_string = True
+                self.string_start = i
+                if len(self.stack) == 1 and self.stack[0] == "[" and self._item_start is None:
+                    self._item_start = i
+            elif ch in "{[":
+                if len(self.stack) == 1 and self.stack[0] == "[" and self._item_start is None:
+                    self._item_start = i
+                self.stack.append(ch)
+            elif ch in "}]":
+                if self.stack:
+                    self.stack.pop()
+                if len(self.stack) == 0:
+                    items += self._close_item(text, i)
+                    self.complete = True
+                    self.buffer = text[:i + 1]
+            elif ch == ",":
+                self.separators.append(i)
+                if len(self.stack) == 1 and self.stack[0] == "[":
+                    items += self._close_item(text, i)
+            elif not ch.isspace():
+                if len(self.stack) == 1 and self.stack[0] == "[" and self._item_start is None:
+                    self._item_start = i
+
+        if not self.started:
+            self.buffer, self._pos = "", 0
+        return items
+
+    def _close_item(self, text: str, end: int) -> List[Any]:
+        start, self._item_start = self._item_start, None
+        if start is None:
+            return []
+        try:
+            return [json.loads(_TRAILING_COMMA.sub(r'\1', text[start:end].strip()))]
+        except json.JSONDecodeError:
+            return []
+
+    @property
+    def truncated(self) -> bool:
+        return self.started and not self.complete
+
+    def closed_text(self, text: Optional[str] = None) -> str:
+        """Close the open containers of `text` (default: everything fed so far).
+
+        A string cut off part-way is dropped together with its key rather than closed, so a
+        truncated value never passes for a complete one.
+        """
+        scanner = IncrementalJSONParser()
+        scanner.feed(self.buffer if text is None else text)
+        tail = scanner.buffer
+        if scanner.in_string:
+            tail = tail[:scanner.string_start]
+        tail = _DANGLING_KEY.sub("", tail.rstrip())
+        tail = tail.rstrip().rstrip(",").rstrip()
+        for opener in reversed(scanner.stack):
+            tail += "}" if opener == "{" else "]"
+        return tail
+
+    def complete_prefix(self) -> str:
+        """The fed text without the value the truncation cut into.
+
+        For a top-level array that is the whole unfinished element; otherwise a cut-off string
+        or a trailing number or literal, which may have been cut short too.
+        """
+        if not self.truncated:
+            return self.buffer
+        if self.stack[:1] == ["["] and self._item_start is not None:
+            item = self.buffer[self._item_start:].rstrip()
+            if len(self.stack) > 1 or self.in_string or item[-1:] not in ('}', ']', '"'):
+                return self.buffer[:self._item_start]
+            return self.buffer
+        if self.in_string:
+            return self.buffer[:self.string_start]
+        return _PARTIAL_SCALAR.sub(r"\1", self.buffer.rstrip())
+
+
+def strip_code_fences(text: str) -> str:
+    clean = text.strip()
+    if clean.startswith("```json"):
+        clean = clean[7:]
+    elif clean.startswith("```"):
+        clean = clean[3:]
+    if clean.endswith("```"):
+        clean = clean[:-3]
+    return clean.strip()
+
+
+def repair_json(text: str, expect: Optional[type] = None, max_cuts: int = 200) -> Optional[Any]:
+    """Best-effort parse of a truncated document by closing it, cutting back one element at a time.
+
+    Whatever the truncation cut into is dropped first, so only fully received values survive.
+    """
+    parser = IncrementalJSONParser(expect)
+    parser.feed(text)
+    if not parser.started:
+        return None
+    candidate = parser.complete_prefix()
+    separators = list(parser.separators)
+
+    for _ in range(max_cuts):
+        closed = _TRAILING_COMMA.sub(r'\1', parser.closed_text(candidate))
+        try:
+            return json.loads(closed)
+        except json.JSONDecodeError:
+            pass
+        while separators and separators[-1] >= len(candidate):
+            separators.pop()
+        if not separators:
+            return None
+        candidate = candidate[:separators.pop()]
+    return None
+
+
+class ParseResult:
+    def __init__(self, value: Any, status: str, truncated: bool):
+        self.value = value
+        self.status = status
+        self.truncated = truncated
+
+
+def parse_json(text: str, expect: Optional[type] = None) -> ParseResult:
+    """Extract the first JSON value of the expected type; status is 'ok', 'repaired' or 'failed'."""
+    if not text:
+        return ParseResult(None, "failed", False)
+    parser = IncrementalJSONParser(expect)
+    parser.feed(strip_code_fences(text))
+    if not parser.started:
+        return ParseResult(None, "failed", False)
+
+    if parser.complete:
+        try:
+            value = json.loads(_TRAILING_COMMA.sub(r'\1', parser.buffer))
+            if expect is None or isinstance(value, expect):
+                return ParseResult(value, "ok", False)
+        except json.JSONDecodeError:
+            pass
+
+    value = repair_json(parser.buffer, expect)
+    if value is not None and (expect is None or isinstance(value, expect)):
+        return ParseResult(value, "repaired", parser.truncated)
+    return ParseResult(None, "failed", parser.truncated)
+
+
+def validate(value: Any, schema: Optional[Dict[str, Any]]) -> List[str]:
+    """Check a parsed value against a small schema: type, required keys, property types, item schema."""
+    if not schema:
+        return []
+    errors = []
+    expected = schema.get("type")
+    if expected and not isinstance(value, expected):
+        return [f"expected {expected.__name__}, got {type(value).__name__}"]
+
+    if isinstance(value, dict):
+        for key in schema.get("required", []):
+            if key not in value:
+                errors.append(f"missing '{key}'")
+        for key, types in schema.get("properties", {}).items():
+            if value.get(key) is not None and not isinstance(value[key], types):
+                errors.append(f"'{key}' has type {type(value[key]).__name__}")
+
+    if isinstance(value, list):
+        if len(value) < schema.get("min_items", 0):
+            errors.append(f"expected at least {schema['min_items']} items")
+        item_schema = schema.get("items")
+        if item_schema:
+            for index, item in enumerate(value):
+                errors += [f"[{index}] {error}" for error in validate(item, item_schema)]
+    return errors
+
+
+def prune_invalid_items(value: Any, schema: Optional[Dict[str, Any]]) -> Any:
+    """Drop array elements that fail the item schema, e.g. a half-written last element after repair."""
+    if not isinstance(value, list) or not schema or not schema.get("items"):
+        return value
+    return [item for item in value if not validate(item, schema["items"])]
+
+
+NUMBER = (int, float)
+
+SCHEMAS = {
+    "parse_resume_data": {
+        "type": dict,
+        "properties": {"skills": (list, str), "experience": (list, str), "education": (list, str),
+                       "projects": list, "name": str, "email": str}
+    },
+    "generate_interview_questions": {
+        "type": list, "min_items": 1,
+        "items": {"type": dict, "required": ["question"], "properties": {"question": str}}
+    },
+    "evaluate_interview_answer": {
+        "type": dict, "required": ["score"], "properties": {"score": NUMBER, "strengths": list, "weaknesses": list}
+    },
+    "analyze_chat_interview": {
+        "type": dict, "required": ["overall_score"],
+        "properties": {"overall_score": NUMBER, "strengths": list, "question_scores": list}
+    },
+    "_score_job_match": {
+        "type": dict, "required": ["match_score"], "properties": {"match_score": NUMBER}
+    },
+    "_score_job_batch": {
+        "type": list, "items": {"type": dict, "required": ["job_id"]}
+    },
+    "analyze_job_requirements": {
+        "type": dict, "required": ["match_percentage"],
+        "properties": {"match_percentage": NUMBER, "missing_skills": list, "matching_skills": list}
+    },
+    "generate_dynamic_jobs": {
+        "type": list, "min_items": 1,
+        "items": {"type": dict, "required": ["title", "company"], "properties": {"skills": list}}
+    },
+    "generate_dynamic_salary_insights": {
+        "type": dict, "required": ["entry_level", "mid_level", "senior_level"],
+        "properties": {"entry_level": dict, "mid_level": dict, "senior_level": dict}
+    },
+    "generate_trending_skills": {"type": list, "min_items": 1, "items": {"type": str}},
+    "generate_company_insights": {"type": dict, "required": ["company_name"]},
+    "generate_market_trends": {"type": dict, "required": ["industry"], "properties": {"hot_roles": list}},
+}
+
+
+class StructuredOutputStats:
+    """Per-feature counters for how JSON responses were recovered."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(lambda: {
+            "calls": 0, "clean": 0, "repaired": 0, "continuations": 0, "schema_failures": 0, "failures": 0
+        })
+
+    def record(self, feature: str, status: str, continuations: int, schema_errors: List[str]):
+        with self._lock:
+            counters = self._counters[feature]
+            counters["calls"] += 1
+            counters["continuations"] += continuations
+            if status == "failed":
+                counters["failures"] += 1
+            elif schema_errors:
+                counters["schema_failures"] += 1
+            elif status == "repaired":
+                counters["repaired"] += 1
+            else:
+                counters["clean"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {feature: dict(counters) for feature, counters in self._counters.items()}
+
+
+STATS = StructuredOutputStats()
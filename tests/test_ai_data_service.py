@@ -0,0 +1,96 @@
+import json
+import re
+import time
+
+import pytest
+
+from ai_data_service import AIDataService
+from conftest import FakeClock
+from data_cache import MemoryLRUCache
+from groq_service import GroqLLM
+from rate_limiter import RateLimitScheduler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setenv("MARKET_SNAPSHOT_DISABLED", "1")
+    monkeypatch.setenv("LLM_CACHE_DISABLED", "1")
+    service = AIDataService("test-key", cache=MemoryLRUCache())
+    service.requested_sizes = []
+
+    def generate_json(prompt, feature, expect_list=True, max_tokens=1500, max_wait=None):
+        size = int(re.search(r"Generate (\d+) realistic", prompt).group(1))
+        focus = re.search(r"- Focus: (.+)", prompt).group(1)
+        service.requested_sizes.append(size)
+        return [{"title": f"Engineer {focus} {i}", "company": f"{focus} {len(service.requested_sizes)} co {i}",
+                 "location": "Remote", "description": f"Role {i} at {focus}"} for i in range(size)]
+
+    service._generate_json = generate_json
+    yield service
+    service._refresh_executor.shutdown(wait=True)
+
+
+def test_stale_refresh_keeps_the_larger_entry(service, clock):
+    assert len(service.generate_dynamic_jobs("python", limit=50)) == 50
+    service.requested_sizes.clear()
+    clock.advance(service.ttls["jobs"] + 1)
+
+    assert len(service.generate_dynamic_jobs("python", limit=10)) == 10
+    service._refresh_executor.shutdown(wait=True)
+
+    assert sum(service.requested_sizes) == 50
+    service.requested_sizes.clear()
+    assert len(service.generate_dynamic_jobs("python", limit=50)) == 50
+    assert service.requested_sizes == []
+
+
+class JobsResponse:
+    """A completion holding the jobs the prompt asked for, reporting its full token budget as used."""
+
+    def __init__(self, payload):
+        prompt = payload["messages"][-1]["content"]
+        size = int(re.search(r"Generate (\d+) realistic", prompt).group(1))
+        focus = re.search(r"- Focus: (.+)", prompt).group(1)
+        self.jobs = [{"title": f"Engineer {i}", "company": f"{focus} {i}", "location": "Remote",
+                      "description": f"Role {i} at {focus}"} for i in range(size)]
+        self.tokens = len(prompt) // 4 + payload["max_tokens"]
+        self.status_code = 200
+        self.headers = {}
+
+    def json(self):
+        return {"choices": [{"message": {"content": json.dumps(self.jobs)}}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": self.tokens, "total_tokens": self.tokens}}
+
+
+class JobsTransport:
+    def __init__(self):
+        self.sizes = []
+
+    def post(self, url, **kwargs):
+        response = JobsResponse(kwargs["json"])
+        self.sizes.append(len(response.jobs))
+        return response
+
+
+def test_fifty_jobs_fit_the_default_rate_limits(service, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    scheduler = RateLimitScheduler()
+    # Waiting for the token bucket advances the fake clock instead of sleeping.
+    scheduler._cond.wait = lambda timeout=None: clock.advance(timeout)
+    service.groq_service = GroqLLM("gsk_test", use_cache=False, scheduler=scheduler)
+    service.groq_service.transport = transport = JobsTransport()
+    del service._generate_json
+
+    jobs = service.generate_dynamic_jobs("python", limit=50)
+
+    assert len(jobs) == 50
+    assert sum(transport.sizes) == 50
+    assert scheduler.stats()["shed"] == 0
@@ -0,0 +1,50 @@
+import time
+
+import pytest
+
+import cache_keys
+from cache_keys import KeyHitStats
+from conftest import FakeClock
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+def test_word_order_case_and_aliases_share_a_key():
+    assert (cache_keys.jobs_key("Python  Developer", "NYC", "Senior Level (6-10 years)", "Full-time Jobs")
+            == cache_keys.jobs_key("developer python", "new york, ny", "senior", "full time"))
+    assert cache_keys.salary_key("Data Scientist", "SF") == cache_keys.salary_key("scientist data", "San Francisco, CA")
+    assert cache_keys.company_key("Acme, Inc.") == cache_keys.company_key("ACME")
+
+
+def test_language_symbols_keep_keys_apart():
+    keys = {cache_keys.jobs_key(f"{language} Developer", "New York", "", "")
+            for language in ("C++", "C#", "C", ".NET", "Node.js")}
+    assert len(keys) == 5
+    assert cache_keys.canonical_terms("C++ developer. C#") == "c# c++ developer"
+
+
+def test_canonical_hit_served_raw_repeat_counts_as_raw_hit(clock):
+    stats = KeyHitStats()
+    stats.record("developer python", False, ttl=60)
+    stats.record("python developer", True, ttl=60)
+    stats.record("python developer", True, ttl=60)
+    result = stats.stats()
+    assert (result["canonical_hits"], result["raw_hits"]) == (2, 1)
+    assert result["hit_rate_gain"] == pytest.approx(0.333)
+
+
+def test_raw_shadow_keys_expire_and_stay_bounded(clock):
+    stats = KeyHitStats(max_shadow_keys=2)
+    stats.record("a", False, ttl=60)
+    clock.advance(61)
+    stats.record("a", True, ttl=60)
+    assert stats.stats()["raw_hits"] == 0
+    stats.record("b", False, ttl=60)
+    stats.record("c", False, ttl=60)
+    stats.record("a", True, ttl=60)
+    assert stats.stats()["raw_hits"] == 0
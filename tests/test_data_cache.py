@@ -0,0 +1,169 @@
+import threading
+import time
+
+import pytest
+
+import data_cache
+from conftest import FakeClock
+from data_cache import MemoryLRUCache, RedisDataCache, SingleFlight, SQLiteDataCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return MemoryLRUCache(max_entries=3)
+    return SQLiteDataCache(str(tmp_path / "data.sqlite3"), max_entries=3)
+
+
+class FakeRedis:
+    """Just enough of the redis client for RedisDataCache, expiring keys on the patched clock."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        value, expires_at = self.values.get(key, (None, 0))
+        return value if expires_at > time.time() else None
+
+    def set(self, key, value, ex):
+        self.values[key] = (value, time.time() + ex)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    def scan_iter(self, match):
+        return [key for key in self.values if key.startswith(match.rstrip("*"))]
+
+
+def test_values_round_trip_as_copies(cache, clock):
+    value = {"jobs": [{"title": "Engineer"}]}
+    cache.set("k", value, ttl=60)
+    found = cache.get("k")
+    assert found == value
+    found["jobs"].clear()
+    assert cache.get("k") == value
+
+
+def test_entry_turns_stale_then_expires(cache, clock):
+    cache.set("k", [1], ttl=60, stale_ttl=120)
+    assert cache.lookup("k") == ([1], True)
+    clock.advance(61)
+    assert cache.lookup("k") == ([1], False)
+    assert cache.get("k") is None
+    clock.advance(120)
+    assert cache.lookup("k") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (1, 2, 1)
+
+
+def test_least_recently_used_entry_is_evicted(cache, clock):
+    for key in "abc":
+        cache.set(key, key, ttl=60)
+        clock.advance(1)
+    cache.get("a")
+    clock.advance(1)
+    cache.set("d", "d", ttl=60)
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in "acd"] == ["a", "c", "d"]
+    assert cache.stats()["evictions"] == 1
+    assert cache.entries() == 3
+
+
+def test_purge_keeps_stale_entries_until_they_expire(cache, clock):
+    cache.set("short", 1, ttl=10)
+    cache.set("stale", 2, ttl=10, stale_ttl=100)
+    clock.advance(20)
+    assert cache.purge_expired() == 1
+    assert cache.lookup("stale") == (2, False)
+
+
+def test_delete_and_clear(cache, clock):
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.delete("a")
+    assert cache.get("a") is None and cache.get("b") == 2
+    cache.clear()
+    assert cache.entries() == 0
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path, clock):
+    path = str(tmp_path / "data.sqlite3")
+    SQLiteDataCache(path).set("k", {"v": 1}, ttl=60)
+    assert SQLiteDataCache(path).get("k") == {"v": 1}
+
+
+def test_redis_cache_serves_stale_values_until_the_server_expires_them(clock):
+    client = FakeRedis()
+    cache = RedisDataCache(client=client, prefix="t:")
+    cache.set("k", {"v": 1}, ttl=60, stale_ttl=60)
+    assert cache.lookup("k") == ({"v": 1}, True)
+    clock.advance(90)
+    assert cache.lookup("k") == ({"v": 1}, False)
+    clock.advance(60)
+    assert cache.lookup("k") is None
+    cache.set("a", 1, ttl=60)
+    cache.clear()
+    assert client.values == {}
+
+
+def test_unknown_backend_falls_back_to_memory(monkeypatch):
+    monkeypatch.delenv("AI_DATA_CACHE_DISABLED", raising=False)
+    monkeypatch.setenv("AI_DATA_CACHE_BACKEND", "nope")
+    monkeypatch.setattr(data_cache, "_DATA_CACHE", None)
+    assert isinstance(data_cache.get_shared_data_cache(), MemoryLRUCache)
+    monkeypatch.setenv("AI_DATA_CACHE_DISABLED", "1")
+    assert data_cache.get_shared_data_cache() is None
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", work)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flight.do("k", work))) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    while flight.stats()["coalesced"] < 3:
+        time.sleep(0.01)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+    assert len(calls) == 1
+    assert sorted(results) == [("value", False)] + [("value", True)] * 3
+    assert not flight.in_flight("k")
+
+
+def test_single_flight_error_is_raised_and_not_kept():
+    flight = SingleFlight()
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        flight.do("k", fail)
+    assert flight.do("k", lambda: 1) == (1, False)
+
+
+def test_default_path_expands_user(monkeypatch):
+    monkeypatch.setenv("AI_DATA_CACHE_PATH", "~/resumate-test/data.sqlite3")
+    path = data_cache.default_data_cache_path()
+    assert not path.startswith("~")
+    assert path.endswith("resumate-test/data.sqlite3")
@@ -0,0 +1,71 @@
+import threading
+import time
+
+import data_extractor
+from data_extractor import JobSearcher
+
+
+class FakeIndex:
+    def __init__(self):
+        self.upserted = []
+        self.refreshed = []
+
+    def upsert(self, jobs):
+        self.upserted += jobs
+        return len(jobs)
+
+    def mark_refreshed(self, keywords, location, count):
+        self.refreshed.append((keywords, location, count))
+
+
+class FakeScraper:
+    def __init__(self, jobs, gate=None):
+        self.jobs = jobs
+        self.gate = gate
+        self.calls = 0
+
+    def aggregate_job_search(self, keywords, location="", limit=20):
+        self.calls += 1
+        if self.gate:
+            self.gate.wait(5)
+        return list(self.jobs)
+
+
+def make_searcher(scraper, index=None):
+    searcher = JobSearcher.__new__(JobSearcher)
+    searcher.job_scraper = scraper
+    searcher.scraper_available = True
+    searcher.job_index = index
+    return searcher
+
+
+def test_fallback_jobs_are_returned_but_not_indexed():
+    index = FakeIndex()
+    jobs = [{"title": "Scraped", "source": "indeed"}, {"title": "Canned", "source": "linkedin_fallback"},
+            {"title": "Generated", "source": "glassdoor_ai_fallback"}]
+    result = make_searcher(FakeScraper(jobs), index)._scrape_and_index("python", "", 10)
+    assert len(result) == 3
+    assert [job["title"] for job in index.upserted] == ["Scraped"]
+    assert index.refreshed == [("python", "", 1)]
+
+
+def test_only_fallback_jobs_leave_the_query_stale():
+    index = FakeIndex()
+    jobs = [{"title": "Canned", "source": "indeed_fallback"}]
+    assert make_searcher(FakeScraper(jobs), index)._scrape_and_index("python", "", 10) == jobs
+    assert index.upserted == []
+    assert index.refreshed == []
+
+
+def test_background_refresh_is_shared_across_searcher_instances():
+    gate = threading.Event()
+    scraper = FakeScraper([], gate)
+    try:
+        make_searcher(scraper)._refresh_in_background("python", "Remote", 10)
+        make_searcher(scraper)._refresh_in_background("Python ", "remote", 10)
+    finally:
+        gate.set()
+    deadline = time.monotonic() + 5
+    while data_extractor._REFRESHING and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert scraper.calls == 1
@@ -0,0 +1,128 @@
+import json
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from conftest import FakeClock
+from groq_service import GroqLLM
+from llm_metrics import LLMMetrics
+from rate_limiter import RateLimitScheduler
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content="ok", headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = content
+        self._content = content
+        self.elapsed = None
+
+    def json(self):
+        return {"choices": [{"message": {"content": self._content}}],
+                "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}}
+
+
+class FakeTransport:
+    def __init__(self, responses=None, deltas=("hello ", "world")):
+        self.responses = list(responses or [])
+        self.deltas = deltas
+        self.models = []
+
+    def post(self, url, **kwargs):
+        self.models.append(kwargs["json"]["model"])
+        return self.responses.pop(0) if self.responses else FakeResponse()
+
+    @contextmanager
+    def stream(self, url, **kwargs):
+        self.models.append(kwargs["json"]["model"])
+        chunks = [{"choices": [{"delta": {"content": word}}]} for word in self.deltas]
+        yield FakeResponse(), [f"data: {json.dumps(chunk)}" for chunk in chunks] + ["data: [DONE]"]
+
+
+class Collect:
+    def __init__(self):
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def llm():
+    sink = Collect()
+    llm = GroqLLM("gsk_test", use_cache=False, scheduler=RateLimitScheduler(), metrics=LLMMetrics([sink]))
+    llm.transport = FakeTransport()
+    llm.sink = sink
+    return llm
+
+
+def test_public_methods_label_their_calls(llm):
+    llm.chat_about_resume("resume", "hi")
+    assert [record["feature"] for record in llm.sink.records] == ["chat_about_resume"]
+
+
+def test_calls_through_a_wrapper_keep_their_label(llm):
+    def wrapper():
+        return llm._make_request([{"role": "user", "content": "x"}], feature="custom")
+    wrapper()
+    llm._make_request([{"role": "user", "content": "x"}])
+    assert [record["feature"] for record in llm.sink.records] == ["custom", "unlabeled"]
+
+
+def test_stream_timing_starts_when_consumed(llm, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    stream = llm.chat_about_resume("resume", "hi", stream=True)
+    clock.advance(30)
+    assert "".join(stream) == "hello world"
+    record = llm.sink.records[-1]
+    assert record["feature"] == "chat_about_resume"
+    assert record["wall_ms"] < 1000
+
+
+def test_throttled_primary_falls_back_without_waiting(llm):
+    llm.scheduler.record_response({"retry-after": "60"}, 429, model="llama-3.3-70b-versatile")
+    started = time.monotonic()
+    llm._make_request([{"role": "user", "content": "x"}], feature="generate_enhanced_resume")
+    assert time.monotonic() - started < 1
+    assert llm.transport.models == ["llama-3.1-8b-instant"]
+    assert llm.sink.records[-1]["fallback"] is True
+
+
+def test_429_on_primary_moves_to_fallback(llm):
+    llm.transport.responses = [FakeResponse(429, headers={"retry-after": "30"})]
+    assert llm._make_request([{"role": "user", "content": "x"}], feature="generate_enhanced_resume") == "ok"
+    assert llm.transport.models == ["llama-3.3-70b-versatile", "llama-3.1-8b-instant"]
+    assert llm.scheduler.blocked_for("llama-3.1-8b-instant") == 0
+
+
+def test_rejected_json_is_not_cached_for_retries(tmp_path):
+    from llm_cache import LLMResponseCache
+    llm = GroqLLM("gsk_test", cache=LLMResponseCache(str(tmp_path / "llm.sqlite3")),
+                  scheduler=RateLimitScheduler(), metrics=LLMMetrics([Collect()]))
+    llm.transport = FakeTransport([FakeResponse(content='{"reason": "no score"}'),
+                                   FakeResponse(content='{"match_score": 80}')])
+    messages = [{"role": "user", "content": "score this"}]
+
+    def score():
+        return llm.request_json(messages, temperature=0.0, feature="_score_job_match")
+
+    assert score() is None
+    assert score() == {"match_score": 80}
+    assert score() == {"match_score": 80}
+    assert len(llm.transport.models) == 2
+
+
+def test_stream_json_items_yields_whole_valid_items(llm):
+    llm.transport = FakeTransport(deltas=('[{"question": "A"}, {"qu', 'estion": 1}, {"question": "B"}', ', {"question": "C'))
+    items = list(llm.stream_json_items([{"role": "user", "content": "q"}],
+                                       feature="generate_interview_questions"))
+    assert items == [{"question": "A"}, {"question": "B"}]
+
+
+def test_interview_questions_come_from_the_stream(llm):
+    llm.transport = FakeTransport(deltas=('[{"question": "A"}, {"question": "B"}, ', '{"question": "C"}]'))
+    questions = llm.generate_interview_questions("job", {"name": "Ann"}, num_questions=2)
+    assert [q["question"] for q in questions] == ["A", "B"]
+    assert len(llm.transport.models) == 1
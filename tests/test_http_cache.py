@@ -0,0 +1,101 @@
+import time
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+import http_cache
+from conftest import FakeClock
+from http_cache import CachingHTTPAdapter, HTTPPageCache
+
+URL = "https://www.indeed.com/jobs?q=python"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+class Origin:
+    """Stands in for the network behind the adapter, recording the conditional headers it is sent."""
+
+    def __init__(self):
+        self.responses = []
+        self.requests = []
+
+    def send(self, request):
+        self.requests.append(dict(request.headers))
+        status, body, headers = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        return response
+
+
+@pytest.fixture
+def session(tmp_path, clock, monkeypatch):
+    origin = Origin()
+    monkeypatch.setattr(HTTPAdapter, "send", lambda adapter, request, **kwargs: origin.send(request))
+    cache = HTTPPageCache(str(tmp_path / "pages.sqlite3"), ttls={"www.indeed.com": 60})
+    session = requests.Session()
+    session.mount("https://", CachingHTTPAdapter(cache))
+    session.origin, session.cache = origin, cache
+    return session
+
+
+def test_fresh_page_is_served_without_a_request(session, clock):
+    session.origin.responses = [(200, b"<html>jobs</html>", {"ETag": '"v1"'})]
+    assert session.get(URL).content == b"<html>jobs</html>"
+    clock.advance(30)
+    hit = session.get(URL)
+    assert hit.headers["X-Cache"] == "HIT"
+    assert hit.content == b"<html>jobs</html>"
+    assert len(session.origin.requests) == 1
+    assert session.cache.stats()["fresh_hits"] == 1
+
+
+def test_stale_page_is_revalidated_and_a_304_served_from_the_store(session, clock):
+    session.origin.responses = [(200, b"<html>jobs</html>", {"ETag": '"v1"'}), (304, b"", {})]
+    session.get(URL)
+    clock.advance(61)
+    revalidated = session.get(URL)
+    assert session.origin.requests[1]["If-None-Match"] == '"v1"'
+    assert revalidated.headers["X-Cache"] == "REVALIDATED"
+    assert revalidated.content == b"<html>jobs</html>"
+    assert session.cache.is_fresh(URL)
+    assert session.cache.stats()["revalidation_hit_rate"] == 1.0
+
+
+def test_changed_page_replaces_the_stored_one(session, clock):
+    session.origin.responses = [(200, b"old", {"ETag": '"v1"'}), (200, b"new", {"ETag": '"v2"'})]
+    session.get(URL)
+    clock.advance(61)
+    assert session.get(URL).content == b"new"
+    assert session.cache.lookup(URL)["headers"]["ETag"] == '"v2"'
+
+
+def test_no_store_responses_are_not_cached(session):
+    session.origin.responses = [(200, b"private", {"Cache-Control": "no-store"}), (200, b"private", {})]
+    session.get(URL)
+    assert session.cache.lookup(URL) is None
+    session.get(URL)
+    assert len(session.origin.requests) == 2
+
+
+def test_errors_are_not_cached(session):
+    session.origin.responses = [(503, b"busy", {})]
+    assert session.get(URL).status_code == 503
+    assert session.cache.lookup(URL) is None
+
+
+def test_default_path_expands_user(monkeypatch):
+    monkeypatch.setenv("SCRAPER_CACHE_PATH", "~/resumate-test/pages.sqlite3")
+    path = http_cache.default_page_cache_path()
+    assert not path.startswith("~")
+    assert path.endswith("resumate-test/pages.sqlite3")
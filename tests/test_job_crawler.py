@@ -0,0 +1,41 @@
+from job_crawler import JobCrawler
+from job_index import JobIndex
+from job_scraper import JobSearchResult
+
+
+class FakeScraper:
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.calls = []
+
+    def aggregate_job_search(self, keywords, location="", limit=20, sources=None, fallback=True):
+        self.calls.append(fallback)
+        pages = 1 if self.jobs else 0
+        return JobSearchResult(self.jobs, {"sources": {source: {"status": "ok", "pages": pages}
+                                                       for source in sources}})
+
+
+def make_crawler(tmp_path, jobs):
+    index = JobIndex(str(tmp_path / "jobs.db"))
+    index.record_search("python", "Remote")
+    crawler = JobCrawler(scraper=FakeScraper(jobs), index=index, sources=["indeed"])
+    crawler.plan()
+    return crawler, index
+
+
+def test_crawl_asks_for_scraped_jobs_only(tmp_path):
+    job = {"id": "indeed-1", "title": "Python Developer", "company": "Acme", "location": "Remote",
+           "description": "Python services", "source": "indeed"}
+    crawler, index = make_crawler(tmp_path, [job])
+    assert crawler.crawl_next()
+    assert crawler.scraper.calls == [False]
+    assert not index.is_stale("python", "Remote")
+    assert crawler.stats()["jobs_indexed"] == 1
+
+
+def test_crawl_that_scraped_nothing_leaves_the_query_stale(tmp_path):
+    crawler, index = make_crawler(tmp_path, [])
+    assert crawler.crawl_next()
+    assert index.is_stale("python", "Remote")
+    assert crawler.stats()["jobs_indexed"] == 0
+    assert crawler.plan() == 1
@@ -0,0 +1,83 @@
+import pytest
+
+from job_identity import (NearDuplicateIndex, dedupe_jobs, job_fingerprint, job_id, normalize_company,
+                          normalize_text)
+
+DESCRIPTION = ("We are hiring a backend engineer to design and build scalable Python services, own our "
+               "PostgreSQL data layer, run deployments on Kubernetes and mentor junior developers on the team")
+
+
+def posting(source, title="Senior Backend Engineer", company="Acme Inc", description=DESCRIPTION, **extra):
+    return dict({"title": title, "company": company, "location": "Remote", "description": description,
+                 "source": source, "url": f"https://{source}.example/job"}, **extra)
+
+
+def test_fingerprint_ignores_case_punctuation_and_spacing():
+    first = {"title": "Senior  Backend Engineer", "company": "Acme, Inc.", "location": "Remote"}
+    second = {"title": "senior backend engineer", "company": "ACME Inc", "location": "remote"}
+    assert job_fingerprint(first) == job_fingerprint(second)
+    assert job_id("indeed", first) == job_id("indeed", second)
+    assert job_id("indeed", first) != job_id("linkedin", first)
+
+
+def test_company_suffixes_are_ignored():
+    assert normalize_company("Acme Corporation") == normalize_company("ACME, Inc.") == "acme"
+
+
+def test_cross_source_repost_is_merged_into_the_first_listing():
+    jobs = [posting("indeed"),
+            posting("linkedin", title="Sr. Backend Engineer", description=DESCRIPTION + " Apply today",
+                    salary="$150k")]
+    unique = dedupe_jobs(jobs)
+    assert len(unique) == 1
+    kept = unique[0]
+    assert kept["source"] == "indeed"
+    assert kept["salary"] == "$150k"
+    assert kept["also_listed"] == [{"source": "linkedin", "url": "https://linkedin.example/job"}]
+
+
+def test_same_text_at_another_company_is_not_a_duplicate():
+    assert len(dedupe_jobs([posting("indeed"), posting("linkedin", company="Globex")])) == 2
+
+
+def test_title_overlap_threshold_keeps_different_roles_apart():
+    jobs = [posting("indeed"), posting("linkedin", title="Data Analyst")]
+    assert len(dedupe_jobs(jobs)) == 2
+    assert len(dedupe_jobs(jobs, title_overlap=0.0)) == 1
+
+
+def test_similarity_threshold_decides_near_duplicates():
+    rewritten = ("We are hiring a backend engineer to design and build scalable Go services, own our "
+                 "MySQL data layer, run deployments on Nomad and mentor new graduates across the company")
+    jobs = [posting("indeed"), posting("linkedin", description=rewritten, location="New York")]
+    index = NearDuplicateIndex()
+    similarity = index.similarity(index.signature(jobs[0]), index.signature(jobs[1]))
+    assert 0 < similarity < 0.7
+    assert len(dedupe_jobs(jobs)) == 2
+    assert len(dedupe_jobs(jobs, threshold=similarity, bands=64)) == 1
+
+
+def test_exact_fingerprint_matches_without_any_description():
+    jobs = [posting("indeed", description=""), posting("glassdoor", description="")]
+    assert len(dedupe_jobs(jobs)) == 1
+
+
+def test_similar_descriptions_share_a_band():
+    index = NearDuplicateIndex()
+    index.add(posting("indeed"))
+    near = posting("linkedin", title="Backend Engineer", location="Austin", description=DESCRIPTION + " today")
+    assert index.find(near) is not None
+    assert len(index) == 1
+
+
+def test_bands_must_divide_permutations():
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(num_perm=64, bands=10)
+
+
+def test_language_symbols_keep_jobs_apart():
+    jobs = [posting(source, title=f"{language} Engineer", description="")
+            for source, language in (("indeed", "C++"), ("indeed", "C#"), ("indeed", "C"), ("indeed", ".NET"))]
+    assert len({job_fingerprint(job) for job in jobs}) == 4
+    assert len(dedupe_jobs(jobs)) == 4
+    assert normalize_text("Node.js, C++ and C#. Acme Inc.") == "node.js c++ and c# acme inc"
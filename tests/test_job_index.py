@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+import job_index
+from conftest import FakeClock
+from job_index import JobIndex
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock(time.time())
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def index(tmp_path, clock):
+    return JobIndex(str(tmp_path / "jobs.sqlite3"), refresh_after=3600)
+
+
+def job(title, company="Acme", location="Remote", description="", **extra):
+    return dict({"title": title, "company": company, "location": location, "description": description,
+                 "source": "indeed", "posted_date": "Today"}, **extra)
+
+
+def titles(jobs):
+    return [job["title"] for job in jobs]
+
+
+def test_full_matches_rank_before_partial_ones(index):
+    index.upsert([job("Backend Engineer"), job("Rust Engineer", company="Ferrous"),
+                  job("Rust Developer", company="Oxide")])
+    assert titles(index.search("rust engineer", limit=1)) == ["Rust Engineer"]
+    results = titles(index.search("rust engineer", limit=5))
+    assert results[0] == "Rust Engineer"
+    assert sorted(results[1:]) == ["Backend Engineer", "Rust Developer"]
+
+
+def test_partial_matches_alone_are_a_miss(index):
+    index.upsert([job("Backend Engineer"), job("Python Developer")])
+    assert index.search("rust engineer") == []
+    assert titles(index.search("engineer")) == ["Backend Engineer"]
+
+
+def test_location_filter_and_symbol_terms(index):
+    index.upsert([job("C++ Engineer", location="Austin, TX"), job("C++ Engineer", company="Globex",
+                                                                   location="Seattle, WA")])
+    assert [j["company"] for j in index.search("c++ engineer", "Seattle")] == ["Globex"]
+
+
+def test_upsert_counts_new_jobs_and_keeps_first_seen(index, clock):
+    assert index.upsert([job("Rust Engineer")]) == 1
+    first_seen = index.search("rust")[0]["first_seen"]
+    clock.advance(60)
+    assert index.upsert([job("Rust Engineer"), job("Go Engineer")]) == 1
+    assert index.search("rust")[0]["first_seen"] == first_seen
+
+
+def test_queries_go_stale_after_refresh_after(index, clock):
+    assert index.is_stale("rust engineer", "Remote")
+    index.mark_refreshed("Engineer  Rust", "remote", 3)
+    assert not index.is_stale("rust engineer", "Remote")
+    clock.advance(3601)
+    assert index.is_stale("rust engineer", "Remote")
+
+
+def test_popular_queries_come_from_recorded_searches(index):
+    for _ in range(3):
+        index.record_search("rust engineer")
+    index.record_search("python")
+    popular = index.popular_queries()
+    assert [(q["keywords"], q["hits"]) for q in popular] == [("rust engineer", 3), ("python", 1)]
+    assert popular[0]["refreshed_at"] is None
+
+
+def test_default_path_expands_user(monkeypatch):
+    monkeypatch.setenv("JOB_INDEX_PATH", "~/resumate-test/jobs.sqlite3")
+    path = job_index.default_index_path()
+    assert not path.startswith("~")
+    assert path.endswith("resumate-test/jobs.sqlite3")
@@ -0,0 +1,134 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from job_scraper import JobScraper
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    monkeypatch.setenv("SCRAPER_CACHE_DISABLED", "1")
+    scraper = JobScraper()
+    yield scraper
+    for executor in scraper._executors.values():
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def make_job(source, i):
+    return {"title": f"{source} engineer {i}", "company": f"{source} co {i}", "location": "Remote",
+            "description": f"{source} role number {i} building things", "posted_at": time.time() - i}
+
+
+def fake_sources(delays):
+    """iter_jobs stand-in: each source sleeps for its delay, then yields two jobs."""
+    def iter_jobs(source, keywords, location="", max_pages=None, fallback_limit=20, stats=None, limit=None, fallback=True):
+        time.sleep(delays[source])
+        yield from (make_job(source, i) for i in range(2))
+    return iter_jobs
+
+
+def test_each_source_gets_its_own_deadline_from_when_it_starts(scraper):
+    # One worker: the sources run back to back, so a shared deadline would cut off the later ones.
+    scraper._executors["source"] = ThreadPoolExecutor(max_workers=1)
+    scraper.iter_jobs = fake_sources({"indeed": 0.2, "glassdoor": 0.2, "linkedin": 5})
+    started = time.monotonic()
+    result = scraper.aggregate_job_search("python", limit=10, source_timeout=0.35, overall_timeout=3,
+                                          sources=["indeed", "glassdoor", "linkedin"])
+    sources = result.metadata["sources"]
+    assert sources["indeed"]["status"] == "ok"
+    assert sources["glassdoor"]["status"] == "ok"
+    assert sources["linkedin"]["status"] == "timeout"
+    assert not result.metadata["deadline_hit"]
+    assert len(result) == 4
+    assert time.monotonic() - started < 1.5
+
+
+def test_overall_timeout_bounds_the_search(scraper):
+    scraper.iter_jobs = fake_sources({"indeed": 0.05, "glassdoor": 5, "linkedin": 5})
+    started = time.monotonic()
+    result = scraper.aggregate_job_search("python", limit=10, source_timeout=10, overall_timeout=0.3)
+    assert result.metadata["deadline_hit"]
+    assert result.metadata["sources"]["indeed"]["status"] == "ok"
+    assert len(result) == 2
+    assert time.monotonic() - started < 1
+
+
+def paged_source(scraper, jobs_per_page):
+    """Stub out fetching and parsing so each page yields jobs_per_page jobs; returns the fetched pages."""
+    fetched = []
+
+    def fetch_page(source, keywords, location, page):
+        fetched.append(page)
+        return b"", time.time()
+
+    scraper._fetch_page = fetch_page
+    scraper._parse_page = lambda source, html, keywords, location, fetched_at: [
+        make_job(source, i) for i in range(jobs_per_page)
+    ]
+    return fetched
+
+
+def test_limit_within_one_page_fetches_only_that_page(scraper):
+    fetched = paged_source(scraper, scraper.PAGE_SIZE)
+    jobs = list(scraper.iter_jobs("indeed", "python", limit=20))
+    scraper._get_executor("prefetch").shutdown(wait=True)
+    assert len(jobs) == 20
+    assert fetched == [0]
+
+
+def test_short_pages_fetch_until_the_limit_is_met(scraper):
+    fetched = paged_source(scraper, 10)
+    jobs = list(scraper.iter_jobs("indeed", "python", limit=25))
+    scraper._get_executor("prefetch").shutdown(wait=True)
+    assert len(jobs) == 25
+    assert fetched == [0, 1, 2]
+
+
+def test_without_fallback_an_unreachable_board_yields_nothing(scraper):
+    scraper._fetch_page = lambda source, keywords, location, page: None
+    assert list(scraper.iter_jobs("indeed", "python", limit=5, fallback=False)) == []
+    assert list(scraper.iter_jobs("linkedin", "python", limit=5, fallback=False)) == []
+    assert len(list(scraper.iter_jobs("indeed", "python", limit=5))) == 5
+
+
+def glassdoor_card(age_html=""):
+    from bs4 import BeautifulSoup
+    html = (f'<li class="react-job-listing"><a class="jobTitle" href="/job/1">Python Engineer</a>'
+            f'<span class="employerName">Acme</span>{age_html}</li>')
+    return BeautifulSoup(html, "html.parser").li
+
+
+def test_glassdoor_age_comes_from_the_card(scraper):
+    job = scraper._parse_glassdoor_job(glassdoor_card('<div data-test="job-age">3d</div>'), "python", "", 0)
+    assert job["posted_date"] == "3 days ago"
+    hours = scraper._parse_glassdoor_job(glassdoor_card('<div data-test="job-age">5h</div>'), "python", "", 0)
+    assert hours["posted_date"] == "Today"
+
+
+def test_glassdoor_card_without_an_age_is_not_given_one(scraper):
+    first = scraper._parse_glassdoor_job(glassdoor_card(), "python", "", 0)
+    second = scraper._parse_glassdoor_job(glassdoor_card(), "python", "", 0)
+    assert first["posted_date"] == second["posted_date"] == "Unknown"
+
+
+def indeed_card(age_html=""):
+    from bs4 import BeautifulSoup
+    html = (f'<div class="job_seen_beacon"><span title="Python Engineer">Python Engineer</span>'
+            f'<span class="companyName">Acme</span>{age_html}</div>')
+    return BeautifulSoup(html, "html.parser").div
+
+
+def test_indeed_age_comes_from_the_card(scraper):
+    job = scraper._parse_indeed_job(indeed_card('<span class="date">Posted 2 days ago</span>'), "python", "",
+                                    1_000_000.0)
+    assert job["posted_date"] == "2 days ago"
+    assert job["posted_at"] == 1_000_000.0 - 2 * 24 * 3600
+
+
+def test_indeed_card_without_an_age_is_not_given_one(scraper):
+    job = scraper._parse_indeed_job(indeed_card(), "python", "", 1_000_000.0)
+    assert job["posted_date"] == "Unknown"
+    assert job["posted_at"] is None
+    assert scraper._parse_posting_date("Employer active") == "Unknown"
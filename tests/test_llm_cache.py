@@ -0,0 +1,93 @@
+import time
+
+import pytest
+
+import llm_cache
+from conftest import FakeClock
+from llm_cache import LLMResponseCache
+
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+def make_cache(tmp_path, **kwargs):
+    return LLMResponseCache(str(tmp_path / "llm.sqlite3"), **kwargs)
+
+
+def test_round_trip_and_miss(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    key = LLMResponseCache.make_key("m", MESSAGES, 100, 0.0)
+    assert cache.get(key) is None
+    cache.set(key, "answer", model="m")
+    assert cache.get(key) == "answer"
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = make_cache(tmp_path, ttl=60)
+    cache.set("k", "v")
+    clock.advance(59)
+    assert cache.get("k") == "v"
+    clock.advance(2)
+    assert cache.get("k") is None
+    assert cache.stats()["expired"] == 1
+
+
+def test_purge_expired(tmp_path, clock):
+    cache = make_cache(tmp_path, ttl=60)
+    cache.set("old", "v")
+    clock.advance(61)
+    cache.set("new", "v")
+    assert cache.purge_expired() == 1
+    assert cache.get("new") == "v"
+
+
+def test_evicts_least_recently_used_past_entry_cap(tmp_path, clock):
+    cache = make_cache(tmp_path, max_entries=3)
+    for key in ("a", "b", "c"):
+        cache.set(key, "v")
+        clock.advance(1)
+    cache.get("a")
+    clock.advance(1)
+    cache.set("d", "v")
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in ("a", "c", "d")] == ["v", "v", "v"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_evicts_oldest_until_under_byte_cap(tmp_path, clock):
+    cache = make_cache(tmp_path, max_bytes=25)
+    for key in ("a", "b", "c"):
+        cache.set(key, "x" * 10)
+        clock.advance(1)
+    assert cache.stats()["entries"] == 2
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] <= 25
+
+
+def test_response_format_is_part_of_the_key():
+    plain = LLMResponseCache.make_key("m", MESSAGES, 100, 0.0)
+    json_mode = LLMResponseCache.make_key("m", MESSAGES, 100, 0.0, {"type": "json_object"})
+    assert plain != json_mode
+    assert plain == LLMResponseCache.make_key("m", MESSAGES, 100, 0.0, None)
+
+
+def test_should_cache_follows_temperature_unless_overridden(tmp_path):
+    cache = make_cache(tmp_path, max_temperature=0.3)
+    assert cache.should_cache(0.2)
+    assert not cache.should_cache(0.7)
+    assert cache.should_cache(0.7, use_cache=True)
+    assert not cache.should_cache(0.0, use_cache=False)
+
+
+def test_default_path_expands_user(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_PATH", "~/resumate-test/llm.sqlite3")
+    path = llm_cache.default_cache_path()
+    assert not path.startswith("~")
+    assert path.endswith("resumate-test/llm.sqlite3")
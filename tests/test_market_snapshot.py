@@ -0,0 +1,79 @@
+import gzip
+import json
+import os
+import time
+
+import pytest
+
+import market_snapshot
+from conftest import FakeClock
+from market_snapshot import SNAPSHOT_FORMAT, MarketSnapshot, default_snapshot_path, write_snapshot
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "snapshot.json.gz")
+
+
+def write_raw(path, payload):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(payload, f)
+
+
+def test_entries_round_trip(path, clock):
+    write_snapshot(path, {"trends:technology": {"growth": "high"}})
+    snapshot = MarketSnapshot(path, max_age=3600)
+    assert snapshot.get("trends:technology") == {"growth": "high"}
+    assert snapshot.get("trends:finance") is None
+    assert snapshot.stats()["hits"] == 1 and snapshot.stats()["misses"] == 1
+    assert snapshot.built_at == clock.now
+
+
+def test_other_format_is_ignored(path, clock):
+    write_raw(path, {"format": SNAPSHOT_FORMAT + 1, "built_at": clock.now, "entries": {"k": 1}})
+    assert MarketSnapshot(path, max_age=3600).get("k") is None
+
+
+def test_file_older_than_max_age_is_ignored(path, clock):
+    write_snapshot(path, {"k": 1})
+    clock.advance(3601)
+    assert MarketSnapshot(path, max_age=3600).get("k") is None
+    assert MarketSnapshot(path, max_age=None).get("k") == 1
+
+
+def test_unreadable_or_missing_file_is_empty(path):
+    assert len(MarketSnapshot(path)) == 0
+    with open(path, "wb") as f:
+        f.write(b"not gzip")
+    assert MarketSnapshot(path).get("k") is None
+
+
+def test_file_is_read_on_first_get(path, clock):
+    snapshot = MarketSnapshot(path, max_age=3600)
+    write_snapshot(path, {"k": 1})
+    assert snapshot._entries is None
+    assert snapshot.get("k") == 1
+
+
+def test_write_replaces_the_file_atomically(path, clock, monkeypatch):
+    write_snapshot(path, {"k": 1})
+    replaced = []
+    real_replace = os.replace
+    monkeypatch.setattr(market_snapshot.os, "replace",
+                        lambda src, dst: (replaced.append((src, dst)), real_replace(src, dst)))
+    write_snapshot(path, {"k": 2})
+    assert replaced == [(f"{path}.tmp", path)]
+    assert not os.path.exists(f"{path}.tmp")
+    assert MarketSnapshot(path, max_age=3600).get("k") == 2
+
+
+def test_snapshot_path_expands_user(monkeypatch):
+    monkeypatch.setenv("MARKET_SNAPSHOT_PATH", "~/snapshot.json.gz")
+    assert default_snapshot_path() == os.path.join(os.path.expanduser("~"), "snapshot.json.gz")
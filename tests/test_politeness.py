@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from conftest import FakeClock
+from politeness import HostPolitenessScheduler, parse_retry_after
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    monkeypatch.setattr(time, "sleep", clock.advance)
+    return clock
+
+
+@pytest.fixture
+def scheduler(clock):
+    return HostPolitenessScheduler(default_interval=1.0, jitter=(0.0, 0.0),
+                                   intervals={"www.indeed.com": 2.0}, max_wait=10.0)
+
+
+def test_requests_to_one_host_are_spaced_by_its_interval(scheduler, clock):
+    start = clock.now
+    times = []
+    for _ in range(3):
+        assert scheduler.acquire("https://www.indeed.com/jobs?q=python")
+        times.append(clock.now - start)
+    assert times == [0.0, 2.0, 4.0]
+    assert scheduler.stats()["www.indeed.com"]["requests"] == 3
+
+
+def test_hosts_do_not_wait_on_each_other(scheduler, clock):
+    scheduler.acquire("https://www.indeed.com/jobs")
+    start = clock.now
+    assert scheduler.acquire("https://www.glassdoor.com/Job")
+    assert clock.now == start
+
+
+def test_slot_beyond_max_wait_is_skipped(scheduler, clock):
+    scheduler.acquire("https://www.indeed.com/jobs")
+    start = clock.now
+    assert not scheduler.acquire("https://www.indeed.com/jobs", max_wait=1.0)
+    assert clock.now == start
+    assert scheduler.stats()["www.indeed.com"]["skipped"] == 1
+
+
+def test_retry_after_pushes_the_next_slot_out(scheduler, clock):
+    scheduler.record_response("https://www.indeed.com/jobs", 429, {"Retry-After": "7"})
+    assert scheduler.stats()["www.indeed.com"]["next_slot_in"] == 7.0
+    start = clock.now
+    assert scheduler.acquire("https://www.indeed.com/jobs")
+    assert clock.now - start == 7.0
+
+
+def test_throttle_without_retry_after_uses_default_backoff(scheduler, clock):
+    scheduler.record_response("https://www.indeed.com/jobs", 503)
+    assert scheduler.stats()["www.indeed.com"]["next_slot_in"] == scheduler.default_backoff
+    assert not scheduler.acquire("https://www.indeed.com/jobs")
+
+
+def test_other_statuses_do_not_back_off(scheduler):
+    scheduler.record_response("https://www.indeed.com/jobs", 500, {"Retry-After": "7"})
+    assert scheduler.stats() == {}
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("-5") == 0.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,22 @@
+from posting_dates import DAY, UNKNOWN_AGE, age_buckets, ensure_posted_at, parse_posted_at
+
+NOW = 1_700_000_000.0
+
+
+def test_relative_labels_resolve_against_the_fetch_time():
+    assert parse_posted_at("3 days ago", NOW) == NOW - 3 * DAY
+    assert parse_posted_at("Yesterday", NOW) == NOW - DAY
+    assert parse_posted_at("Just posted", NOW) == NOW
+    assert parse_posted_at("Unknown", NOW) is None
+
+
+def test_undated_jobs_get_the_fixed_unknown_age():
+    job = {"posted_date": "Unknown"}
+    assert ensure_posted_at(job, NOW) == NOW - UNKNOWN_AGE
+    assert ensure_posted_at(job, NOW + DAY) == NOW - UNKNOWN_AGE
+
+
+def test_age_buckets_count_each_posting_once():
+    ages = [0.5, 2, 2.5, 5, 10, 20, 45]
+    counts = age_buckets((NOW - age * DAY for age in ages), now=NOW)
+    assert counts == {"0-1d": 1, "1-3d": 2, "3-7d": 1, "7-14d": 1, "14-30d": 1, "30d+": 1}
@@ -0,0 +1,103 @@
+import time
+
+import pytest
+
+from conftest import FakeClock
+from rate_limiter import (PRIORITY_BACKGROUND, PRIORITY_DEFAULT, RateLimitScheduler, TokenBucket,
+                          parse_reset_duration)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    return clock
+
+
+@pytest.mark.parametrize("value, seconds", [
+    ("7.66s", 7.66), ("2m59.56s", 179.56), ("1h2m3s", 3723.0), ("250ms", 0.25), ("12", 12.0),
+    (None, None), ("", None), ("soon", None),
+])
+def test_parse_reset_duration(value, seconds):
+    if seconds is None:
+        assert parse_reset_duration(value) is None
+    else:
+        assert parse_reset_duration(value) == pytest.approx(seconds)
+
+
+def test_bucket_refills_continuously_up_to_capacity(clock):
+    bucket = TokenBucket(60, window=60)
+    bucket.level = 0
+    bucket.refill(clock.now + 30)
+    assert bucket.level == pytest.approx(30)
+    bucket.refill(clock.now + 600)
+    assert bucket.level == 60
+
+
+def test_bucket_seconds_until(clock):
+    bucket = TokenBucket(60, window=60)
+    bucket.level = 10
+    assert bucket.seconds_until(5) == 0
+    assert bucket.seconds_until(40) == pytest.approx(30)
+
+
+def test_bucket_sync_takes_server_limits(clock):
+    bucket = TokenBucket(6000)
+    bucket.sync(limit=12000, remaining=3000, reset=30, now=clock.now)
+    assert bucket.capacity == 12000
+    assert bucket.level == 3000
+    assert bucket.rate == pytest.approx(300)
+
+
+def test_admits_until_requests_run_out_then_sheds(clock):
+    scheduler = RateLimitScheduler(requests_per_minute=2, tokens_per_minute=6000)
+    assert scheduler.acquire(100, max_wait=0)
+    assert scheduler.acquire(100, max_wait=0)
+    assert not scheduler.acquire(100, max_wait=0)
+    stats = scheduler.stats()
+    assert stats["admitted"] == 2 and stats["shed"] == 1
+
+
+def test_background_calls_leave_the_reserve(clock):
+    scheduler = RateLimitScheduler(requests_per_minute=100, tokens_per_minute=1000, background_reserve=0.2)
+    assert scheduler.acquire(700, max_wait=0)
+    assert not scheduler.acquire(200, priority=PRIORITY_BACKGROUND, max_wait=0)
+    assert scheduler.acquire(200, priority=PRIORITY_DEFAULT, max_wait=0)
+
+
+def test_oversized_estimates_are_capped_to_admissible(clock):
+    scheduler = RateLimitScheduler(tokens_per_minute=1000, background_reserve=0.2)
+    assert scheduler.admissible_tokens() == pytest.approx(800)
+    assert scheduler.acquire(5000, max_wait=0)
+
+
+def test_usage_refunds_over_estimate(clock):
+    scheduler = RateLimitScheduler(tokens_per_minute=1000)
+    scheduler.acquire(500, model="m", max_wait=0)
+    scheduler.record_response({}, 200, estimated_tokens=500, used_tokens=100, model="m")
+    assert scheduler.stats()["models"]["m"]["tokens_available"] == pytest.approx(900)
+
+
+def test_429_blocks_only_the_throttled_model(clock):
+    scheduler = RateLimitScheduler()
+    scheduler.record_response({"retry-after": "5"}, 429, model="llama-3.3-70b-versatile")
+    assert scheduler.blocked_for("llama-3.3-70b-versatile") == pytest.approx(5)
+    assert not scheduler.acquire(100, model="llama-3.3-70b-versatile", max_wait=1)
+    assert scheduler.acquire(100, model="llama-3.1-8b-instant", max_wait=0)
+    clock.advance(5.1)
+    assert scheduler.acquire(100, model="llama-3.3-70b-versatile", max_wait=0)
+    assert scheduler.stats()["throttled_429"] == 1
+
+
+def test_headers_update_only_their_model(clock):
+    scheduler = RateLimitScheduler(requests_per_minute=30, tokens_per_minute=6000)
+    scheduler.record_response({
+        "x-ratelimit-limit-tokens": "12000", "x-ratelimit-remaining-tokens": "100",
+        "x-ratelimit-reset-tokens": "30s",
+    }, 200, model="big")
+    scheduler.limits_for("small")
+    models = scheduler.stats()["models"]
+    assert models["big"]["tokens_capacity"] == 12000
+    assert models["big"]["tokens_available"] == pytest.approx(100)
+    assert models["small"]["tokens_capacity"] == 6000
+    assert models["small"]["tokens_available"] == 6000
@@ -0,0 +1,35 @@
+from skill_matcher import PhraseMatcher, SkillMatcher
+
+
+def test_matches_only_whole_words():
+    matcher = SkillMatcher()
+    assert matcher.skills("Worked at Google on JavaScript tooling") == ["JavaScript"]
+    assert matcher.skills("Java and Go services, plus some Golang") == ["Java", "Go"]
+    assert matcher.skills("Built a C++ engine and C# tools") == ["C++", "C#"]
+
+
+def test_longest_phrase_wins():
+    matcher = SkillMatcher()
+    assert matcher.skills("Shipped React Native apps") == ["React Native"]
+    matches = PhraseMatcher({"machine": "m", "machine learning": "ml"}).find("machine learning rocks")
+    assert [(m.skill, m.start, m.end) for m in matches] == [("ml", 0, 16)]
+
+
+def test_aliases_map_to_the_canonical_skill():
+    assert SkillMatcher().skills("k8s, Postgres and ReactJS") == ["Kubernetes", "PostgreSQL", "React"]
+
+
+def test_case_sensitive_words_need_exact_spelling():
+    matcher = SkillMatcher()
+    assert matcher.skills("Rust and Swift") == ["Rust", "Swift"]
+    assert matcher.skills("rust on the pipes, a swift go-to response") == []
+
+
+def test_clearance_is_not_typescript():
+    assert SkillMatcher().skills("Active TS/SCI clearance required, ts experience a plus") == []
+
+
+def test_hosting_platforms_are_their_own_skills():
+    matcher = SkillMatcher()
+    assert matcher.skills("Git workflows on GitHub and GitLab") == ["Git", "GitHub", "GitLab"]
+    assert matcher.category("GitHub") == "tool"
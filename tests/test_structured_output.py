@@ -0,0 +1,71 @@
+import pytest
+
+from structured_output import (IncrementalJSONParser, parse_json, prune_invalid_items, repair_json,
+                               strip_code_fences, validate)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"a": 1, "name": "Jo', {"a": 1}),
+    ('{"name": "Jo', {}),
+    ('{"a": 1, "na', {"a": 1}),
+    ('{"a": 1, "b":', {"a": 1}),
+    ('{"a": "x\\"y', {}),
+    ('{"score": 8', {}),
+    ('{"skills": ["Python", "Ja', {"skills": ["Python"]}),
+    ('{"a": {"b": "c"}, "d": ["e", "f"]', {"a": {"b": "c"}, "d": ["e", "f"]}),
+    ('["a", "b', ["a"]),
+    ('[{"t": "A"}, {"t": "B", "d": "cu', [{"t": "A"}]),
+    ('[{"t": "A"}, {"t": "B"},', [{"t": "A"}, {"t": "B"}]),
+    ('[{"t": "A"}, {"t": "B"}', [{"t": "A"}, {"t": "B"}]),
+    ('["a", "b"', ["a", "b"]),
+    ('[1, 2, 3', [1, 2]),
+])
+def test_repair_drops_whatever_the_truncation_cut_into(text, expected):
+    assert repair_json(text) == expected
+
+
+def test_repair_skips_preamble_and_honours_expected_type():
+    assert repair_json('Sure! {"a": [1, {"b": 2}', expect=list) == [1, {"b": 2}]
+    assert repair_json("no json here") is None
+
+
+def test_repair_fixes_trailing_commas():
+    assert repair_json('{"a": [1, 2,], }') == {"a": [1, 2]}
+
+
+def test_parse_json_statuses():
+    assert parse_json('```json\n{"a": 1}\n```', dict).status == "ok"
+    repaired = parse_json('{"a": 1, "b": "cut', dict)
+    assert (repaired.value, repaired.status, repaired.truncated) == ({"a": 1}, "repaired", True)
+    assert parse_json("", dict).status == "failed"
+    assert parse_json("[1, 2]", dict).status == "failed"
+
+
+def test_incremental_parser_yields_items_as_they_close():
+    parser = IncrementalJSONParser(list)
+    chunks = ['Here: [{"q": "one, ', 'two"}, {"q": "th', 'ree"}', ', "x"]']
+    items = [item for chunk in chunks for item in parser.feed(chunk)]
+    assert items == [{"q": "one, two"}, {"q": "three"}, "x"]
+    assert parser.complete and not parser.truncated
+
+
+def test_incremental_parser_tracks_truncation():
+    parser = IncrementalJSONParser(dict)
+    parser.feed('{"a": [1, 2')
+    assert parser.truncated
+    assert parser.closed_text() == '{"a": [1, 2]}'
+
+
+def test_strip_code_fences():
+    assert strip_code_fences("```json\n[1]\n```") == "[1]"
+    assert strip_code_fences("```\n[1]```") == "[1]"
+
+
+def test_validate_and_prune():
+    schema = {"type": list, "min_items": 1,
+              "items": {"type": dict, "required": ["title"], "properties": {"skills": list}}}
+    jobs = [{"title": "A", "skills": []}, {"skills": "python"}]
+    assert validate(jobs, schema) == ["[1] missing 'title'", "[1] 'skills' has type str"]
+    assert prune_invalid_items(jobs, schema) == [{"title": "A", "skills": []}]
+    assert validate([], schema) == ["expected at least 1 items"]
+    assert validate({}, schema) == ["expected list, got dict"]